@@ -1,29 +1,66 @@
 """ autofile: filesystem schema and interface
+
+The submodules are imported when they are first used (PEP 562), so that
+`import autofile` stays quick.
 """
 
-from autofile import io_
-from autofile import json_
-from autofile import model
-from autofile import info
-from autofile import data_types
-from autofile import schema
-from autofile import fs
+import importlib
 from autofile._conv import directory_to_dictionary
+from autofile._conv import iterate_directory
+from autofile._conv import directory_to_tar
+from autofile._conv import directory_to_jsonl
 from autofile._safemode import turn_off_safemode
 from autofile._safemode import turn_on_safemode
 from autofile._safemode import safemode_is_on
 
 
+_SUBMODULES = (
+    'io_',
+    'json_',
+    'sqlite_',
+    'stats',
+    'cache',
+    'trajectory',
+    'harvest',
+    'pack',
+    'aio',
+    'model',
+    'info',
+    'data_types',
+    'schema',
+    'fs',
+)
+
 __all__ = [
     'io_',
     'json_',
+    'sqlite_',
+    'stats',
+    'cache',
+    'trajectory',
+    'harvest',
+    'pack',
+    'aio',
     'model',
     'info',
     'data_types',
     'schema',
     'fs',
     'directory_to_dictionary',
+    'iterate_directory',
+    'directory_to_tar',
+    'directory_to_jsonl',
     'turn_off_safemode',
     'turn_on_safemode',
     'safemode_is_on'
 ]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'autofile.{name}')
+    raise AttributeError(f"module 'autofile' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(__all__)
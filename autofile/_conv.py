@@ -1,33 +1,179 @@
 """ Converts the file structure in a given directory to a Python dictionary
 """
 
-from pathlib import Path
+import io
+import os
+import json
+import base64
+import fnmatch
+import tarfile
+import collections
+import concurrent.futures
 
 
-def directory_to_dictionary(dir_path):
+def directory_to_dictionary(dir_path, include=(), exclude=(), max_size=None,
+                            workers=None):
     """ Build dictionary that maps the branching structure of a Linux
         filesystem into a set of a subdictionaries.
 
+        (see `iterate_directory()` for the options)
+
         :param dir_path: root directory path with all files and directories
         :type dir_path: str
         :rtype: dict[str: dict)
     """
 
     _dic = {}
-    for path in Path(dir_path).glob('*'):
-        fullpath = path.absolute().resolve()
-        if path.is_file():
-            with open(fullpath, mode='r', encoding='utf-8') as fobj:
-                tmp = fobj.read()
-            _dic2 = {
-                'type': 'file',
-                'content': tmp
-            }
-        elif path.is_dir():
-            _dic2 = {
-                'type': 'directory',
-                'content': directory_to_dictionary(fullpath)
-            }
-        _dic[path.name] = _dic2
+    for rel_path, type_, content in iterate_directory(
+            dir_path, include=include, exclude=exclude, max_size=max_size,
+            workers=workers):
+        *dir_names, name = rel_path.split('/')
+        _dic2 = _dic
+        for dir_name in dir_names:
+            _dic2 = _dic2[dir_name]['content']
+        _dic2[name] = {
+            'type': type_,
+            'content': {} if type_ == 'directory' else content
+        }
 
     return _dic
+
+
+def iterate_directory(dir_path, include=(), exclude=(), max_size=None,
+                      workers=None):
+    """ Iterate over the files and directories below a directory, as
+        (relative path, type, content) records.
+
+        Directories come before their contents, with None for content.
+        Files that decode as utf-8 have type 'file' and their text as content
+        (with newlines translated, as in a text-mode read), and other files
+        have type 'binary' and their bytes. Paths are relative
+        to `dir_path`, with '/' separators, and are sorted by name at each
+        level. Only the files waiting to be yielded are held in memory.
+
+        :param dir_path: root directory path with all files and directories
+        :type dir_path: str
+        :param include: glob patterns, matched against the relative path, of
+            the files to include (all of them, if empty)
+        :type include: tuple[str]
+        :param exclude: glob patterns, matched against the relative path, of
+            the files and directories to leave out
+        :type exclude: tuple[str]
+        :param max_size: files larger than this many bytes are yielded with
+            None for content
+        :type max_size: int
+        :param workers: if set, the files are read on a pool of this many
+            threads (the records are yielded in the same order either way)
+        :type workers: int
+        :rtype: iterator[tuple(str, str, object)]
+    """
+    entries = _iterate_entries(dir_path, '', include, exclude, max_size)
+
+    if workers is None:
+        for rel_path, type_, read_path in entries:
+            yield _record(rel_path, type_, read_path)
+        return
+
+    # Keep a bounded number of reads in flight, so that the records stream
+    # out in order without the whole tree being read ahead
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = collections.deque()
+        for rel_path, type_, read_path in entries:
+            pending.append(pool.submit(_record, rel_path, type_, read_path))
+            if len(pending) >= 4 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def directory_to_tar(dir_path, tar_path, mode='w', **kwargs):
+    """ Write the files and directories below a directory to a tar archive,
+        one record at a time.
+
+        (the keyword arguments are passed to `iterate_directory()`, and files
+        over the size limit are left out)
+
+        :param dir_path: root directory path with all files and directories
+        :type dir_path: str
+        :param tar_path: path of the tar archive
+        :type tar_path: str
+        :param mode: the `tarfile.open()` mode, such as 'w:gz' to compress it
+        :type mode: str
+    """
+    with tarfile.open(tar_path, mode=mode) as tar_obj:
+        for rel_path, type_, content in iterate_directory(dir_path, **kwargs):
+            info = tarfile.TarInfo(rel_path)
+            if type_ == 'directory':
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                tar_obj.addfile(info)
+            elif content is not None:
+                data = (content.encode('utf-8') if isinstance(content, str)
+                        else content)
+                info.size = len(data)
+                info.mode = 0o644
+                tar_obj.addfile(info, io.BytesIO(data))
+
+
+def directory_to_jsonl(dir_path, jsonl_path, **kwargs):
+    """ Write the files and directories below a directory to a JSON lines
+        file, one record at a time.
+
+        Each line holds the 'path', 'type', and 'content' of a record, with the
+        content of binary files base64-encoded. (the keyword arguments are
+        passed to `iterate_directory()`)
+
+        :param dir_path: root directory path with all files and directories
+        :type dir_path: str
+        :param jsonl_path: path of the JSON lines file
+        :type jsonl_path: str
+    """
+    with open(jsonl_path, mode='w', encoding='utf-8') as fobj:
+        for rel_path, type_, content in iterate_directory(dir_path, **kwargs):
+            if type_ == 'binary' and content is not None:
+                content = base64.b64encode(content).decode('ascii')
+            fobj.write(json.dumps(
+                {'path': rel_path, 'type': type_, 'content': content}))
+            fobj.write('\n')
+
+
+def _iterate_entries(dir_path, rel_dir, include, exclude, max_size):
+    """ (relative path, type, path to read) for each entry below a directory
+
+    (the path to read is None for directories and files over the size limit)
+    """
+    with os.scandir(dir_path) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+
+    for entry in entries:
+        rel_path = rel_dir + entry.name
+        if any(fnmatch.fnmatch(rel_path, pat) for pat in exclude):
+            continue
+
+        if entry.is_dir():
+            yield (rel_path, 'directory', None)
+            yield from _iterate_entries(
+                entry.path, rel_path + '/', include, exclude, max_size)
+        elif entry.is_file():
+            if include and not any(fnmatch.fnmatch(rel_path, pat)
+                                   for pat in include):
+                continue
+            too_big = max_size is not None and entry.stat().st_size > max_size
+            yield (rel_path, 'file', None if too_big else entry.path)
+
+
+def _record(rel_path, type_, read_path):
+    """ read in the content of an entry
+    """
+    content = None
+    if read_path is not None:
+        with open(read_path, mode='rb') as fobj:
+            content = fobj.read()
+        try:
+            content = content.decode('utf-8')
+        except UnicodeDecodeError:
+            type_ = 'binary'
+        else:
+            # universal newlines, as in a text-mode read
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return (rel_path, type_, content)
@@ -0,0 +1,30 @@
+""" lazily imported modules
+
+The chemistry packages (and yaml and numpy) take a while to import, and
+most of what autofile does never touches them. Modules that use them bind
+a `LazyModule` in their place, which imports the real module the first
+time one of its attributes is used.
+"""
+import importlib
+
+
+class LazyModule():
+    """ stands in for a module until one of its attributes is used
+
+    :param name: the full name of the module, such as 'autoparse.find'
+    :type name: str
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        # Only called for attributes the instance doesn't have, which is
+        # everything but the two above
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        return f"LazyModule('{self._name}')"
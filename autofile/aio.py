@@ -0,0 +1,197 @@
+""" asyncio counterparts of the file operations
+
+File access blocks, so each coroutine runs its blocking counterpart on
+`ASYNC_EXECUTOR`, a thread pool shared by the whole process, and waits for it
+without holding up the event loop. A concurrency limit bounds how many of
+them are in flight at once, so that gathering hundreds of reads overlaps
+them without flooding the pool:
+
+    autofile.aio.ASYNC_EXECUTOR.configure(max_workers=64)
+    enes = await asyncio.gather(*(
+        sp_fs[-1].file.energy.aread(locs) for locs in locs_lst))
+
+`DataFile`, `DataSeriesFile`, and `JSONEntry` get `aread()`, `awrite()`, and
+`aexists()`, which take the same arguments as `read()`, `write()`, and
+`exists()`. `DataSeries.aexisting()` and `fs.aiterate_locators()` are async
+generators of locators.
+"""
+import weakref
+import functools
+import threading
+import concurrent.futures
+from autofile._lazy import LazyModule
+
+# Only scripts that use the coroutines pay for importing asyncio
+asyncio = LazyModule('asyncio')
+
+# The default of arguments that are left as they are unless given
+_UNCHANGED = object()
+
+
+class AsyncExecutor():
+    """ runs blocking calls for coroutines, with a concurrency limit
+
+    The thread pool is started on first use. Each event loop gets its own
+    limit, so that the executor can be shared by several of them.
+
+    :param max_workers: the number of threads
+    :type max_workers: int
+    :param limit: the most calls in flight on each event loop (defaults to
+        the number of threads)
+    :type limit: int
+    """
+
+    def __init__(self, max_workers=32, limit=None):
+        self.max_workers = max_workers
+        self.limit = limit
+        self._executor = None
+        self._own_executor = True
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def configure(self, max_workers=None, limit=_UNCHANGED, executor=None):
+        """ change the thread pool or the concurrency limit
+
+        (the old pool, if it was started here, is shut down once its calls
+        have finished, and the settings that aren't given are kept)
+
+        :param max_workers: the number of threads
+        :type max_workers: int
+        :param limit: the most calls in flight on each event loop (None sets
+            it back to the number of threads)
+        :type limit: int
+        :param executor: an executor to use instead of a pool of our own
+        :type executor: concurrent.futures.Executor
+        """
+        assert limit in (None, _UNCHANGED) or limit > 0, (
+            f'Need a limit above 0: {limit}')
+        with self._lock:
+            self._release()
+            if max_workers is not None:
+                self.max_workers = max_workers
+            if limit is not _UNCHANGED:
+                self.limit = limit
+            self._executor = executor
+            self._own_executor = executor is None
+            self._semaphores = weakref.WeakKeyDictionary()
+
+    def shutdown(self):
+        """ shut down the thread pool, if it was started here
+
+        (a new one is started on the next call)
+        """
+        with self._lock:
+            self._release()
+            self._executor = None
+            self._own_executor = True
+
+    async def run(self, func, *args, **kwargs):
+        """ call a function on the executor, and wait for its result
+
+        :param func: the blocking function
+        :type func: callable
+        """
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(loop):
+            return await loop.run_in_executor(
+                self._pool(), functools.partial(func, *args, **kwargs))
+
+    async def iterate(self, iterable, chunk_size=64):
+        """ iterate over a blocking iterable, advancing it on the executor
+
+        :param iterable: the blocking iterable
+        :type iterable: iterable
+        :param chunk_size: the number of items taken from it per call
+        :type chunk_size: int
+        """
+        iterator = iter(iterable)
+        while True:
+            chunk = await self.run(_take, iterator, chunk_size)
+            for item in chunk:
+                yield item
+            if len(chunk) < chunk_size:
+                break
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='autofile-aio')
+                self._own_executor = True
+            return self._executor
+
+    def _semaphore(self, loop):
+        with self._lock:
+            sem = self._semaphores.get(loop)
+            if sem is None:
+                sem = asyncio.Semaphore(
+                    self.max_workers if self.limit is None else self.limit)
+                self._semaphores[loop] = sem
+            return sem
+
+    def _release(self):
+        if self._executor is not None and self._own_executor:
+            self._executor.shutdown(wait=False)
+
+    def __repr__(self):
+        return (f"AsyncExecutor(max_workers={self.max_workers}, "
+                f"limit={self.limit})")
+
+
+ASYNC_EXECUTOR = AsyncExecutor()
+
+
+class AsyncFileMixin():
+    """ coroutine counterparts of `read()`, `write()`, and `exists()`
+    """
+
+    async def aread(self, *args, **kwargs):
+        """ `read()`, on `ASYNC_EXECUTOR`
+        """
+        return await ASYNC_EXECUTOR.run(self.read, *args, **kwargs)
+
+    async def awrite(self, *args, **kwargs):
+        """ `write()`, on `ASYNC_EXECUTOR`
+        """
+        return await ASYNC_EXECUTOR.run(self.write, *args, **kwargs)
+
+    async def aexists(self, *args, **kwargs):
+        """ `exists()`, on `ASYNC_EXECUTOR`
+        """
+        return await ASYNC_EXECUTOR.run(self.exists, *args, **kwargs)
+
+
+class AsyncSeriesMixin():
+    """ an async generator counterpart of `existing()`
+    """
+
+    async def aexisting(self, root_locs=(), relative=False):
+        """ `existing()`, as an async generator run on `ASYNC_EXECUTOR`
+
+        (the locators are yielded root by root, as they are read)
+        """
+        async for locs in ASYNC_EXECUTOR.iterate(
+                _iterate_existing(self, root_locs, relative)):
+            yield locs
+
+
+def _iterate_existing(dseries, root_locs, relative):
+    """ the existing locators of a data series, listed one root at a time
+    """
+    if dseries.nlocs > 0 and len(root_locs) < dseries.root_locator_count():
+        for root_locs_ in dseries.root.existing(root_locs):
+            yield from _iterate_existing(dseries, root_locs_, False)
+    else:
+        yield from dseries.existing(root_locs, relative=relative)
+
+
+def _take(iterator, count):
+    """ the next few items of an iterator
+    """
+    chunk = []
+    for item in iterator:
+        chunk.append(item)
+        if len(chunk) == count:
+            break
+    return chunk
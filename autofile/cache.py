@@ -0,0 +1,155 @@
+""" an in-process cache of the values read from data files
+
+`READ_CACHE` is off until it is turned on with `READ_CACHE.enable()`, and
+is used by `autofile.model.DataFile.read()`.
+"""
+import os
+import copy
+import weakref
+import threading
+import collections
+from autofile.stats import IO_STATS
+
+
+class ReadCache():
+    """ least-recently-used cache of values read from data files
+
+    Entries are keyed by absolute file path and hold the parsed value for
+    each reader of the file, along with the file's `(st_mtime_ns, st_size,
+    st_ino)` at the time it was read. A hit requires the file to be
+    unchanged, so writes from other processes are picked up on the next read.
+    Writes and removals through a `DataFile` drop the entry directly.
+
+    Values that can be modified (arrays, lists, dicts, information objects)
+    are deep-copied on the way out, so that callers can't modify the cached
+    ones. Numbers, strings, and tuples of them are handed out as they are.
+
+    :param max_entries: the most values to hold (0 turns the cache off)
+    :type max_entries: int
+    :param max_bytes: the most bytes to hold, measured by the size of the files
+        the values were read from
+    :type max_bytes: int
+    """
+
+    def __init__(self, max_entries=0, max_bytes=256 * 1024 ** 2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def enable(self, max_entries=4096, max_bytes=256 * 1024 ** 2):
+        """ turn the cache on, with these bounds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def disable(self):
+        """ turn the cache off and drop its contents
+        """
+        self.max_entries = 0
+        self.clear()
+
+    def is_enabled(self):
+        """ is the cache on?
+        """
+        return self.max_entries > 0
+
+    def read(self, pth, read_, reader):
+        """ read a value through the cache
+
+        :param pth: the file path
+        :type pth: str
+        :param read_: reads the value from the file path, on a miss
+        :type read_: callable[str->object]
+        :param reader: the object doing the read, such as the `DataFile`
+            (values read by different readers are cached separately)
+        :type reader: object
+        """
+        pth = os.path.abspath(pth)
+        stat = _stat(pth)
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        # the reader is held weakly, so that an entry can't be picked up by
+        # a new reader that reuses the address of one that is gone
+        reader = weakref.ref(reader)
+
+        with self._lock:
+            entry = self._entries.get(pth)
+            if (entry is not None and entry[0] == key
+                    and reader in entry[1]):
+                self._entries.move_to_end(pth)
+                self.hits += 1
+                val, frozen = entry[1][reader]
+                return val if frozen else copy.deepcopy(val)
+            self.misses += 1
+
+        val = read_(pth)
+
+        if stat.st_size <= self.max_bytes:
+            frozen = _is_frozen(val)
+            with self._lock:
+                entry = self._entries.get(pth)
+                if entry is None or entry[0] != key:
+                    self._pop(pth)
+                    entry = (key, {})
+                    self._entries[pth] = entry
+                    self.nbytes += stat.st_size
+                entry[1][reader] = (val if frozen else copy.deepcopy(val),
+                                    frozen)
+                self._entries.move_to_end(pth)
+                self._evict()
+
+        return val
+
+    def invalidate(self, pth):
+        """ drop the cached value for a file path
+        """
+        with self._lock:
+            self._pop(os.path.abspath(pth))
+
+    def clear(self):
+        """ drop all of the cached values and reset the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _pop(self, pth):
+        entry = self._entries.pop(pth, None)
+        if entry is not None:
+            self.nbytes -= entry[0][1]
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self.nbytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self.nbytes -= entry[0][1]
+
+    def __repr__(self):
+        return (f"ReadCache(entries={len(self._entries)}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+READ_CACHE = ReadCache()
+
+
+def _is_frozen(val):
+    """ can this value be handed out without a copy?
+
+    (numbers, strings, and tuples of them can't be modified)
+    """
+    if isinstance(val, (int, float, complex, str, bytes, type(None))):
+        return True
+    if isinstance(val, tuple):
+        return all(map(_is_frozen, val))
+    return False
+
+
+def _stat(pth):
+    IO_STATS.count(nstats=1)
+    return os.stat(pth)
@@ -47,6 +47,10 @@ class Extension():
     VRC_POT = '.pot'
     VRC_FLUX = '.flux'
     JSON = '.json'
+    # Binary copies of array files
+    ARRAY = '.npy'
+    # Frame offsets of trajectory files
+    FRAME_INDEX = '.idx'
 
 
 def information(file_name):
@@ -473,6 +477,28 @@ def vrctst_flux(file_name):
     return _add_extension(file_name, Extension.VRC_FLUX)
 
 
+def array(file_name):
+    """ adds binary array extension, if missing
+
+    :param file_name: name of file
+    :type file_name: str
+    :returns: file with extension added
+    :rtype: str
+    """
+    return _add_extension(file_name, Extension.ARRAY)
+
+
+def frame_index(file_name):
+    """ adds trajectory frame index extension, if missing
+
+    :param file_name: name of file
+    :type file_name: str
+    :returns: file with extension added
+    :rtype: str
+    """
+    return _add_extension(file_name, Extension.FRAME_INDEX)
+
+
 def _add_extension(file_name, ext):
     if not str(file_name).endswith(ext):
         file_name = f'{file_name}{ext}'
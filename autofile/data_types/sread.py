@@ -6,12 +6,14 @@
 import os
 from io import StringIO as _StringIO
 from numbers import Real as _Real
-import numpy
-import yaml
-import automol
-import autoparse.find as apf
-from phydat import phycon
 import autofile.info
+from autofile._lazy import LazyModule
+
+numpy = LazyModule('numpy')
+yaml = LazyModule('yaml')
+automol = LazyModule('automol')
+apf = LazyModule('autoparse.find')
+phycon = LazyModule('phydat.phycon')
 
 
 def information(inf_str):
@@ -26,6 +28,21 @@ def information(inf_str):
     return inf_obj
 
 
+def information_dict(inf_str):
+    """ read information (any dict/list combination) from a string, as a
+        dictionary
+
+    (faster than `information()`, for callers that only want the values)
+
+    :param inf_str: info yaml information
+    :type inf_str: str
+    :return: info dictionary
+    :rtype: dict
+    """
+    inf_dct = autofile.info.dict_from_string(inf_str)
+    return inf_dct
+
+
 def instability(instab_str):
     """ read information (any dict/list combination) from a string
     :param inf_str: info yaml information
@@ -72,6 +89,19 @@ def trajectory(traj_str):
     return traj
 
 
+def trajectory_frame(frm_str):
+    """ read one frame of a trajectory from a string (angstrom)
+
+    :param frm_str: frame string, in xyz format
+    :type frm_str: str
+    :return: the geometry (bohr) and comment line of the frame
+    :rtype: tuple(tuple, str)
+    """
+    geo = automol.geom.from_xyz_string(frm_str)
+    comment = frm_str.lstrip('\n').split('\n')[1].rstrip('\r')
+    return geo, comment
+
+
 def zmatrix(zma_str):
     """ read a zmatrix (bohr/radian) from a string (angstrom/degree)
 
@@ -96,18 +126,32 @@ def vmatrix(vma_str):
     return vma
 
 
-def gradient(grad_str):
+def gradient(grad_str, array=False):
     """ read a gradient (hartree bohr^-1) from a string (hartree bohr^-1)
 
     :param grad_str: gradient string
     :type grad_str: str
+    :param array: return a numpy array, instead of nested tuples?
+    :type array: bool
+    :return: gradient as internally used tuple object
+    :rtype: tuple
+    """
+    grad = _loadtxt(grad_str)
+    return gradient_from_array(grad, array=array)
+
+
+def gradient_from_array(grad, array=False):
+    """ check a gradient (hartree bohr^-1) read in as a numpy array
+
+    :param grad: gradient array
+    :type grad: numpy.ndarray
+    :param array: return the numpy array, instead of nested tuples?
+    :type array: bool
     :return: gradient as internally used tuple object
     :rtype: tuple
     """
-    grad_str_io = _StringIO(grad_str)
-    grad = numpy.loadtxt(grad_str_io)
     assert grad.ndim == 2 and grad.shape[1] == 3
-    return tuple(map(tuple, grad))
+    return grad if array else tuple(map(tuple, grad))
 
 
 def gradient_array(grad_list):
@@ -162,19 +206,33 @@ def torsions(tors_str):
     return automol.data.tors.torsions_from_string(tors_str)
 
 
-def hessian(hess_str):
+def hessian(hess_str, array=False):
     """ read a hessian (hartree bohr^-2) from a string (hartree bohr^-2)
 
     :param hess_str: hessian string
     :type hess_str: str
+    :param array: return a numpy array, instead of nested tuples?
+    :type array: bool
+    :return: hessian as 3nx3n tuple
+    :rtype: tuple
+    """
+    hess = _loadtxt(hess_str)
+    return hessian_from_array(hess, array=array)
+
+
+def hessian_from_array(hess, array=False):
+    """ check a hessian (hartree bohr^-2) read in as a numpy array
+
+    :param hess: hessian array
+    :type hess: numpy.ndarray
+    :param array: return the numpy array, instead of nested tuples?
+    :type array: bool
     :return: hessian as 3nx3n tuple
     :rtype: tuple
     """
-    hess_str_io = _StringIO(hess_str)
-    hess = numpy.loadtxt(hess_str_io)
     assert hess.ndim == 2
     assert hess.shape[0] % 3 == 0 and hess.shape[0] == hess.shape[1]
-    return tuple(map(tuple, hess))
+    return hess if array else tuple(map(tuple, hess))
 
 
 def harmonic_frequencies(freq_str):
@@ -252,8 +310,7 @@ def anharmonicity_matrix(xmat_str):
     :return: anharmonicity xmatrix as nfreqxnfreq tuple
     :rtype: tuple
     """
-    mat_str_io = _StringIO(xmat_str)
-    mat = numpy.loadtxt(mat_str_io)
+    mat = _loadtxt(xmat_str)
     assert mat.ndim in (0, 2)
     if mat.ndim == 2:
         assert mat.shape[0] == mat.shape[1]
@@ -272,8 +329,7 @@ def vibro_rot_alpha_matrix(vibro_rot_str):
     :return: matrix as tuple
     :rtype: tuple
     """
-    mat_str_io = _StringIO(vibro_rot_str)
-    mat = numpy.loadtxt(mat_str_io)
+    mat = _loadtxt(vibro_rot_str)
     ret = ((),)
     assert mat.ndim in (0, 1, 2)
     if mat.ndim == 2:
@@ -360,8 +416,7 @@ def dipole_moment(dip_mom_str):
     :return: x, y, z dipole moment tuple
     :rtype: tuple
     """
-    dip_mom_str_io = _StringIO(dip_mom_str)
-    dip_mom = numpy.loadtxt(dip_mom_str_io)
+    dip_mom = _loadtxt(dip_mom_str)
     assert dip_mom.ndim == 1
     assert dip_mom.shape[0] == 3
     return tuple(dip_mom)
@@ -375,8 +430,7 @@ def polarizability(polar_str):
     :return: polarizability tensor
     :rtype: tuple
     """
-    polar_str_io = _StringIO(polar_str)
-    polar = numpy.loadtxt(polar_str_io)
+    polar = _loadtxt(polar_str)
     assert polar.ndim == 2
     assert polar.shape[0] == polar.shape[1] == 3
     return tuple(map(tuple, polar))
@@ -408,7 +462,17 @@ def _frequencies(freq_str):
     if len(freq_str.split()) == 1:
         freqs = [float(freq) for freq in freq_str.split()]
     else:
-        freq_str_io = _StringIO(freq_str)
-        freqs = numpy.loadtxt(freq_str_io)
+        freqs = _loadtxt(freq_str)
         assert freqs.ndim == 1
     return tuple(freqs)
+
+
+def _loadtxt(txt_str):
+    """ read whitespace-delimited floats from a string, with `numpy.loadtxt()`
+
+    :param txt_str: rows of whitespace-delimited values
+    :type txt_str: str
+    :return: the values, with dimensions of length one removed
+    :rtype: numpy.ndarray
+    """
+    return numpy.loadtxt(_StringIO(txt_str))
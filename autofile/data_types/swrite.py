@@ -6,11 +6,13 @@
 import os
 from io import StringIO as _StringIO
 from numbers import Real as _Real
-import numpy
-import yaml
-import automol
-from phydat import phycon
 import autofile.info
+from autofile._lazy import LazyModule
+
+numpy = LazyModule('numpy')
+yaml = LazyModule('yaml')
+automol = LazyModule('automol')
+phycon = LazyModule('phydat.phycon')
 
 
 def information(inf_obj):
@@ -82,6 +84,17 @@ def trajectory(traj):
     return xyz_traj_str
 
 
+def trajectory_frame(frm):
+    """ write one frame of a trajectory to a string (angstrom)
+
+    :param frm: the geometry (bohr) and comment line of the frame
+    :type frm: tuple(tuple, str)
+    :return: frame string, in xyz format
+    :rtype: str
+    """
+    return trajectory([frm])
+
+
 def zmatrix(zma):
     """ write a zmatrix (bohr/radian) to a string (angstroms/degree)
 
@@ -44,6 +44,9 @@ objects for interacting with successive layers in a file system.
 """
 import os
 import pathlib
+import collections
+import concurrent.futures
+from autofile.aio import ASYNC_EXECUTOR
 from autofile.schema import data_files
 from autofile.schema import data_series
 from autofile.schema import info_objects
@@ -1078,8 +1081,12 @@ FILE_SYSTEM_MANAGER_DCT = {
 }
 
 
-def path(pfx, key_locs_lst):
+def path(pfx, key_locs_lst, create=True):
     """ Get the path through a file system hierarchy
+
+    :param create: create the path, if it doesn't exist? If not, nothing is
+        written, and None is returned for a path that doesn't exist
+    :type create: bool
     """
     pth = pfx
     for key_locs in key_locs_lst:
@@ -1089,17 +1096,24 @@ def path(pfx, key_locs_lst):
         assert key in FILE_SYSTEM_MANAGER_DCT
 
         fs_ = FILE_SYSTEM_MANAGER_DCT[key](pth)
-        fs_[-1].create(locs)  # run create command to filesys fix
+        if create:
+            fs_[-1].create(locs)  # run create command to filesys fix
+        elif not fs_[-1].exists(locs):
+            return None
         pth = os.path.join(pth, fs_[-1].path(locs))
 
     return pth
 
 
-def manager(pfx, key_locs_lst, key):
+def manager(pfx, key_locs_lst, key, create=True):
     """ Get the manager for a specific part of the file system
+
+    :param create: create the path to it, if it doesn't exist? If not,
+        nothing is written, and None is returned for a path that doesn't exist
+    :type create: bool
     """
-    pth = path(pfx, key_locs_lst)
-    fs_ = _manager(pth, key)
+    pth = path(pfx, key_locs_lst, create=create)
+    fs_ = None if pth is None else _manager(pth, key)
     return fs_
 
 
@@ -1110,9 +1124,19 @@ def _manager(pfx, key):
     return fs_
 
 
-def iterate_locators(pfx, keys):
+def iterate_locators(pfx, keys, workers=None):
     """ Iterate over locators for all existing paths
+
+    :param workers: if set, the layers are listed on a pool of this many
+        threads, which overlaps the filesystem access for different branches
+        (the locators are yielded in the same order either way)
+    :type workers: int
     """
+    if workers is not None:
+        yield from (locs_lst for locs_lst, _ in _iterate_layers(
+            pfx, keys, _existing_locators, workers))
+        return
+
     depth = len(keys)
     locs_lst = [None] * depth
 
@@ -1137,30 +1161,112 @@ def iterate_locators(pfx, keys):
     yield from _iterate_locators(pfx, keys)
 
 
-def iterate_paths(pfx, keys):
+async def aiterate_locators(pfx, keys, workers=None):
+    """ Iterate over locators for all existing paths, as an async generator
+
+    (the walk runs on `autofile.aio.ASYNC_EXECUTOR`, see `iterate_locators()`
+    for the options)
+    """
+    async for locs_lst in ASYNC_EXECUTOR.iterate(
+            iterate_locators(pfx, keys, workers=workers)):
+        yield locs_lst
+
+
+def iterate_paths(pfx, keys, workers=None):
     """ Iterate over all existing paths
+
+    (the paths are found by walking the directory tree, without reading and
+    re-mapping the locators at each layer)
+
+    :param workers: if set, the layers are listed on a pool of this many
+        threads, which overlaps the filesystem access for different branches
+        (the paths are yielded in the same order either way)
+    :type workers: int
     """
-    if len(keys) == 1:
+    if workers is not None:
+        yield from (pth for _, pth in _iterate_layers(
+            pfx, keys, _existing_paths, workers))
+    elif len(keys) == 1:
         key, = keys
 
         fs_ = _manager(pfx, key)
-        for locs in fs_[-1].existing():
-            yield fs_[-1].path(locs)
+        yield from fs_[-1].existing_paths()
     else:
         key, keys = keys[0], keys[1:]
         fs_ = _manager(pfx, key)
-        for locs in fs_[-1].existing():
-            pfx_ = fs_[-1].path(locs)
+        for pfx_ in fs_[-1].existing_paths():
             yield from iterate_paths(pfx_, keys)
 
 
-def iterate_managers(pfx, keys, key):
+def iterate_managers(pfx, keys, key, workers=None):
     """ Iterate over managers at a specific level in the file system hierarchy
+
+    (only existing paths are visited, and nothing is written, so this is safe
+    on a read-only file system)
     """
-    for pth in iterate_paths(pfx, keys):
+    for pth in iterate_paths(pfx, keys, workers=workers):
         yield _manager(pth, key)
 
 
+def _existing_locators(pfx, key, last=False):
+    """ (locators, path) pairs for one layer of the file system
+
+    (the paths are not needed for the last layer, so they aren't mapped)
+    """
+    fs_ = _manager(pfx, key)
+    return [(locs, None if last else fs_[-1].path(locs))
+            for locs in fs_[-1].existing()]
+
+
+def _existing_paths(pfx, key, _last=False):
+    """ (locators, path) pairs for one layer of the file system
+
+    (the locators aren't read in, so only the paths are given)
+    """
+    fs_ = _manager(pfx, key)
+    return [(None, pth) for pth in fs_[-1].existing_paths()]
+
+
+def _iterate_layers(pfx, keys, list_, workers):
+    """ Iterate through successive layers of the file system on a thread pool
+
+    Each layer is a pipeline stage that submits the listings for the branches
+    coming out of the layer above it, keeping a bounded number of them in
+    flight, and collects them in the order they were submitted. Only the
+    listings run on the pool, so the stages can share it without waiting on
+    each other.
+
+    :param list_: lists the (value, path) pairs for one layer, given its
+        prefix, its key, and whether or not it is the last one
+    :type list_: callable
+    :param workers: the number of threads
+    :type workers: int
+    :returns: (values, path) pairs, with the value from each layer
+    """
+    assert workers > 0, f'Need at least one worker, not {workers}'
+
+    def _expand(branches, key, last):
+        pending = collections.deque()
+        for vals, pth in branches:
+            pending.append(
+                (vals, executor.submit(list_, pth, key, last)))
+            while len(pending) > 2 * workers:
+                yield from _collect(*pending.popleft())
+        while pending:
+            yield from _collect(*pending.popleft())
+
+    def _collect(vals, future):
+        for val, pth in future.result():
+            yield vals + (val,), pth
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    with executor:
+        branches = (((), pfx),)
+        for num, key in enumerate(keys):
+            branches = _expand(branches, key, last=num == len(keys) - 1)
+        yield from branches
+
+
 # Extra path manipulations
 def path_prefix(pth, keys):
     """ Given a path and some layer keys, find the prefix
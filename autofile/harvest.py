@@ -0,0 +1,362 @@
+""" columnar harvests of the files in a data series
+
+`DataSeries.harvest()` reads the same files from every directory of a data
+series and gathers each into a numpy array, with one row per locator:
+
+    cnf_fs = autofile.fs.conformer(prefix)
+    hvst = cnf_fs[-1].harvest(['geometry', 'harmonic_frequencies'],
+                              workers=8, cache_path='conformers.npz')
+    xyzs = hvst['geometry']                # (nconfs, natoms, 3)
+    freqs = hvst['harmonic_frequencies']   # (nconfs, nfreqs)
+
+Values that live elsewhere, such as conformer energies in the single-point
+layer below each conformer, can be read with a `FileReader` of the file and
+its directory for each row:
+
+    def sp_path(locs):
+        sp_fs = autofile.fs.single_point(cnf_fs[-1].path(locs))
+        return sp_fs[-1].path(thy_locs)
+
+    ene_rdr = autofile.harvest.FileReader(
+        autofile.schema.data_files.energy('sp'), sp_path)
+    hvst = cnf_fs[-1].harvest([], readers={'energy': ene_rdr},
+                              cache_path='conformers.npz')
+
+These are stamped and checked against the cache like the other files. Plain
+reader functions of the locators can be used too, but then the cache is
+neither read nor written, since there is no telling when they change.
+"""
+import os
+import json
+import numbers
+import concurrent.futures
+import autofile.io_
+import autofile.pack
+import autofile.data_types.name
+from autofile.stats import IO_STATS
+from autofile._lazy import LazyModule
+
+numpy = LazyModule('numpy')
+
+STAMP_PREFIX = 'stamps.'
+
+
+class Harvest():
+    """ the values read from a data series, by column
+
+    Each column is a numpy array whose first axis runs over the locators.
+    Numbers make a float64 vector, geometries of the same length make a
+    float64 coordinate array of shape (nlocs, natoms, 3) along with a
+    '<name>_symbols' column, and other values of the same shape are stacked
+    into a float64 array. Missing values are NaN (and '' for symbols).
+    Anything else makes an object array, which can't be saved.
+
+    :param locs_lst: the locators of the rows
+    :type locs_lst: list[list]
+    :param columns: the columns, by name
+    :type columns: dict[str: numpy.ndarray]
+    :param stamps: the modification time and size of the files that went
+        into each column, by row (see `file_stamps()`)
+    :type stamps: dict[str: numpy.ndarray]
+    """
+
+    def __init__(self, locs_lst, columns, stamps=None):
+        self.locs_lst = [list(locs) for locs in locs_lst]
+        self.columns = dict(columns)
+        self.stamps = {} if stamps is None else dict(stamps)
+        for name, col in self.columns.items():
+            assert len(col) == len(self.locs_lst), (
+                f"Column {name} has {len(col)} rows for "
+                f"{len(self.locs_lst)} locators")
+
+    @classmethod
+    def from_values(cls, locs_lst, val_dct, stamps=None):
+        """ build a harvest from the value of each column for each locator
+
+        :param locs_lst: the locators of the rows
+        :type locs_lst: list[list]
+        :param val_dct: the values of each column, with None where missing
+        :type val_dct: dict[str: list]
+        :param stamps: the stamps of the files that went into each column
+        :type stamps: dict[str: numpy.ndarray]
+        :rtype: Harvest
+        """
+        columns = {}
+        for name, vals in val_dct.items():
+            columns.update(_columns(name, vals))
+        return cls(locs_lst, columns, stamps=stamps)
+
+    @classmethod
+    def load(cls, file_path):
+        """ load a harvest saved with `save()`
+
+        :param file_path: path of the .npz file
+        :type file_path: str
+        :rtype: Harvest
+        """
+        arrays = autofile.io_.read_arrays(file_path)
+        locs_lst = [json.loads(locs_str) for locs_str in arrays.pop('locs')]
+        stamps = {name[len(STAMP_PREFIX):]: arrays.pop(name)
+                  for name in list(arrays) if _is_stamp_name(name)}
+        return cls(locs_lst, arrays, stamps=stamps)
+
+    def save(self, file_path):
+        """ save to an uncompressed .npz file, with the locators as json
+
+        (the file stamps are saved under names that start with
+        `STAMP_PREFIX`)
+
+        :param file_path: path of the .npz file
+        :type file_path: str
+        """
+        for name, col in self.columns.items():
+            if col.dtype == object:
+                raise ValueError(f"Column {name} holds values that can't be "
+                                 "stacked into an array, so it can't be saved")
+        assert 'locs' not in self.columns, "'locs' is a reserved column name"
+        assert not any(map(_is_stamp_name, self.columns)), (
+            f"Column names starting with '{STAMP_PREFIX}' are reserved")
+
+        arrays = dict(self.columns)
+        arrays['locs'] = numpy.array(self.locator_strings(), dtype=str)
+        arrays.update({STAMP_PREFIX + name: stamp
+                       for name, stamp in self.stamps.items()})
+        autofile.io_.write_arrays(file_path, arrays)
+
+    def locator_strings(self):
+        """ the locators, as json strings
+
+        :rtype: list[str]
+        """
+        return [json.dumps(locs) for locs in self.locs_lst]
+
+    def locator_array(self):
+        """ the locators as a numpy array of strings, one row each
+
+        :rtype: numpy.ndarray
+        """
+        return numpy.array(
+            [[loc if isinstance(loc, str) else json.dumps(loc)
+              for loc in locs] for locs in self.locs_lst], dtype=str)
+
+    def names(self):
+        """ the column names
+
+        :rtype: tuple[str]
+        """
+        return tuple(self.columns)
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __len__(self):
+        return len(self.locs_lst)
+
+    def __repr__(self):
+        return f"Harvest(nlocs={len(self)}, names={list(self.columns)})"
+
+
+class FileReader():
+    """ reads a data file from a directory that depends on the row, for a
+    harvest column that can be checked against the cache
+
+    :param dfile: the data file
+    :type dfile: autofile.model.DataFile
+    :param dir_path_: maps the locators of a row to the directory of the file
+    :type dir_path_: callable[list->str]
+    """
+
+    def __init__(self, dfile, dir_path_):
+        self.dfile = dfile
+        self.dir_path_ = dir_path_
+
+    def __call__(self, locs):
+        """ the value of the file for this row, or None if it isn't there
+        """
+        dir_pth = self.dir_path_(locs)
+        return (self.dfile.read(dir_pth) if self.dfile.exists(dir_pth)
+                else None)
+
+    def stamps(self, locs_lst):
+        """ stamp the file for each row (see `file_stamps()`)
+
+        :rtype: numpy.ndarray
+        """
+        return _stamps(self.dfile, map(self.dir_path_, locs_lst),
+                       len(locs_lst))
+
+    def __repr__(self):
+        return f"FileReader({self.dfile})"
+
+
+def harvest(dseries, names, root_locs=(), *, readers=None, workers=None,
+            cache_path=None):
+    """ read files from every directory of a data series into columns
+
+    (see `DataSeries.harvest()`)
+    """
+    readers = {} if readers is None else dict(readers)
+    for name in names:
+        assert hasattr(dseries.file, name), (
+            f"{dseries} has no file called {name}")
+        assert name not in readers, f"{name} is both a file and a reader"
+
+    locs_lst = [list(locs) for locs in dseries.existing(root_locs)]
+    col_names = list(names) + list(readers)
+
+    # Plain reader functions can't be checked, so the cache isn't used
+    if not all(isinstance(read_, FileReader) for read_ in readers.values()):
+        cache_path = None
+
+    # The cache is used if it holds these columns for the same locators, and
+    # the files haven't changed since. The files are stamped before they are
+    # read, so that one written along the way makes the next harvest re-read.
+    stamps = None
+    if cache_path is not None:
+        stamps = file_stamps(dseries, names, locs_lst)
+        stamps.update({name: read_.stamps(locs_lst)
+                       for name, read_ in readers.items()})
+        if os.path.isfile(cache_path):
+            hvst = Harvest.load(cache_path)
+            if (hvst.locs_lst == locs_lst
+                    and all(_has_column(hvst, name) for name in col_names)
+                    and all(name in hvst.stamps and numpy.array_equal(
+                        hvst.stamps[name], stamps[name])
+                        for name in col_names)):
+                return hvst
+
+    def _read_row(locs):
+        row = []
+        for name in names:
+            dsfile = getattr(dseries.file, name)
+            row.append(dsfile.read(locs) if dsfile.exists(locs) else None)
+        row.extend(read_(locs) for read_ in readers.values())
+        return row
+
+    if workers is None:
+        rows = list(map(_read_row, locs_lst))
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers) as pool:
+            rows = list(pool.map(_read_row, locs_lst))
+
+    val_dct = {name: [row[idx] for row in rows]
+               for idx, name in enumerate(col_names)}
+    hvst = Harvest.from_values(locs_lst, val_dct, stamps=stamps)
+
+    if cache_path is not None:
+        hvst.save(cache_path)
+    return hvst
+
+
+def file_stamps(dseries, names, locs_lst):
+    """ stamp the files that a harvest reads, to tell when they change
+
+    The stamp of a file in a directory is the latest modification time and
+    the total size of its plain copy, its binary copy, and the pack of the
+    directory, with (-1, -1) where none of them are there.
+
+    :param dseries: the data series
+    :type dseries: autofile.model.DataSeries
+    :param names: the attribute names of the data files
+    :type names: list[str]
+    :param locs_lst: the locators of the rows
+    :type locs_lst: list[list]
+    :returns: an int64 array of shape (nlocs, 2) for each file, by name
+    :rtype: dict[str: numpy.ndarray]
+    """
+    dir_pths = dseries.paths(locs_lst)
+    return {name: _stamps(getattr(dseries.file, name).file, dir_pths,
+                          len(dir_pths))
+            for name in names}
+
+
+def _stamps(dfile, dir_pths, count):
+    """ stamp a data file in each of these directories
+    """
+    stamp = numpy.full((count, 2), -1, dtype=numpy.int64)
+    for idx, dir_pth in enumerate(dir_pths):
+        pths = [dfile.path(dir_pth), autofile.pack.pack_path(dir_pth)]
+        if dfile.array_reader_ is not None:
+            pths.append(autofile.data_types.name.array(pths[0]))
+        stats = list(filter(None, map(_stat, pths)))
+        if stats:
+            stamp[idx] = (max(stat.st_mtime_ns for stat in stats),
+                          sum(stat.st_size for stat in stats))
+    return stamp
+
+
+def _stat(pth):
+    """ the status of a file, or None if it isn't there
+    """
+    IO_STATS.count(nstats=1)
+    try:
+        return os.stat(pth)
+    except FileNotFoundError:
+        return None
+
+
+def _is_stamp_name(name):
+    return name.startswith(STAMP_PREFIX)
+
+
+def _has_column(hvst, name):
+    return name in hvst or f'{name}_symbols' in hvst
+
+
+def _columns(name, vals):
+    """ make the values of a column into arrays, by column name
+    """
+    found = [val for val in vals if val is not None]
+
+    if all(isinstance(val, numbers.Real) and not isinstance(val, bool)
+           for val in found):
+        return {name: numpy.array(
+            [numpy.nan if val is None else val for val in vals],
+            dtype=numpy.float64)}
+
+    if found and all(map(_is_geometry, found)):
+        natms = len(found[0])
+        if all(len(val) == natms for val in found):
+            symbs = numpy.full((len(vals), natms), '', dtype='U3')
+            xyzs = numpy.full((len(vals), natms, 3), numpy.nan)
+            for idx, val in enumerate(vals):
+                if val is not None:
+                    symbs[idx], xyzs[idx] = zip(*val)
+            return {name: xyzs, f'{name}_symbols': symbs}
+
+    arrs = [_float_array(val) for val in found]
+    if found and all(arr is not None and arr.shape == arrs[0].shape
+                     for arr in arrs):
+        col = numpy.full((len(vals),) + arrs[0].shape, numpy.nan)
+        arrs = iter(arrs)
+        for idx, val in enumerate(vals):
+            if val is not None:
+                col[idx] = next(arrs)
+        return {name: col}
+
+    col = numpy.empty(len(vals), dtype=object)
+    col[:] = list(vals)
+    return {name: col}
+
+
+def _is_geometry(val):
+    """ is this an automol geometry, as ((symbol, (x, y, z)), ...)?
+    """
+    return (isinstance(val, (tuple, list)) and len(val) > 0
+            and all(isinstance(atm, (tuple, list)) and len(atm) == 2
+                    and isinstance(atm[0], str) and len(atm[1]) == 3
+                    for atm in val))
+
+
+def _float_array(val):
+    """ the value as a float64 array, or None if it isn't numeric
+    """
+    try:
+        arr = numpy.asarray(val, dtype=numpy.float64)
+    except (TypeError, ValueError):
+        return None
+    return arr
@@ -4,6 +4,7 @@ from autofile.info._info import object_
 from autofile.info._info import string
 from autofile.info._info import dict_
 from autofile.info._info import from_string
+from autofile.info._info import dict_from_string
 from autofile.info._info import matches_function_signature
 from autofile.info._info import Info
 
@@ -12,6 +13,7 @@ __all__ = [
     'string',
     'dict_',
     'from_string',
+    'dict_from_string',
     'matches_function_signature',
     'Info',
 ]
@@ -2,10 +2,11 @@
 """
 
 import numbers
-from types import SimpleNamespace
 from collections.abc import Collection as _Collection
-import yaml
 from autofile.info._inspect import function_keys as _function_keys
+from autofile._lazy import LazyModule
+
+yaml = LazyModule('yaml')
 
 
 def object_(inf_dct):
@@ -15,7 +16,7 @@ def object_(inf_dct):
     def _cast(obj):
         if isinstance(obj, dict):
             ret = {key: _cast(val) for key, val in obj.items()}
-            ret = Info(**ret)
+            ret = Info.from_normalized_dict(ret)
         elif _is_nonstring_sequence(obj):
             ret = _normalized_nonstring_sequence(map(_cast, obj))
         else:
@@ -29,37 +30,48 @@ def object_(inf_dct):
 def dict_(inf_obj):
     """ convert an information object back to a dictionary
     """
-
-    def _cast(obj):
-        if isinstance(obj, Info):
-            keys = obj.keys_()
-            ret = {key: _cast(val)
-                   for key, val in vars(obj).items() if key in keys}
-        elif _is_nonstring_sequence(obj):
-            ret = _normalized_nonstring_sequence(map(_cast, obj))
-        else:
-            ret = obj
-        return ret
-    inf_dct = _cast(inf_obj)
+    inf_dct = _plain(inf_obj, share=True)
+    if inf_dct is getattr(inf_obj, '_dct', None):
+        # Don't hand out the dictionary of the information object itself
+        inf_dct = dict(inf_dct)
     return inf_dct
 
 
 def string(inf_obj):
     """ write an information object to a YAML string
+
+    (the pure-python dumper is used, since libyaml folds long quoted strings
+    differently, and the output should stay the same)
     """
     inf_dct = dict(inf_obj)
-    inf_str = yaml.dump(inf_dct, default_flow_style=None, sort_keys=False)
+    try:
+        inf_str = yaml.dump(inf_dct, Dumper=yaml.SafeDumper,
+                            default_flow_style=None, sort_keys=False)
+    except yaml.representer.RepresenterError:
+        # Values that only the full dumper can represent, such as numpy
+        # scalars, are written out as python-specific tags, as before
+        inf_str = yaml.dump(inf_dct, default_flow_style=None, sort_keys=False)
     return inf_str
 
 
 def from_string(inf_str):
     """ read an information object from a YAML string
     """
-    inf_dct = yaml.load(inf_str, Loader=yaml.FullLoader)
+    inf_dct = _load(inf_str)
     inf_obj = object_(inf_dct)
     return inf_obj
 
 
+def dict_from_string(inf_str):
+    """ read a dictionary from a YAML string, without building an information
+        object
+
+    (this gives the same result as `dict(from_string(inf_str))`)
+    """
+    inf_dct = _plain(_load(inf_str))
+    return inf_dct
+
+
 def matches_function_signature(inf_obj, function):
     """ does the information object match this function signature?
     """
@@ -69,39 +81,61 @@ def matches_function_signature(inf_obj, function):
     return inf_obj.keys_() == _function_keys(function)
 
 
-class Info(SimpleNamespace):
+class Info():
     """ information container class, implemented as a frozen namespace
 
     (values can change, but you can't add keys after initialization)
-    """
-    _frozen = False
 
-    def _freeze(self):
-        self._frozen = True
+    The values are kept in a dictionary in a slot, rather than in an instance
+    __dict__. While the values are all scalars, which is the case for locator
+    and run information, this dictionary is also used for the conversion to a
+    dictionary, instead of building a new one.
+    """
+    __slots__ = ('_dct',)
 
     def __init__(self, **kwargs):
         kwargs = {key: (_normalized_nonstring_sequence(val) if
                         _is_nonstring_sequence(val) else val)
                   for key, val in kwargs.items()}
-        super().__init__(**kwargs)
-        self._freeze()
+        object.__setattr__(self, '_dct', kwargs)
+
+    @classmethod
+    def from_normalized_dict(cls, dct):
+        """ an instance with these values, which are already normalized
+
+        (skips the normalization of sequences done by `__init__()`)
+        """
+        inf_obj = cls.__new__(cls)
+        object.__setattr__(inf_obj, '_dct', dct)
+        return inf_obj
 
     def keys_(self):
         """ keys for this instance """
-        keys = frozenset(key for key in vars(self).keys()
-                         if not key == '_frozen')
+        keys = frozenset(self._dct)
         return keys
 
+    def __getattr__(self, key):
+        # Only called for names that aren't slots, methods, or class
+        # attributes (the slot is looked up directly, in case it isn't set
+        # yet, as during unpickling)
+        try:
+            return object.__getattribute__(self, '_dct')[key]
+        except (KeyError, AttributeError):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'{key}'") from None
+
     def __iter__(self):
         """ used by the dict() function for conversion to dictionary """
-        for key, val in dict_(self).items():
-            yield key, val
+        return iter(_plain(self, share=True).items())
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return isinstance(other, Info) and self._dct == other._dct
+
+    __hash__ = None
 
     def __repr__(self):
-        dct = dict_(self)
+        dct = _plain(self, share=True)
         items = []
         for k in sorted(dct.keys()):
             items.append(f"{k}={dct[k]}")
@@ -110,11 +144,59 @@ class Info(SimpleNamespace):
 
     def __setattr__(self, key, value):
         """ prevent adding new keys after the object is frozen """
-        if self._frozen and not hasattr(self, key):
+        if key not in self._dct:
             raise TypeError(
                 f"'{self.__class__.__name__}'"
                 " object does not support item assignment")
-        object.__setattr__(self, key, value)
+        self._dct[key] = value
+
+    def __reduce__(self):
+        # A copy of the dictionary, so that copy.copy() doesn't share it
+        return (self.__class__.from_normalized_dict, (dict(self._dct),))
+
+
+def _load(inf_str):
+    """ load a YAML string
+    """
+    try:
+        inf_dct = yaml.load(inf_str, Loader=_safe_loader())
+    except yaml.constructor.ConstructorError:
+        # Fall back on the full loader for python-specific tags
+        inf_dct = yaml.load(inf_str, Loader=yaml.FullLoader)
+    return inf_dct
+
+
+def _plain(obj, share=False):
+    """ an object with its information objects made into dictionaries, and
+        its sequences normalized
+
+    (if `share` is set, the dictionary of an information object with only
+    scalar values is returned as is, and must not be modified)
+    """
+    if type(obj) in _SCALAR_TYPES:
+        ret = obj
+    elif isinstance(obj, Info):
+        # pylint: disable=protected-access
+        ret = obj._dct
+        if not (share and
+                all(type(val) in _SCALAR_TYPES for val in ret.values())):
+            ret = {key: _plain(val) for key, val in ret.items()}
+    elif isinstance(obj, dict):
+        ret = {key: _plain(val) for key, val in obj.items()}
+    elif _is_nonstring_sequence(obj):
+        ret = _normalized_nonstring_sequence(map(_plain, obj))
+    else:
+        ret = obj
+    return ret
+
+
+def _safe_loader():
+    """ the libyaml safe loader, if PyYAML was built with it
+    """
+    return yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
 
 
 def _normalized_nonstring_sequence(seq):
@@ -1,6 +1,19 @@
 """ read and write to files
 """
 import os
+import uuid
+import shutil
+import contextlib
+from autofile._lazy import LazyModule
+
+try:
+    import fcntl
+except ImportError:     # not available on Windows
+    fcntl = None
+
+numpy = LazyModule('numpy')
+
+DIRECTORY_LOCK_FILE = '.dir.lock'
 
 
 def read_file(file_path):
@@ -17,13 +30,164 @@ def read_file(file_path):
     return file_str
 
 
-def write_file(file_path, string):
+def write_file(file_path, string, atomic=True, fsync=False):
     """ write a string to a file
 
+    By default, the string is written to a temporary file in the same
+    directory, which is then moved into place with `os.replace()`. Readers
+    will see either the old contents or the new ones, never a partial write,
+    and a crash leaves the old file as it was.
+
     :param file_path: path of file to be written
     :type file_path: str
     :param file_path: string to be written
     :type file_path: str
+    :param atomic: write to a temporary file and move it into place?
+    :type atomic: bool
+    :param fsync: flush the contents to disk before moving them into place?
+    :type fsync: bool
+    """
+    if not atomic:
+        with open(file_path, mode='w', encoding='utf-8') as file_obj:
+            file_obj.write(string)
+            if fsync:
+                file_obj.flush()
+                os.fsync(file_obj.fileno())
+        return
+
+    with _replacing(file_path) as tmp_path:
+        with open(tmp_path, mode='x', encoding='utf-8') as file_obj:
+            file_obj.write(string)
+            if fsync:
+                file_obj.flush()
+                os.fsync(file_obj.fileno())
+
+
+def read_array(file_path, mmap=True):
+    """ read a numpy array from a binary (.npy) file
+
+    :param file_path: path of file to be read
+    :type file_path: str
+    :param mmap: memory-map the file read-only, instead of reading it in?
+    :type mmap: bool
+    :return: file contents
+    :rtype: numpy.ndarray
+    """
+    assert os.path.isfile(file_path)
+    return numpy.load(file_path, mmap_mode='r' if mmap else None,
+                      allow_pickle=False)
+
+
+def write_array(file_path, array, fsync=False):
+    """ write a numpy array to a binary (.npy) file
+
+    (the file is replaced atomically, as in `write_file()`)
+
+    :param file_path: path of file to be written
+    :type file_path: str
+    :param array: array to be written
+    :type array: numpy.ndarray
+    :param fsync: flush the contents to disk before moving them into place?
+    :type fsync: bool
+    """
+    with _replacing(file_path) as tmp_path:
+        with open(tmp_path, mode='xb') as file_obj:
+            numpy.save(file_obj, numpy.asarray(array), allow_pickle=False)
+            if fsync:
+                file_obj.flush()
+                os.fsync(file_obj.fileno())
+
+
+def write_bytes(file_path, data, fsync=False):
+    """ write bytes to a binary file
+
+    (the file is replaced atomically, as in `write_file()`)
+
+    :param file_path: path of file to be written
+    :type file_path: str
+    :param data: bytes to be written
+    :type data: bytes
+    :param fsync: flush the contents to disk before moving them into place?
+    :type fsync: bool
+    """
+    with _replacing(file_path) as tmp_path:
+        with open(tmp_path, mode='xb') as file_obj:
+            file_obj.write(data)
+            if fsync:
+                file_obj.flush()
+                os.fsync(file_obj.fileno())
+
+
+def read_arrays(file_path):
+    """ read named numpy arrays from a binary (.npz) file
+
+    :param file_path: path of file to be read
+    :type file_path: str
+    :return: the arrays, by name
+    :rtype: dict[str: numpy.ndarray]
+    """
+    assert os.path.isfile(file_path)
+    with numpy.load(file_path, allow_pickle=False) as npz:
+        return {name: npz[name] for name in npz.files}
+
+
+def write_arrays(file_path, arrays):
+    """ write named numpy arrays to an uncompressed binary (.npz) file
+
+    (the file is replaced atomically, as in `write_file()`)
+
+    :param file_path: path of file to be written
+    :type file_path: str
+    :param arrays: the arrays, by name
+    :type arrays: dict[str: numpy.ndarray]
+    """
+    with _replacing(file_path) as tmp_path:
+        with open(tmp_path, mode='xb') as file_obj:
+            numpy.savez(file_obj, **arrays)
+
+
+@contextlib.contextmanager
+def lock_directory(dir_path, file_name=DIRECTORY_LOCK_FILE):
+    """ hold an exclusive advisory lock on a directory
+
+    The lock is an `fcntl.flock()` on a lock file in the directory, which is
+    opened for writing, so that it also works where flock is emulated with
+    byte-range locks (as on NFS). (there is no lock where `fcntl` isn't
+    available)
+
+    :param dir_path: path of the directory
+    :type dir_path: str
+    :param file_name: name of the lock file
+    :type file_name: str
+    """
+    if fcntl is None:
+        yield
+        return
+
+    lock_path = os.path.join(dir_path, file_name)
+    with open(lock_path, mode='a', encoding='utf-8') as lock_obj:
+        fcntl.flock(lock_obj, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_obj, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _replacing(file_path):
+    """ yields a temporary path, which replaces the file path on exit
+
+    (the temporary file is removed instead if anything goes wrong)
     """
-    with open(file_path, mode='w', encoding='utf-8') as file_obj:
-        file_obj.write(string)
+    dir_path, file_name = os.path.split(os.path.abspath(file_path))
+    tmp_path = os.path.join(
+        dir_path, f'.{file_name}.{uuid.uuid4().hex[:8]}.tmp')
+    try:
+        yield tmp_path
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
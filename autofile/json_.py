@@ -2,86 +2,243 @@
 """
 import os
 import json
-from shutil import copyfile
 import time
+import errno
+import socket
+import contextlib
+import autofile.io_
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
-def read_json(file_path):
+LOCK_TIMEOUT = 600.
+STALE_AVAIL_AGE = 3600.
+
+
+def read_json(file_path, timeout=LOCK_TIMEOUT, avail=False):
     """ read a file as a string
 
     :param file_path: path of file to be read
     :type file_path: str
+    :param timeout: seconds to wait for the lock before giving up
+    :type timeout: float
+    :param avail: also wait on the old `.avail` sentinel file?
+    :type avail: bool
     :return: file contents
     :rtype: dict
     """
 
     assert os.path.isfile(file_path)
 
-    avail = 'in use'
-    while avail == 'in use':
-        time.sleep(.1)
-        json_path = file_path.replace('.json', '.avail')
-        if os.path.exists(json_path):
-            with open(json_path, mode='r', encoding='utf-8') as afile:
-                avail = afile.read()
-        else:
-            avail = 'available'
-
-    try:
-        with open(file_path, mode='r', encoding='utf-8') as file_obj:
-            json_dct = json.load(file_obj)
-    except Exception as specific_error:
-        if os.path.exists('_'.join([file_path, 'backup'])):
-            copyfile('_'.join([file_path, 'backup']), file_path)
-            print('failure reading json file,',
-                  f'falling back to {file_path}_backup')
-            raise IOError from specific_error
-        raise Exception(
-            'failure reading json file,',
-            f'no backup to fall back to for {file_path}'
-        ) from specific_error
+    with lock(file_path, shared=True, timeout=timeout, avail=avail):
+        json_dct = _load(file_path)
 
     return json_dct
 
 
-def write_json(json_dct, file_path):
+def write_json(json_dct, file_path, timeout=LOCK_TIMEOUT, avail=False,
+               fsync=False):
     """ write a string to a file
 
+    (the file is replaced atomically, so a failed write leaves the old one as
+    it was)
+
     :param file_path: path of file to be written
     :type file_path: str
     :param file_path: dictionry to be written
     :type file_path: dict
+    :param timeout: seconds to wait for the lock before giving up
+    :type timeout: float
+    :param avail: also use the old `.avail` sentinel file?
+    :type avail: bool
+    :param fsync: flush the file to disk before replacing the old one?
+    :type fsync: bool
+    """
+
+    json_str = _dumps(json_dct, file_path)
+    with lock(file_path, shared=False, timeout=timeout, avail=avail):
+        autofile.io_.write_file(file_path, json_str, fsync=fsync)
+
+
+def update_json(update_, file_path, timeout=LOCK_TIMEOUT, avail=False,
+                fsync=False):
+    """ read, update, and write back a json file, holding the lock throughout
+
+    (a missing file is started from an empty dictionary)
+
+    :param update_: updates the file contents in place
+    :type update_: callable[dict->None]
+    :param file_path: path of file to be updated
+    :type file_path: str
+    :param timeout: seconds to wait for the lock before giving up
+    :type timeout: float
+    :param avail: also use the old `.avail` sentinel file?
+    :type avail: bool
+    :param fsync: flush the file to disk before replacing the old one?
+    :type fsync: bool
+    """
+    with lock(file_path, shared=False, timeout=timeout, avail=avail):
+        json_dct = _load(file_path) if os.path.isfile(file_path) else {}
+        update_(json_dct)
+        json_str = _dumps(json_dct, file_path)
+        autofile.io_.write_file(file_path, json_str, fsync=fsync)
+
+
+@contextlib.contextmanager
+def lock(file_path, shared=False, timeout=LOCK_TIMEOUT, avail=False):
+    """ hold an advisory lock on a json file
+
+    The lock is an `fcntl.flock()` on a `.lock` file next to the json file,
+    so it is released by the operating system if the process holding it
+    dies. Readers share the lock and writers hold it exclusively. Waiting
+    only starts if the lock is taken, and backs off up to a tenth of a second
+    between attempts. Readers don't create the lock file, and read without
+    the lock if it isn't there or can't be opened.
+
+    With `avail` set, the old `.avail` sentinel is honored as well, so that
+    this can run alongside processes that only know about the sentinel. A
+    sentinel left 'in use' for longer than `STALE_AVAIL_AGE` seconds is taken
+    to be left over from a process that died.
+
+    :param file_path: path of the json file
+    :type file_path: str
+    :param shared: take a shared (read) lock, instead of an exclusive one?
+    :type shared: bool
+    :param timeout: seconds to wait for the lock before giving up
+    :type timeout: float
+    :param avail: also use the `.avail` sentinel file?
+    :type avail: bool
     """
+    deadline = time.monotonic() + timeout
+    lock_path = _sidecar_path(file_path, '.lock')
+
+    with contextlib.ExitStack() as stack:
+        lock_obj = _open_lock_file(lock_path, shared)
+        if lock_obj is not None:
+            stack.enter_context(lock_obj)
+            if fcntl is not None:
+                flag = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                _wait(lambda: _try_flock(lock_obj, flag), deadline,
+                      f'Timed out waiting for the lock on {file_path} '
+                      f'(last held by {_lock_holder(lock_obj)})')
+                stack.callback(fcntl.flock, lock_obj, fcntl.LOCK_UN)
+
+        if not shared:
+            lock_obj.seek(0)
+            lock_obj.truncate()
+            lock_obj.write(f'{socket.gethostname()}:{os.getpid()}\n')
+            lock_obj.flush()
 
-    avail = 'in use'
-    json_path = file_path.replace('.json', '.avail')
+        if avail:
+            avail_path = _sidecar_path(file_path, '.avail')
+            _wait(lambda: _avail_is_free(avail_path), deadline,
+                  f'Timed out waiting for {avail_path}')
+            if not shared:
+                _set_avail(avail_path, 'in use')
+                stack.callback(_set_avail, avail_path, 'available')
 
-    while avail == 'in use':
-        time.sleep(.1)
-        if os.path.exists(json_path):
-            with open(json_path, mode='r', encoding='utf-8') as afile:
-                avail = afile.read()
-        else:
-            avail = 'available'
+        yield
 
-    with open(json_path, mode='w', encoding='utf-8') as afile:
-        afile.write('in use')
-    if os.path.exists(file_path):
-        copyfile(file_path, '_'.join([file_path, 'backup']))
+
+def _open_lock_file(lock_path, shared):
+    """ open the lock file, creating it for writers
+
+    Readers only open a lock file that is already there, and go without the
+    lock if they can't, so that read-only trees can still be read. (writes
+    replace the json file atomically, so a reader never sees a partial one)
+    """
+    if not shared:
+        return open(lock_path, mode='a+', encoding='utf-8')
 
     try:
-        with open(file_path, mode='w', encoding='utf-8') as file_obj:
-            json.dump(json_dct, file_obj, ensure_ascii=False, indent=4)
-    except Exception as specific_error:
-        if os.path.exists('_'.join([file_path, 'backup'])):
-            copyfile('_'.join([file_path, 'backup']), file_path)
-            print('failure reading json file,',
-                  f'falling back to {file_path}_backup')
-            raise IOError from specific_error
-        raise Exception(
-            'failure reading json file,',
-            f'no backup to fall back to for {file_path}'
-        ) from specific_error
-
-    with open(json_path, mode='w', encoding='utf-8') as afile:
-        afile.write('available')
+        return open(lock_path, mode='r', encoding='utf-8')
+    except OSError as err:
+        if err.errno in (errno.ENOENT, errno.EACCES, errno.EROFS,
+                         errno.EPERM):
+            return None
+        raise
+
+
+def _load(file_path):
+    """ parse a json file, without taking the lock
+
+    (writes are atomic, so there is no backup copy to fall back to)
+    """
+    try:
+        with open(file_path, mode='r', encoding='utf-8') as file_obj:
+            json_dct = json.load(file_obj)
+    except ValueError as specific_error:
+        raise IOError(
+            f'failure reading json file {file_path}') from specific_error
+    return json_dct
+
+
+def _dumps(json_dct, file_path):
+    """ serialize a json file
+    """
+    try:
+        json_str = json.dumps(json_dct, ensure_ascii=False, indent=4)
+    except (TypeError, ValueError) as specific_error:
+        raise IOError(
+            f'failure writing json file {file_path}') from specific_error
+    return json_str
+
+
+def _sidecar_path(file_path, ext):
+    """ path of a file next to the json file, with a different extension
+    """
+    return os.path.splitext(file_path)[0] + ext
+
+
+def _wait(acquire_, deadline, message):
+    """ call `acquire_()` until it succeeds, backing off in between
+
+    (there is no sleep if it succeeds on the first attempt)
+    """
+    delay = 0.001
+    while not acquire_():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(message)
+        time.sleep(delay)
+        delay = min(2 * delay, 0.1)
+
+
+def _try_flock(lock_obj, flag):
+    """ try to take the lock without blocking
+    """
+    try:
+        fcntl.flock(lock_obj, flag | fcntl.LOCK_NB)
+        acquired = True
+    except BlockingIOError:
+        acquired = False
+    return acquired
+
+
+def _lock_holder(lock_obj):
+    """ the host and process id that last held the lock exclusively
+    """
+    lock_obj.seek(0)
+    return lock_obj.read().strip() or 'unknown'
+
+
+def _avail_is_free(avail_path):
+    """ is the `.avail` sentinel free (or stale)?
+    """
+    try:
+        with open(avail_path, mode='r', encoding='utf-8') as afile:
+            free = afile.read() != 'in use'
+        if not free:
+            age = time.time() - os.path.getmtime(avail_path)
+            free = age > STALE_AVAIL_AGE
+    except FileNotFoundError:
+        free = True
+    return free
+
+
+def _set_avail(avail_path, avail):
+    """ set the `.avail` sentinel
+    """
+    with open(avail_path, mode='w', encoding='utf-8') as afile:
+        afile.write(avail)
@@ -1,14 +1,46 @@
 """ defines the filesystem model
 """
 import os
-import glob
+import json
 import types
 import shutil
+import functools
 import itertools
+import contextlib
+import collections
 import autofile.io_
+import autofile.pack
+import autofile.sqlite_
+import autofile.harvest
+import autofile.trajectory
+import autofile.data_types.name
+from autofile.stats import IO_STATS
+from autofile.cache import READ_CACHE
+from autofile.aio import AsyncFileMixin
+from autofile.aio import AsyncSeriesMixin
+from autofile._lazy import LazyModule
 
+numpy = LazyModule('numpy')
 
-class DataFile():
+
+LOCATOR_INDEX_FILE = '.locs.json'
+
+
+def _instrumented(kind):
+    """ record the calls to a method in `IO_STATS`, as this kind of operation
+    """
+    def _decorator(method):
+        @functools.wraps(method)
+        def _method(self, *args, **kwargs):
+            if not IO_STATS.enabled:
+                return method(self, *args, **kwargs)
+            with IO_STATS.operation(kind, _stats_name(self)):
+                return method(self, *args, **kwargs)
+        return _method
+    return _decorator
+
+
+class DataFile(AsyncFileMixin):
     """ file manager for a given datatype
 
         :param name: the file name
@@ -17,14 +49,30 @@ class DataFile():
         :type writer_: callable[object->str]
         :param reader_: reads data from a string
         :type reader_: callable[str->object]
+        :param array_reader_: reads data from a numpy array, for files that
+            may have a binary (.npy) copy next to them
+        :type array_reader_: callable[numpy.ndarray->object]
+        :param frame_writer_: writes one frame to a string, for trajectory
+            files that can be read and appended to frame by frame
+        :type frame_writer_: callable[object->str]
+        :param frame_reader_: reads one frame from a string
+        :type frame_reader_: callable[str->object]
+        :param binary: Write a binary copy along with the text file?
+        :type binary: bool
         :param removable: Is this file removable?
         :type removable: bool
 
     """
-    def __init__(self, name, writer_=(lambda _: _), reader_=(lambda _: _)):
+    def __init__(self, name, writer_=(lambda _: _), reader_=(lambda _: _),
+                 *, array_reader_=None, frame_writer_=None,
+                 frame_reader_=None, binary=False):
         self.name = name
         self.writer_ = writer_
         self.reader_ = reader_
+        self.array_reader_ = array_reader_
+        self.frame_writer_ = frame_writer_
+        self.frame_reader_ = frame_reader_
+        self.binary = binary
         self.removable = False
 
     def path(self, dir_pth):
@@ -37,6 +85,7 @@ class DataFile():
         """
         return os.path.join(dir_pth, self.name)
 
+    @_instrumented('file.exists')
     def exists(self, dir_pth):
         """ does this file exist?
 
@@ -46,23 +95,68 @@ class DataFile():
         :return type: bool
         """
         pth = self.path(dir_pth)
-        return os.path.isfile(pth)
+        return _isfile(pth)
 
-    def write(self, val, dir_pth):
+    @_instrumented('file.write')
+    def write(self, val, dir_pth, fsync=False):
         """ write data to this file
 
         :param val: value to be written
         :type val: int/float/str/tuple
         :param dir_pth: directory path
         :type dir_pth: str
+        :param fsync: flush the file to disk before replacing the old one?
+        :type fsync: bool
         """
-        assert os.path.exists(dir_pth), (
+        assert _exists(dir_pth), (
             f'No path exists: {dir_pth}'
         )
         pth = self.path(dir_pth)
-        val_str = self.writer_(val)
-        autofile.io_.write_file(pth, val_str)
+        arr_pth = self.array_path(dir_pth)
+        write_array = self.binary and self.array_reader_ is not None
+        # A binary copy that isn't rewritten is removed first, since it would
+        # otherwise be read in place of the new text file wherever the two
+        # modification times are equal
+        if not write_array and _isfile(arr_pth):
+            os.remove(arr_pth)
+        val_str = IO_STATS.parse(self.writer_, val)
+        autofile.io_.write_file(pth, val_str, fsync=fsync)
+        # The binary copy is written second, so that it is never older than
+        # the text file it was made from
+        if write_array:
+            arr = numpy.asarray(val, dtype=float)
+            autofile.io_.write_array(arr_pth, arr, fsync=fsync)
+            IO_STATS.count(nbytes=arr.nbytes)
+        if IO_STATS.enabled:
+            IO_STATS.count(nbytes=len(val_str.encode('utf-8')))
+        READ_CACHE.invalidate(pth)
+
+    def array_path(self, dir_pth):
+        """ path of the binary copy of this file
+
+        :param dir_pth: directory path
+        :type dir_pth: str
+        :returns: binary file path
+        :return type: str
+        """
+        return autofile.data_types.name.array(self.path(dir_pth))
+
+    def frames(self, dir_pth):
+        """ frame-by-frame access to this trajectory file
+
+        :param dir_pth: directory path
+        :type dir_pth: str
+        :rtype: autofile.trajectory.TrajectoryFile
+        """
+        assert (self.frame_reader_ is not None
+                and self.frame_writer_ is not None), (
+            f'{self} is not a trajectory file'
+        )
+        return autofile.trajectory.TrajectoryFile(
+            self.path(dir_pth), reader_=self.frame_reader_,
+            writer_=self.frame_writer_)
 
+    @_instrumented('file.read')
     def read(self, dir_pth):
         """ read data from this file
 
@@ -71,16 +165,38 @@ class DataFile():
         :returns: datafile contents
         :return type: int/float/str/tuple
         """
-        assert self.exists(dir_pth), (
+        pth = self.path(dir_pth)
+        assert _isfile(pth), (
             f'Either requested file {self}',
             f'or requested path does not exist {dir_pth}'
         )
 
-        pth = self.path(dir_pth)
-        val_str = autofile.io_.read_file(pth)
-        val = self.reader_(val_str)
+        if READ_CACHE.is_enabled():
+            val = READ_CACHE.read(pth, self._read, self)
+        else:
+            val = self._read(pth)
+        return val
+
+    def _read(self, pth):
+        """ read data from this file path, without the cache
+
+        (the binary copy is read instead of the text, if there is one that is
+        at least as new as the text file)
+        """
+        arr_pth = autofile.data_types.name.array(pth)
+        if (self.array_reader_ is not None and _isfile(arr_pth)
+                and _stat(arr_pth).st_mtime_ns >= _stat(pth).st_mtime_ns):
+            arr = autofile.io_.read_array(arr_pth)
+            IO_STATS.count(nbytes=arr.nbytes)
+            val = IO_STATS.parse(self.array_reader_, arr)
+        else:
+            val_str = autofile.io_.read_file(pth)
+            if IO_STATS.enabled:
+                IO_STATS.count(nbytes=len(val_str.encode('utf-8')))
+            val = IO_STATS.parse(self.reader_, val_str)
         return val
 
+    @_instrumented('file.remove')
     def remove(self, dir_pth):
         """ remove this file
 
@@ -91,7 +207,9 @@ class DataFile():
         """
         if self.removable:
             pth = self.path(dir_pth)
+            READ_CACHE.invalidate(pth)
             os.remove(pth)
+            _remove_sidecars(pth)
         else:
             raise ValueError("This data series is not removable")
 
@@ -102,7 +220,7 @@ class DataFile():
         return f"DataFile('{self.name}')"
 
 
-class DataSeries():
+class DataSeries(AsyncSeriesMixin):  # pylint: disable=R0904
     """ directory manager mapping locator values to a directory series
 
 
@@ -110,10 +228,12 @@ class DataSeries():
             `depth` directories
         :param info_map_: maps `nlocs` locators to an information object, to
             be written in the data directory
+        :param indexed: keep an on-disk index of the locators at each prefix,
+            so that `existing()` does not need to read every locator file
     """
 
     def __init__(self, prefix, map_, nlocs, depth, loc_dfile=None,
-                 root_ds=None, removable=False):
+                 root_ds=None, removable=False, indexed=False):
         self.prefix = os.path.abspath(prefix)
         self.map_ = map_
         self.nlocs = nlocs
@@ -121,8 +241,11 @@ class DataSeries():
         self.loc_dfile = loc_dfile
         self.root = root_ds
         self.removable = removable
+        self.indexed = indexed
+        self.packed = False
         self.file = types.SimpleNamespace()
-        self.json_file = 'db.json'
+        self.json_store = JSON_FILE_STORE
+        self.json_file = self.json_store.file_name
         self.json = types.SimpleNamespace()
 
     def add_data_files(self, dfile_dct):
@@ -153,13 +276,46 @@ class DataSeries():
         assert _path_has_depth(pth, self.depth)
         return os.path.join(prefix, pth)
 
+    def paths(self, locs_lst):
+        """ absolute directory paths for a list of locators
+
+        The root path is resolved once for each distinct set of root locators,
+        so that locators sharing a root (such as many conformers under one
+        theory) only need this layer's mapping for each entry.
+
+        :param locs_lst: a list of locators for this DataSeries
+        :type locs_lst: list
+        :returns: the paths, in the same order as the locators
+        :rtype: list[str]
+        """
+        prefix_dct = {}
+        pths = []
+        for locs in locs_lst:
+            if self.root is None:
+                prefix = self.prefix
+            else:
+                root_locs = self._root_locators(locs)
+                locs = self._self_locators(locs)
+                root_key = repr(root_locs)
+                if root_key not in prefix_dct:
+                    prefix_dct[root_key] = self.root.path(root_locs)
+                prefix = prefix_dct[root_key]
+            assert len(locs) == self.nlocs
+            pth = self.map_(locs)
+            assert _path_is_relative(pth)
+            assert _path_has_depth(pth, self.depth)
+            pths.append(os.path.join(prefix, pth))
+        return pths
+
+    @_instrumented('series.exists')
     def exists(self, locs=()):
         """ does this directory exist?
 
         """
         pth = self.path(locs)
-        return os.path.isdir(pth)
+        return _isdir(pth)
 
+    @_instrumented('series.remove')
     def remove(self, locs=()):
         """ remove this directory
 
@@ -169,35 +325,57 @@ class DataSeries():
         if self.removable:
             pth = self.path(locs)
             if self.exists(locs):
-                shutil.rmtree(pth)
+                with self._locked_index(locs) as idx:
+                    shutil.rmtree(pth)
+                    if idx is not None:
+                        self._update_index(idx, pth, remove=True)
         else:
             raise ValueError("This data series is not removable")
 
     def create(self, locs=()):
         """ create a directory at this prefix
 
+        (the locator file is only written if the directory is new, or if the
+        locators stored in it differ from these ones)
         """
-        # recursively create starting from the first root directory
-        if self.root is not None:
-            root_locs = self._root_locators(locs)
-            self.root.create(root_locs)
+        self.create_all([locs])
 
-        # create this directory in the chain, if it doesn't already exist
-        if not self.exists(locs):
-            pth = self.path(locs)
-            os.makedirs(pth, exist_ok=True)
+    @_instrumented('series.create')
+    def create_all(self, locs_lst):
+        """ create directories at this prefix for a list of locators
 
-            if self.loc_dfile is not None:
-                locs = self._self_locators(locs)
-                self.loc_dfile.write(locs, pth)
-        if self.loc_dfile is not None:
-            try:
-                pth = self.path(locs)
-                locs = self._self_locators(locs)
-                self.loc_dfile.write(locs, pth)
-            except AssertionError:
-                pass
+        The root directories are created once for each distinct set of root
+        locators, so that locators sharing a root (such as many conformers
+        under one theory) only need this layer created for each entry.
 
+        :param locs_lst: a list of locators for this DataSeries
+        :type locs_lst: list
+        """
+        # recursively create starting from the first root directory
+        if self.root is not None:
+            root_locs_dct = {}
+            for locs in locs_lst:
+                root_locs = self._root_locators(locs)
+                root_locs_dct.setdefault(repr(root_locs), root_locs)
+            for root_locs in root_locs_dct.values():
+                self.root.create(root_locs)
+
+        # create these directories in the chain, if they don't already exist
+        for locs, pth in zip(locs_lst, self.paths(locs_lst)):
+            self_locs = self._self_locators(locs)
+            if _isdir(pth) and (
+                    self.loc_dfile is None
+                    or self._stored_locators_match(self_locs, pth)):
+                continue
+
+            with self._locked_index(locs) as idx:
+                os.makedirs(pth, exist_ok=True)
+                if self.loc_dfile is not None:
+                    self.loc_dfile.write(self_locs, pth)
+                if idx is not None:
+                    self._update_index(idx, pth)
+
+    @_instrumented('series.existing')
     def existing(self, root_locs=(), relative=False, ignore_bad_formats=True):
         """ return the list of locators for existing paths
 
@@ -229,48 +407,246 @@ class DataSeries():
                 assert root_nlocs == len(root_locs), (
                     f'{root_nlocs} != {len(root_locs)}'
                 )
-                pths = self._existing_paths(root_locs)
-                if ignore_bad_formats:
-                    locs_lst = []
-                    for pth in pths:
-                        if self.loc_dfile.exists(pth):
-                            try:
-                                pth_loc = self.loc_dfile.read(pth)
-                                locs_lst.append(pth_loc)
-                            except ValueError as exception:
-                                print(
-                                    'currently allowing ' +
-                                    f'exception {exception}' +
-                                    ' in existing to avoid crashes from' +
-                                    '  CONF/cid in RUN')
-                            except KeyError as exception:
-                                print(
-                                    'currently allowing ' +
-                                    f'exception {exception}' +
-                                    ' in existing to avoid crashes from' +
-                                    '  CONF/cid in RUN')
+                if self.indexed:
+                    locs_lst = self._indexed_locators(
+                        root_locs, ignore_bad_formats=ignore_bad_formats)
                 else:
-                    locs_lst = tuple(self.loc_dfile.read(pth) for pth in pths
-                                     if self.loc_dfile.exists(pth))
+                    pths = self._existing_paths(root_locs)
+                    locs_lst = [locs for _, locs in self._read_locators(
+                        pths, ignore_bad_formats=ignore_bad_formats)]
+                if not ignore_bad_formats:
+                    locs_lst = tuple(locs_lst)
 
                 if not relative:
                     locs_lst = tuple(map(list(root_locs).__add__, locs_lst))
 
         return locs_lst
 
+    def harvest(self, names, root_locs=(), readers=None, workers=None,
+                cache_path=None):
+        """ read files from every existing directory into numpy columns
+
+        Rows with a missing file get NaN in its column. (see
+        `autofile.harvest.Harvest` for how values become columns)
+
+        :param names: the attribute names of the data files to read
+        :type names: list[str]
+        :param root_locs: only harvest the directories under these root
+            locators
+        :type root_locs: list
+        :param readers: extra columns, read by calling each function with
+            the locators of a row (use `autofile.harvest.FileReader` for
+            files, so that they are checked against the cache)
+        :type readers: dict[str: callable[list->object]]
+        :param workers: if set, the rows are read on a pool of this many
+            threads
+        :type workers: int
+        :param cache_path: an .npz file to save the harvest to, and load it
+            from instead next time, if it has the same locators and columns
+            and the files haven't changed (the cache isn't used if any of
+            the readers is a plain function)
+        :type cache_path: str
+        :rtype: autofile.harvest.Harvest
+        """
+        return autofile.harvest.harvest(
+            self, names, root_locs=root_locs, readers=readers,
+            workers=workers, cache_path=cache_path)
+
+    def existing_paths(self, root_locs=()):
+        """ iterate over the paths of existing directories
+
+        (unlike `existing()`, this only walks the directory tree and does not
+        read the locators back in)
+        """
+        if self.nlocs > 0 and self.loc_dfile is None:
+            raise ValueError("This function does not work "
+                             "without a locator DataFile")
+
+        if self.root is None or len(root_locs) == self.root_locator_count():
+            prefixes = (self._index_prefix(root_locs),)
+        else:
+            prefixes = self.root.existing_paths(root_locs)
+
+        for prefix in prefixes:
+            if self.nlocs == 0:
+                pth = os.path.join(prefix, self.map_(()))
+                if _isdir(pth):
+                    yield pth
+            else:
+                for pth in _iterate_directories(prefix, self.depth):
+                    if self.loc_dfile.exists(pth):
+                        yield pth
+
     def _existing_paths(self, root_locs=()):
         """ existing paths at this prefix/root directory
 
+        """
+        prefix = self._index_prefix(root_locs)
+        return _iterate_directories(prefix, self.depth)
+
+    def _read_locators(self, pths, ignore_bad_formats=True):
+        """ read the locators out of a sequence of directory paths
+
+            returns (path, locators) pairs for each path with a locator file
+        """
+        pth_locs_lst = []
+        for pth in pths:
+            if self.loc_dfile.exists(pth):
+                if ignore_bad_formats:
+                    try:
+                        pth_locs_lst.append((pth, self.loc_dfile.read(pth)))
+                    except (ValueError, KeyError) as exception:
+                        print(
+                            'currently allowing ' +
+                            f'exception {exception}' +
+                            ' in existing to avoid crashes from' +
+                            '  CONF/cid in RUN')
+                else:
+                    pth_locs_lst.append((pth, self.loc_dfile.read(pth)))
+        return pth_locs_lst
+
+    def _stored_locators_match(self, locs, pth):
+        """ does the locator file in this directory hold these locators?
+
+        (a missing or unreadable file doesn't match)
+        """
+        match = False
+        if self.loc_dfile.exists(pth):
+            try:
+                match = (_normalized_locators(self.loc_dfile.read(pth))
+                         == _normalized_locators(locs))
+            except (ValueError, KeyError):
+                pass
+        return match
+
+    # locator index
+    def _index_prefix(self, root_locs=()):
+        """ the directory holding the locator index for these root locators
         """
         if self.root is None:
             prefix = self.prefix
         else:
             prefix = self.root.path(root_locs)
+        return prefix
 
-        pth_pattern = os.path.join(prefix, *('*' * self.depth))
-        pths = filter(os.path.isdir, glob.glob(pth_pattern))
-        pths = tuple(sorted(os.path.join(prefix, pth) for pth in pths))
-        return pths
+    def _index_key(self):
+        """ identifies which DataSeries an index was written for
+        """
+        return f'{self.map_.__name__}:{self.depth}'
+
+    def _indexed_locators(self, root_locs=(), ignore_bad_formats=True):
+        """ existing locators, read from the index if it is up to date
+
+        (if the index is missing or stale, it is rebuilt from a scan, and if
+        it can't be rebuilt, as on a read-only tree, the scan is used as is)
+        """
+        prefix = self._index_prefix(root_locs)
+        idx = self._read_index(prefix)
+        if idx is None:
+            try:
+                with autofile.io_.lock_directory(prefix):
+                    # another process may have rebuilt it while we waited
+                    idx = self._read_index(prefix)
+                    if idx is None:
+                        idx = self._build_index(prefix, root_locs,
+                                                ignore_bad_formats)
+            except OSError:
+                pths = self._existing_paths(root_locs)
+                return [locs for _, locs in self._read_locators(
+                    pths, ignore_bad_formats=ignore_bad_formats)]
+
+        return [locs for _, locs in sorted(idx['locators'].items())]
+
+    def _build_index(self, prefix, root_locs, ignore_bad_formats):
+        """ scan the directories at this prefix and write their index
+
+        (the caller holds the lock on the prefix)
+        """
+        idx_pth = os.path.join(prefix, LOCATOR_INDEX_FILE)
+
+        # create the index file before recording the modification times,
+        # since this changes the modification time of the prefix directory
+        # (after that, it is written in place, which leaves it unchanged)
+        if not os.path.exists(idx_pth):
+            autofile.io_.write_file(idx_pth, '', atomic=False)
+
+        # the modification times are taken before the scan, so that anything
+        # created during it makes the index stale
+        mtimes = {
+            os.path.relpath(pth, prefix) if pth != prefix else '':
+            _stat(pth).st_mtime_ns
+            for pth in _iterate_directories(
+                prefix, self.depth - 1, trunk=True)}
+
+        pths = self._existing_paths(root_locs)
+        pth_locs_lst = self._read_locators(
+            pths, ignore_bad_formats=ignore_bad_formats)
+        idx = {'series': self._index_key(),
+               'mtimes': mtimes,
+               'locators': {os.path.relpath(pth, prefix): locs
+                            for pth, locs in pth_locs_lst}}
+        self._write_index(prefix, idx)
+        return idx
+
+    @contextlib.contextmanager
+    def _locked_index(self, locs):
+        """ hold the lock on the index for the prefix of these locators, and
+        yield the index if it is up to date
+
+        (yields None, without locking, if this DataSeries is not indexed)
+        """
+        prefix = None
+        if self.indexed and self.loc_dfile is not None and self.nlocs > 0:
+            prefix = self._index_prefix(self._root_locators(locs))
+        if prefix is None or not _isdir(prefix):
+            yield None
+            return
+
+        with autofile.io_.lock_directory(prefix):
+            yield self._read_index(prefix)
+
+    def _update_index(self, idx, pth, remove=False):
+        """ add or remove one directory path from an up-to-date index
+
+        (the caller holds the lock on the prefix)
+        """
+        parts = _os_path_split_all(pth)
+        prefix = os.path.join(*parts[:-self.depth])
+        rel_pth = os.path.join(*parts[-self.depth:])
+        if remove:
+            idx['locators'].pop(rel_pth, None)
+        else:
+            idx['locators'][rel_pth] = self.loc_dfile.read(pth)
+
+        # only the directories above this one have been modified
+        parts = parts[-self.depth:]
+        for num in range(self.depth):
+            rel_pth = os.path.join('', *parts[:num])
+            idx['mtimes'][rel_pth] = _stat(
+                os.path.join(prefix, rel_pth)).st_mtime_ns
+        self._write_index(prefix, idx)
+
+    def _read_index(self, prefix):
+        """ read the locator index at this prefix
+
+        (returns None if it is missing, corrupt, or stale)
+        """
+        idx_pth = os.path.join(prefix, LOCATOR_INDEX_FILE)
+        try:
+            with open(idx_pth, mode='r', encoding='utf-8') as idx_obj:
+                idx = json.load(idx_obj)
+            fresh = (idx['series'] == self._index_key()
+                     and _index_is_fresh(idx, prefix))
+        except (OSError, ValueError, KeyError, TypeError):
+            fresh = False
+        return idx if fresh else None
+
+    @staticmethod
+    def _write_index(prefix, idx):
+        """ write the locator index at this prefix, in place
+        """
+        idx_pth = os.path.join(prefix, LOCATOR_INDEX_FILE)
+        autofile.io_.write_file(idx_pth, json.dumps(idx), atomic=False)
 
     def json_path(self, json_layer=None):
         """ json file path
@@ -289,32 +665,15 @@ class DataSeries():
 
         """
         pth = self.json_path(json_layer=json_layer)
-        return os.path.isfile(pth)
+        return _isfile(pth)
 
     def json_existing(self, locs=(), json_layer=None):
         """ returns a list of locations (aka keys) in the json file
 
         """
-        locs = []
-        if self.json_exists(json_layer=json_layer):
-            json_data = autofile.json_.read_json(
-                self.json_path(json_layer=json_layer))
-            keys = json_data.keys()
-            dct = json_data
-            for nested_key in locs:
-                if nested_key in keys:
-                    dct = dct[nested_key]
-                    keys = dct.keys()
-                else:
-                    dct = {}
-                    keys = []
-            locs = []
-            for key in keys:
-                if isinstance(dct[key], dict):
-                    locs.append(key)
-            locs = tuple([key] for key in keys)
-
-        return locs
+        keys = self.json_store.existing(
+            list(locs), self.json_path(json_layer=json_layer))
+        return tuple([key] for key in keys)
 
     def map(self, locs):
         """ returns a list of mapped locations
@@ -341,8 +700,70 @@ class DataSeries():
 
         """
         if not self.json_exists():
-            autofile.json_.write_json(
-                {}, self.json_path(json_layer=json_layer))
+            self.json_store.create(self.json_path(json_layer=json_layer))
+
+    @contextlib.contextmanager
+    def json_transaction(self):
+        """ hold json entry writes in memory, making them at once on exit
+
+        The writes for each json file are made in one update, under one lock.
+        If an exception is raised inside the block, they are dropped. Inside a
+        transaction that is already open, this does nothing.
+
+            with ds.json_transaction():
+                ds.json.energy.write(ene, locs)
+                ds.json.input.write(inp_str, locs)
+        """
+        if isinstance(self.json_store, JSONTransaction):
+            yield
+            return
+
+        store = self.json_store
+        self.json_store = JSONTransaction(store)
+        try:
+            yield
+            self.json_store.commit()
+        finally:
+            self.json_store = store
+
+    def use_json_store(self, store):
+        """ keep the json entries of this series in a different store
+
+        :param store: the store, such as `SQLiteStore()`
+        :type store: JSONFileStore or SQLiteStore
+        """
+        self.json_store = store
+        self.json_file = store.file_name
+
+    def use_packed_files(self, packed=True):
+        """ write the data files of this series into one pack per directory
+
+        (see `autofile.pack`; directories that already have a pack are
+        written to either way)
+
+        :param packed: write new files into packs?
+        :type packed: bool
+        """
+        self.packed = packed
+
+    def pack(self, root_locs=()):
+        """ move the data files of the existing directories into packs
+
+        :returns: the number of directories that were packed
+        :rtype: int
+        """
+        dfiles = [dsfile.file for dsfile in vars(self.file).values()]
+        return sum(bool(autofile.pack.pack_directory(pth, dfiles))
+                   for pth in self.existing_paths(root_locs))
+
+    def unpack(self, root_locs=()):
+        """ move the packed data files of the existing directories back out
+
+        :returns: the number of directories that were unpacked
+        :rtype: int
+        """
+        return sum(bool(autofile.pack.unpack_directory(pth))
+                   for pth in self.existing_paths(root_locs))
 
     def root_locator_count(self):
         """ count the number of root locator values recursively
@@ -382,7 +803,7 @@ class DataSeries():
         return f"DataSeries('{self.prefix}', {self.map_.__name__})"
 
 
-class DataSeriesFile():
+class DataSeriesFile(AsyncFileMixin):
     """ file manager mapping locator values to files in a directory series
 
     """
@@ -399,22 +820,39 @@ class DataSeriesFile():
         return self.file.path(self.dir.path(locs))
 
     def exists(self, locs=()):
-        """ does this file exist?
+        """ does this file exist? (plain or packed)
 
         """
-        return self.file.exists(self.dir.path(locs))
+        dir_pth = self.dir.path(locs)
+        return (self.file.exists(dir_pth)
+                or autofile.pack.exists(self.file, dir_pth))
 
-    def write(self, val, locs=()):
+    def write(self, val, locs=(), fsync=False):
         """ write data to this file
 
+        (into the pack of the directory, in packed mode or if it has one)
         """
-        self.file.write(val, self.dir.path(locs))
+        dir_pth = self.dir.path(locs)
+        if autofile.pack.packable(self.file) and (
+                self.dir.packed or autofile.pack.is_packed(dir_pth)):
+            autofile.pack.write(self.file, val, dir_pth, fsync=fsync)
+        else:
+            self.file.write(val, dir_pth, fsync=fsync)
 
     def read(self, locs=()):
-        """ read data from this file
+        """ read data from this file (plain or packed)
+
+        """
+        dir_pth = self.dir.path(locs)
+        if not self.file.exists(dir_pth) and autofile.pack.is_packed(dir_pth):
+            return autofile.pack.read(self.file, dir_pth)
+        return self.file.read(dir_pth)
+
+    def frames(self, locs=()):
+        """ frame-by-frame access to this trajectory file
 
         """
-        return self.file.read(self.dir.path(locs))
+        return self.file.frames(self.dir.path(locs))
 
     def remove(self, locs=()):
         """ remove this file
@@ -424,7 +862,13 @@ class DataSeriesFile():
         """
         if self.removable:
             pth = self.path(locs)
+            if not _isfile(pth) and autofile.pack.is_packed(
+                    self.dir.path(locs)):
+                autofile.pack.remove(self.file, self.dir.path(locs))
+                return
+            READ_CACHE.invalidate(pth)
             os.remove(pth)
+            _remove_sidecars(pth)
         else:
             raise ValueError("This data series is not removable")
 
@@ -475,100 +919,256 @@ class JSONObject():
             layered_key.extend(key)
         return layered_key
 
-    def exists(self, key, path):
+    def exists(self, key, path, store=None):
         """ check existance of a json
 
         """
-        exists = True
-        key = self.add_layer(key)
-        json_data = read_json(path)
-        keys = json_data.keys()
-        dct = json_data
-        for nested_key in key:
-            if nested_key in keys:
-                dct = dct[nested_key]
-                keys = dct.keys()
-            else:
-                exists = False
-        if exists:
-            if self.name not in dct:
-                exists = False
-        return exists
+        return self.exists_all([key], path, store=store)[0]
 
-    def read(self, key, path):
-        """ read a key out of a json file
+    @_instrumented('json.exists')
+    def exists_all(self, keys, path, store=None):
+        """ check existance of a json for many keys
 
+        (the json is read once for all of them)
         """
-        json_data = read_json(path)
-        return self._read(key, json_data)
+        store = JSON_FILE_STORE if store is None else store
+        keys = [self.add_layer(key) for key in keys]
+        return [exists for exists, _ in store.read(keys, self.name, path)]
 
-    def _read(self, key, json_data):
+    def read(self, key, path, store=None):
         """ read a key out of a json file
 
         """
-        exists = True
-        key = self.add_layer(key)
-        keys = json_data.keys()
-        dct = json_data
-        for nested_key in key:
-            if nested_key in keys:
-                dct = dct[nested_key]
-                keys = dct.keys()
-            else:
-                exists = False
-        if exists:
-            if self.name in dct:
-                return self.reader_(dct[self.name])
-        return None
+        return self.read_all([key], path, store=store)[0]
 
-    def read_all(self, keys, path):
+    @_instrumented('json.read')
+    def read_all(self, keys, path, store=None):
         """ read a key out of a json file for
 
             many keys
         """
+        store = JSON_FILE_STORE if store is None else store
+        keys = [self.add_layer(key) for key in keys]
+        return [IO_STATS.parse(self.reader_, val) if exists else None
+                for exists, val in store.read(keys, self.name, path)]
+
+    @_instrumented('json.read')
+    def read_existing(self, keys, path, store=None):
+        """ read the keys that exist out of a json file, skipping the rest
+
+        (the json is read once for all of them)
+        """
+        store = JSON_FILE_STORE if store is None else store
+        keys = [self.add_layer(key) for key in keys]
+        return [IO_STATS.parse(self.reader_, val)
+                for exists, val in store.read(keys, self.name, path)
+                if exists]
+
+    def write(self, val, key, path, store=None):
+        """ write a value for a key in a json
+
+        """
+        self.write_all([val], [key], path, store=store)
+
+    @_instrumented('json.write')
+    def write_all(self, vals, all_keys, path, store=None):
+        """ write values for multiple keys in a json
+
+        """
+        store = JSON_FILE_STORE if store is None else store
+        all_keys = [self.add_layer(key) for key in all_keys]
+        vals = [IO_STATS.parse(self.writer_, val) for val in vals]
+        store.write(vals, all_keys, self.name, path)
+
+
+class JSONFileStore():
+    """ keeps json entries nested in a single json file
+
+    (the default)
+
+    :param fsync: flush the json file to disk on each write, before replacing
+        the old one?
+    :type fsync: bool
+    """
+    file_name = 'db.json'
+
+    def __init__(self, fsync=False):
+        self.fsync = fsync
+
+    def create(self, path):
+        """ create an empty json file
+
+        """
+        write_json({}, path, fsync=self.fsync)
+
+    def read(self, keys, name, path):
+        """ read the entries under an object name for several keys
+
+        :returns: whether each entry exists, and its value
+        :rtype: list[tuple(bool, object)]
+        """
         json_data = read_json(path)
+        if IO_STATS.enabled:
+            IO_STATS.count(nbytes=os.path.getsize(path), nstats=1)
         ret = []
         for key in keys:
-            ret.append(self._read(key, json_data))
+            dct = _nested_dict(json_data, key)
+            ret.append((True, dct[name]) if dct is not None and name in dct
+                       else (False, None))
         return ret
 
-    def write(self, val, key, path):
-        """ write a value for a key in a json
+    def write(self, vals, keys, name, path):
+        """ write the entries under an object name for several keys
 
         """
-        key = self.add_layer(key)
-        current_json = read_json(path)
-        keys = current_json.keys()
-        dct = current_json
-        for nested_key in key:
-            if nested_key not in keys:
-                dct[nested_key] = {}
-            dct = dct[nested_key]
-            keys = dct.keys()
-        val = self.writer_(val)
-        dct[self.name] = val
-        write_json(current_json, path)
-
-    def write_all(self, vals, all_keys, path):
-        """ write values for multiple keys in a json
+        self.update([(key, name, val) for key, val in zip(keys, vals)], path)
+
+    def update(self, entries, path):
+        """ write entries, under one lock on the json file
+
+        :param entries: nested key path, object name, and value of each entry
+        :type entries: list[tuple(list[str], str, object)]
+        """
+        def _update(current_json):
+            for key, name, val in entries:
+                dct = current_json
+                for nested_key in key:
+                    dct = dct.setdefault(nested_key, {})
+                dct[name] = val
+
+        autofile.json_.update_json(_update, path, fsync=self.fsync)
+        if IO_STATS.enabled:
+            IO_STATS.count(nbytes=os.path.getsize(path), nstats=1)
+
+    def existing(self, key, path):
+        """ the keys nested directly under a key
+
+        """
+        dct = None
+        if _isfile(path):
+            dct = _nested_dict(read_json(path), key)
+        dct = {} if dct is None else dct
+        return [sub_key for sub_key, val in dct.items()
+                if isinstance(val, dict)]
+
+
+class SQLiteStore():
+    """ keeps json entries as rows of an sqlite database
+
+    (see `autofile.sqlite_`)
+    """
+    file_name = 'db.sqlite'
+
+    def create(self, path):
+        """ create an empty database
+
+        """
+        autofile.sqlite_.create(path)
+
+    def read(self, keys, name, path):
+        """ read the entries under an object name for several keys
+
+        :returns: whether each entry exists, and its value
+        :rtype: list[tuple(bool, object)]
+        """
+        return autofile.sqlite_.read_entries(path, keys, name)
+
+    def write(self, vals, keys, name, path):
+        """ write the entries under an object name for several keys
+
+        """
+        self.update([(key, name, val) for key, val in zip(keys, vals)], path)
+
+    def update(self, entries, path):
+        """ write entries, in one transaction
+
+        :param entries: nested key path, object name, and value of each entry
+        :type entries: list[tuple(list[str], str, object)]
+        """
+        if not _isfile(path):
+            self.create(path)
+        autofile.sqlite_.write_entries(path, entries)
+
+    def existing(self, key, path):
+        """ the keys nested directly under a key
+
+        """
+        return (autofile.sqlite_.existing_keys(path, key)
+                if _isfile(path) else [])
+
+
+class JSONTransaction():
+    """ holds json entry writes to another store in memory, until committed
+
+    Reads see the held writes on top of what is in the store. (see
+    `DataSeries.json_transaction()`)
+
+    :param store: the store to write to
+    :type store: JSONFileStore or SQLiteStore
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.file_name = store.file_name
+        self.entries = collections.defaultdict(dict)
+
+    def create(self, path):
+        """ (the file is created when the writes are committed)
 
         """
-        current_json = read_json(path)
-        for key, val in zip(all_keys, vals):
-            key = self.add_layer(key)
-            keys = current_json.keys()
-            dct = current_json
-            for nested_key in key:
-                if nested_key not in keys:
-                    dct[nested_key] = {}
-                dct = dct[nested_key]
-                keys = dct.keys()
-            val = self.writer_(val)
-            dct[self.name] = val
-        write_json(current_json, path)
 
+    def read(self, keys, name, path):
+        """ read the entries under an object name for several keys
 
-class JSONEntry():
+        :returns: whether each entry exists, and its value
+        :rtype: list[tuple(bool, object)]
+        """
+        ret = (self.store.read(keys, name, path) if _isfile(path)
+               else [(False, None)] * len(keys))
+        held = self.entries[path]
+        return [(True, held[(tuple(key), name)])
+                if (tuple(key), name) in held else found_val
+                for key, found_val in zip(keys, ret)]
+
+    def write(self, vals, keys, name, path):
+        """ write the entries under an object name for several keys
+
+        """
+        self.update([(key, name, val) for key, val in zip(keys, vals)], path)
+
+    def update(self, entries, path):
+        """ write entries
+
+        """
+        for key, name, val in entries:
+            self.entries[path][(tuple(key), name)] = val
+
+    def existing(self, key, path):
+        """ the keys nested directly under a key
+
+        """
+        sub_keys = self.store.existing(key, path)
+        sub_keys.extend(
+            held_key[len(key)] for held_key, _ in self.entries[path]
+            if len(held_key) > len(key) and list(held_key[:len(key)]) == key)
+        return list(dict.fromkeys(sub_keys))
+
+    def commit(self):
+        """ make the held writes to the store, one update per file
+
+        """
+        for path, held in self.entries.items():
+            if held:
+                self.store.update(
+                    [(list(key), name, val)
+                     for (key, name), val in held.items()], path)
+        self.entries.clear()
+
+
+JSON_FILE_STORE = JSONFileStore()
+
+
+class JSONEntry(AsyncFileMixin):
     """ json manager for a given datatype
 
     """
@@ -584,15 +1184,20 @@ class JSONEntry():
         """ does this entry exist?
 
         """
-        ret = False
-        if mapping:
-            ret = self.json.exists(
-                self.jseries.map(key), self.jseries.json_path(
-                    json_layer=self.json.json_layer))
-        else:
-            ret = self.json.exists(key, self.jseries.json_path(
-                json_layer=self.json.json_layer))
-        return ret
+        return self.exists_all([key], mapping=mapping)[0]
+
+    def exists_all(self, keys, mapping=True):
+        """ do these entries exist?
+
+        (the json is read once for all of them)
+
+        :returns: whether each entry exists
+        :rtype: list[bool]
+        """
+        return self.json.exists_all(
+            self._keys(keys, mapping=mapping),
+            self.jseries.json_path(json_layer=self.json.json_layer),
+            store=self.jseries.json_store)
 
     def existing(self, key=()):
         """ returns the keys nested under this key
@@ -606,59 +1211,154 @@ class JSONEntry():
         """ write data to this file
 
         """
-        if not self.jseries.json_exists(json_layer=self.json.json_layer):
-            self.jseries.json_create(json_layer=self.json.json_layer)
         if mapping:
             key = self.jseries.map(key)
         self.json.write(val, key, self.jseries.json_path(
-            json_layer=self.json.json_layer))
+            json_layer=self.json.json_layer), store=self.jseries.json_store)
 
     def write_all(self, vals, keys=(('database_entry')), mapping=True):
         """ write data to this file
 
         """
-        if not self.jseries.json_exists(json_layer=self.json.json_layer):
-            self.jseries.json_create(json_layer=self.json.json_layer)
-        if mapping:
-            new_keys = []
-            for key in keys:
-                new_keys.append(self.jseries.map(key))
-        else:
-            new_keys = keys
-        self.json.write_all(vals, new_keys, self.jseries.json_path(
-            json_layer=self.json.json_layer))
+        self.json.write_all(
+            vals, self._keys(keys, mapping=mapping),
+            self.jseries.json_path(json_layer=self.json.json_layer),
+            store=self.jseries.json_store)
 
     def read(self, key=('database_entry'), mapping=True):
         """ read data from this file
 
         """
-        ret = None
-        if self.exists(key, mapping=mapping):
-            if mapping:
-                ret = self.json.read(
-                    self.jseries.map(key),
-                    self.jseries.json_path(json_layer=self.json.json_layer))
-            else:
-                ret = self.json.read(key, self.jseries.json_path(
-                    json_layer=self.json.json_layer))
-        return ret
+        return self.json.read(
+            self._keys([key], mapping=mapping)[0],
+            self.jseries.json_path(json_layer=self.json.json_layer),
+            store=self.jseries.json_store)
 
     def read_all(self, keys=(('database_entry')), mapping=True):
         """ read data from this file
 
+        (entries that don't exist are left out, and the json is read once
+        for all of them)
         """
-        ret = []
-        new_keys = []
-        for key in keys:
-            if self.exists(key, mapping=mapping):
-                if mapping:
-                    new_keys.append(self.jseries.map(key))
-                else:
-                    new_keys.append(key)
-        if new_keys:
-            ret = self.json.read_all(new_keys, self.jseries.json_path(
-                json_layer=self.json.json_layer))
-        return ret
+        return self.json.read_existing(
+            self._keys(keys, mapping=mapping),
+            self.jseries.json_path(json_layer=self.json.json_layer),
+            store=self.jseries.json_store)
+
+    def _keys(self, keys, mapping=True):
+        """ json keys for these entries
+
+        """
+        return [self.jseries.map(key) for key in keys] if mapping else keys
+
+
+def _index_is_fresh(idx, prefix):
+    """ do the directories above the leaf level still match a locator index?
+
+    A directory whose modification time has changed is listed, and still
+    matches if it has the same subdirectories as before, since only its
+    files changed. (replacing a json file at the prefix changes its
+    modification time, for instance)
+    """
+    children = None
+    for rel_pth, mtime in idx['mtimes'].items():
+        pth = os.path.join(prefix, rel_pth)
+        if _stat(pth).st_mtime_ns == mtime:
+            continue
+
+        if children is None:
+            children = collections.defaultdict(set)
+            for loc_pth in idx['locators']:
+                parts = _os_path_split_all(loc_pth)
+                for num, part in enumerate(parts):
+                    children[os.path.join('', *parts[:num])].add(part)
+        names = [os.path.basename(sub_pth)
+                 for sub_pth in _iterate_directories(pth, 1)]
+        if names != sorted(children[rel_pth]):
+            return False
+    return True
+
+
+def _iterate_directories(prefix, depth, trunk=False):
+    """ iterate over the directories at a given depth below a prefix
+
+    Directories are listed with `os.scandir()`, so that the file type comes
+    from the directory entry, and anything that isn't a directory is pruned
+    at each level. Hidden directories are skipped, as they would be by a
+    glob. Paths are yielded lazily, sorted by name at each level.
+
+    :param prefix: the directory to start from
+    :type prefix: str
+    :param depth: the number of directories below the prefix
+    :type depth: int
+    :param trunk: also yield the directories above the given depth, each one
+        before the directories below it?
+    :type trunk: bool
+    """
+    if depth == 0 or trunk:
+        yield prefix
+
+    if depth > 0:
+        try:
+            IO_STATS.count(nstats=1)
+            with os.scandir(prefix) as entries:
+                names = sorted(entry.name for entry in entries
+                               if not entry.name.startswith('.')
+                               and entry.is_dir())
+        except (FileNotFoundError, NotADirectoryError):
+            names = []
+
+        for name in names:
+            yield from _iterate_directories(
+                os.path.join(prefix, name), depth - 1, trunk=trunk)
+
+
+def _stats_name(obj):
+    """ the name an object's operations are recorded under in `IO_STATS`
+
+    """
+    if isinstance(obj, DataSeries):
+        return getattr(obj.map_, '__name__', repr(obj.map_))
+    return obj.name
+
+
+def _isfile(pth):
+    IO_STATS.count(nstats=1)
+    return os.path.isfile(pth)
+
+
+def _isdir(pth):
+    IO_STATS.count(nstats=1)
+    return os.path.isdir(pth)
+
+
+def _exists(pth):
+    IO_STATS.count(nstats=1)
+    return os.path.exists(pth)
+
+
+def _stat(pth):
+    IO_STATS.count(nstats=1)
+    return os.stat(pth)
+
+
+def _remove_sidecars(pth):
+    """ remove the binary copy and frame index of a data file, if it has them
+
+    """
+    for side_pth in (autofile.data_types.name.array(pth),
+                     autofile.data_types.name.frame_index(pth)):
+        if _isfile(side_pth):
+            os.remove(side_pth)
+
+
+def _normalized_locators(locs):
+    """ locators with their sequences made into lists, for comparison
+
+    """
+    if isinstance(locs, (list, tuple)):
+        locs = [_normalized_locators(loc) for loc in locs]
+    return locs
 
 
 def _path_is_relative(pth):
@@ -699,6 +1399,16 @@ def _remove_layer_from_path(path, json_layer):
     return path
 
 
+def _nested_dict(json_data, key):
+    """ the dictionary nested under a key, or None if there isn't one
+
+    """
+    dct = json_data
+    for nested_key in key:
+        dct = dct.get(nested_key) if isinstance(dct, dict) else None
+    return dct if isinstance(dct, dict) else None
+
+
 def read_json(path):
     """ read a json
 
@@ -707,11 +1417,11 @@ def read_json(path):
     return autofile.json_.read_json(path)
 
 
-def write_json(json_data, path):
+def write_json(json_data, path, fsync=False):
     """ write a json
 
     """
-    autofile.json_.write_json(json_data, path)
+    autofile.json_.write_json(json_data, path, fsync=fsync)
 
 
 def items(path):
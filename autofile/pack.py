@@ -0,0 +1,302 @@
+""" packed storage of the data files of a directory
+
+A leaf directory holds its locator file and a couple of dozen small data
+files, which adds up to tens of millions of inodes over a large tree. In
+packed mode, the data files of a directory are instead kept as the members
+of a single uncompressed zip file (`PACK_FILE`) next to the locator file,
+whose central directory serves as the index.
+
+`DataSeriesFile` reads, writes, and checks for packed files transparently,
+and writes new files into the pack of a directory that has one, or of any
+directory in a series that has been switched over with
+`DataSeries.use_packed_files()`. A plain file takes precedence over a packed
+one of the same name. `DataSeries.pack()` and `DataSeries.unpack()` move
+existing trees back and forth (see also `scripts/leaf_packing`).
+
+Trajectory files are left out of packs, since they are appended to in
+place, and packed reads don't go through the read cache. Pack updates are
+locked through a `PACK_LOCK_FILE` in the parent directory, which is shared
+by all of its packed directories, so that a packed directory only holds its
+locator file and its pack.
+"""
+import io
+import os
+import time
+import zipfile
+import contextlib
+import autofile.io_
+import autofile.data_types.name
+from autofile.stats import IO_STATS
+from autofile._lazy import LazyModule
+
+numpy = LazyModule('numpy')
+
+PACK_FILE = 'files.zip'
+PACK_LOCK_FILE = '.pack.lock'
+
+
+def pack_path(dir_pth):
+    """ path of the pack file of a directory
+
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :rtype: str
+    """
+    return os.path.join(dir_pth, PACK_FILE)
+
+
+def is_packed(dir_pth):
+    """ does this directory have a pack file?
+
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :rtype: bool
+    """
+    IO_STATS.count(nstats=1)
+    return os.path.isfile(pack_path(dir_pth))
+
+
+def packable(dfile):
+    """ can this data file be kept in a pack?
+
+    :param dfile: the data file
+    :type dfile: autofile.model.DataFile
+    :rtype: bool
+    """
+    return dfile.frame_writer_ is None
+
+
+def member_names(dir_pth):
+    """ the names of the files in the pack of a directory
+
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :rtype: list[str]
+    """
+    if not is_packed(dir_pth):
+        return []
+    with zipfile.ZipFile(pack_path(dir_pth)) as zip_obj:
+        return zip_obj.namelist()
+
+
+def exists(dfile, dir_pth):
+    """ is this data file in the pack of a directory?
+
+    :param dfile: the data file
+    :type dfile: autofile.model.DataFile
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :rtype: bool
+    """
+    with _operation('pack.exists', dfile.name):
+        return dfile.name in member_names(dir_pth)
+
+
+def read(dfile, dir_pth):
+    """ read a data file from the pack of a directory
+
+    (the binary copy is read instead of the text, if there is one)
+
+    :param dfile: the data file
+    :type dfile: autofile.model.DataFile
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :returns: the value
+    """
+    arr_name = autofile.data_types.name.array(dfile.name)
+    with _operation('pack.read', dfile.name):
+        members = _read_members(dir_pth, [dfile.name, arr_name])
+        assert dfile.name in members, (
+            f'Requested file {dfile} is not packed in {dir_pth}'
+        )
+
+        if dfile.array_reader_ is not None and arr_name in members:
+            IO_STATS.count(nbytes=len(members[arr_name]))
+            arr = numpy.load(io.BytesIO(members[arr_name]),
+                             allow_pickle=False)
+            return IO_STATS.parse(dfile.array_reader_, arr)
+
+        IO_STATS.count(nbytes=len(members[dfile.name]))
+        val_str = members[dfile.name].decode('utf-8')
+        return IO_STATS.parse(dfile.reader_, val_str)
+
+
+def write(dfile, val, dir_pth, fsync=False):
+    """ write a data file into the pack of a directory
+
+    (the pack is created if there isn't one, and a plain copy of the file is
+    removed, so that it doesn't hide the packed one)
+
+    :param dfile: the data file
+    :type dfile: autofile.model.DataFile
+    :param val: value to be written
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :param fsync: flush the pack to disk before replacing the old one?
+    :type fsync: bool
+    """
+    assert os.path.exists(dir_pth), (
+        f'No path exists: {dir_pth}'
+    )
+    assert packable(dfile), f'{dfile} is not packable'
+    arr_name = autofile.data_types.name.array(dfile.name)
+    with _operation('pack.write', dfile.name):
+        val_str = IO_STATS.parse(dfile.writer_, val)
+        members = {dfile.name: val_str.encode('utf-8'), arr_name: None}
+        if dfile.binary and dfile.array_reader_ is not None:
+            arr_obj = io.BytesIO()
+            numpy.save(arr_obj, numpy.asarray(val, dtype=float),
+                       allow_pickle=False)
+            members[arr_name] = arr_obj.getvalue()
+        IO_STATS.count(nbytes=sum(map(len, filter(None, members.values()))))
+        update(dir_pth, members, fsync=fsync)
+        _remove_plain(dir_pth, [dfile.name, arr_name])
+
+
+def remove(dfile, dir_pth):
+    """ remove a data file from the pack of a directory
+
+    :param dfile: the data file
+    :type dfile: autofile.model.DataFile
+    :param dir_pth: directory path
+    :type dir_pth: str
+    """
+    arr_name = autofile.data_types.name.array(dfile.name)
+    with _operation('pack.remove', dfile.name):
+        update(dir_pth, {dfile.name: None, arr_name: None})
+
+
+def update(dir_pth, members, fsync=False):
+    """ add, replace, and remove files in the pack of a directory
+
+    The pack is rewritten to a temporary file and moved into place, under
+    the pack lock of the parent directory, so readers see either the old
+    pack or the new one and concurrent updates aren't lost. A pack left with
+    no files is removed.
+
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :param members: the contents of each file, or None to remove it
+    :type members: dict[str: bytes]
+    :param fsync: flush the pack to disk before replacing the old one?
+    :type fsync: bool
+    """
+    pth = pack_path(dir_pth)
+    with _lock(dir_pth):
+        current = _read_members(dir_pth) if os.path.isfile(pth) else {}
+        current.update(members)
+        current = {name: data for name, data in current.items()
+                   if data is not None}
+
+        if not current:
+            if os.path.isfile(pth):
+                os.remove(pth)
+            return
+
+        zip_bytes = io.BytesIO()
+        with zipfile.ZipFile(zip_bytes, mode='w',
+                             compression=zipfile.ZIP_STORED) as zip_obj:
+            date_time = time.localtime()[:6]
+            for name, data in sorted(current.items()):
+                zip_obj.writestr(
+                    zipfile.ZipInfo(name, date_time=date_time), data)
+        autofile.io_.write_bytes(pth, zip_bytes.getvalue(), fsync=fsync)
+
+
+def pack_directory(dir_pth, dfiles):
+    """ move the plain data files of a directory into its pack
+
+    (files that aren't there, and trajectory files, are left alone)
+
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :param dfiles: the data files
+    :type dfiles: list[autofile.model.DataFile]
+    :returns: the names of the files that were packed
+    :rtype: list[str]
+    """
+    members = {}
+    for dfile in filter(packable, dfiles):
+        txt_pth = dfile.path(dir_pth)
+        arr_pth = autofile.data_types.name.array(txt_pth)
+        if not os.path.isfile(txt_pth):
+            continue
+
+        members[dfile.name] = _read_bytes(txt_pth)
+        # A binary copy is only kept if the text file isn't newer
+        arr_name = os.path.basename(arr_pth)
+        members[arr_name] = None
+        if (os.path.isfile(arr_pth) and os.stat(arr_pth).st_mtime_ns
+                >= os.stat(txt_pth).st_mtime_ns):
+            members[arr_name] = _read_bytes(arr_pth)
+
+    if members:
+        update(dir_pth, members)
+        _remove_plain(dir_pth, list(members))
+    return [name for name, data in members.items() if data is not None]
+
+
+def unpack_directory(dir_pth):
+    """ move the files in the pack of a directory back out as plain files
+
+    (binary copies are written after the text files, so that they are
+    used on the next read)
+
+    :param dir_pth: directory path
+    :type dir_pth: str
+    :returns: the names of the files that were unpacked
+    :rtype: list[str]
+    """
+    if not is_packed(dir_pth):
+        return []
+
+    arr_ext = autofile.data_types.name.Extension.ARRAY
+    with _lock(dir_pth):
+        members = _read_members(dir_pth)
+        names = sorted(members, key=lambda name: name.endswith(arr_ext))
+        for name in names:
+            autofile.io_.write_bytes(os.path.join(dir_pth, name),
+                                     members[name])
+        os.remove(pack_path(dir_pth))
+    return names
+
+
+def _lock(dir_pth):
+    """ lock the pack of a directory, through the parent directory
+
+    (the pack itself is replaced on each update, so it can't hold the lock)
+    """
+    parent_pth = os.path.dirname(os.path.abspath(dir_pth))
+    return autofile.io_.lock_directory(parent_pth, PACK_LOCK_FILE)
+
+
+def _read_members(dir_pth, names=None):
+    """ read the files in a pack, by name (all of them if names is None)
+    """
+    with zipfile.ZipFile(pack_path(dir_pth)) as zip_obj:
+        found = zip_obj.namelist()
+        if names is not None:
+            found = [name for name in found if name in names]
+        return {name: zip_obj.read(name) for name in found}
+
+
+def _read_bytes(file_path):
+    with open(file_path, mode='rb') as file_obj:
+        return file_obj.read()
+
+
+def _remove_plain(dir_pth, names):
+    """ remove the plain copies of files that are now packed
+    """
+    for name in names:
+        pth = os.path.join(dir_pth, name)
+        if os.path.isfile(pth):
+            os.remove(pth)
+
+
+def _operation(kind, name):
+    """ record an operation in `IO_STATS`, if it is on
+    """
+    if IO_STATS.enabled:
+        return IO_STATS.operation(kind, name)
+    return contextlib.nullcontext()
@@ -5,10 +5,74 @@ import pickle
 import base64
 import hashlib
 import numbers
+import inspect
 import datetime
-import automol
-import autoparse.pattern as app
-import autoparse.find as apf
+import functools
+from autofile._safemode import safemode_is_on
+from autofile._lazy import LazyModule
+
+automol = LazyModule('automol')
+app = LazyModule('autoparse.pattern')
+apf = LazyModule('autoparse.find')
+
+
+def memoize_locator_map(maxsize=4096):
+    """ bounded memoization for a locator-to-directory-name mapping
+
+    The locators are converted into a hashable key that keeps track of their
+    types (so that `1` and `1.0`, or a list and a tuple, aren't confused),
+    along with the safemode setting, since it changes which checks are run.
+    Only successful calls are cached, so invalid locators fail every time.
+    Locators that can't be made hashable skip the cache.
+
+    The wrapped function has the `cache_info()` and `cache_clear()` methods
+    from `functools.lru_cache`.
+
+    :param maxsize: the most directory names to hold
+    :type maxsize: int
+    """
+    def _decorator(function):
+
+        @functools.lru_cache(maxsize=maxsize)
+        def _cached_function(key):
+            _, args_key = key
+            return function(*_thaw(args_key))
+
+        @functools.wraps(function)
+        def _function(*args):
+            key = (safemode_is_on(), _freeze(args))
+            try:
+                hash(key)
+            except TypeError:
+                return function(*args)
+            return _cached_function(key)
+
+        # the argument count is used to set the number of locators
+        _function.__signature__ = inspect.signature(function)
+        _function.cache_info = _cached_function.cache_info
+        _function.cache_clear = _cached_function.cache_clear
+        return _function
+
+    return _decorator
+
+
+def _freeze(obj):
+    """ a hashable key for a locator value, which records its type
+    """
+    if isinstance(obj, (list, tuple)):
+        key = (type(obj), tuple(map(_freeze, obj)))
+    else:
+        key = (type(obj), obj)
+    return key
+
+
+def _thaw(key):
+    """ the locator value for a key from `_freeze()`
+    """
+    typ, val = key
+    if typ in (list, tuple):
+        val = typ(map(_thaw, val))
+    return val
 
 
 def is_valid_inchi_multiplicity(ich, mul, chg=0):
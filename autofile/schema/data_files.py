@@ -52,8 +52,7 @@ def locator(file_prefix, map_dct_, loc_keys):
         return autofile.data_types.swrite.information(inf_obj)
 
     def reader_(inf_str):
-        inf_obj = autofile.data_types.sread.information(inf_str)
-        inf_dct = dict(inf_obj)
+        inf_dct = autofile.data_types.sread.information_dict(inf_str)
         return list(map(inf_dct.__getitem__, loc_keys))
 
     name = autofile.data_types.name.information(file_prefix)
@@ -121,32 +120,58 @@ def geometry(file_prefix):
     return model.DataFile(name=name, writer_=writer_, reader_=reader_)
 
 
-def gradient(file_prefix):
+def gradient(file_prefix, binary=False, array=False):
     """ generate gradient DataFile
 
+    A binary (.npy) copy of the gradient is read in place of the text file
+    whenever one is present.
+
     :param file_prefix: path to file
     :type file_prefix: str
+    :param binary: write a binary copy along with the text file?
+    :type binary: bool
+    :param array: read the gradient as a numpy array, instead of nested tuples?
+    :type array: bool
     :return: instance of DataFile class
     :rtype: Datafile
     """
+    def reader_(grad_str):
+        return autofile.data_types.sread.gradient(grad_str, array=array)
+
+    def array_reader_(grad):
+        return autofile.data_types.sread.gradient_from_array(grad, array=array)
+
     name = autofile.data_types.name.gradient(file_prefix)
     writer_ = autofile.data_types.swrite.gradient
-    reader_ = autofile.data_types.sread.gradient
-    return model.DataFile(name=name, writer_=writer_, reader_=reader_)
+    return model.DataFile(name=name, writer_=writer_, reader_=reader_,
+                          array_reader_=array_reader_, binary=binary)
 
 
-def hessian(file_prefix):
+def hessian(file_prefix, binary=False, array=False):
     """ generate hessian DataFile
 
+    A binary (.npy) copy of the hessian is read in place of the text file
+    whenever one is present.
+
     :param file_prefix: path to file
     :type file_prefix: str
+    :param binary: write a binary copy along with the text file?
+    :type binary: bool
+    :param array: read the hessian as a numpy array, instead of nested tuples?
+    :type array: bool
     :return: instance of DataFile class
     :rtype: Datafile
     """
+    def reader_(hess_str):
+        return autofile.data_types.sread.hessian(hess_str, array=array)
+
+    def array_reader_(hess):
+        return autofile.data_types.sread.hessian_from_array(hess, array=array)
+
     name = autofile.data_types.name.hessian(file_prefix)
     writer_ = autofile.data_types.swrite.hessian
-    reader_ = autofile.data_types.sread.hessian
-    return model.DataFile(name=name, writer_=writer_, reader_=reader_)
+    return model.DataFile(name=name, writer_=writer_, reader_=reader_,
+                          array_reader_=array_reader_, binary=binary)
 
 
 def harmonic_frequencies(file_prefix):
@@ -320,7 +345,11 @@ def trajectory(file_prefix):
     name = autofile.data_types.name.trajectory(file_prefix)
     writer_ = autofile.data_types.swrite.trajectory
     reader_ = autofile.data_types.sread.trajectory
-    return model.DataFile(name=name, writer_=writer_, reader_=reader_)
+    frame_writer_ = autofile.data_types.swrite.trajectory_frame
+    frame_reader_ = autofile.data_types.sread.trajectory_frame
+    return model.DataFile(name=name, writer_=writer_, reader_=reader_,
+                          frame_writer_=frame_writer_,
+                          frame_reader_=frame_reader_)
 
 
 def reaction(file_prefix):
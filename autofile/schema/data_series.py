@@ -2,10 +2,12 @@
 """
 
 from inspect import getfullargspec as function_argspec
-import automol
 from autofile import model
 from autofile.schema import loc_maps
 from autofile.schema import data_files
+from autofile._lazy import LazyModule
+
+automol = LazyModule('automol')
 
 
 SPEC_FILE_PREFIX = 'dir'
@@ -2,9 +2,11 @@
 """
 
 import numbers
-import numpy
 import autofile.info
 from autofile.schema._util import utc_time as _utc_time
+from autofile._lazy import LazyModule
+
+numpy = LazyModule('numpy')
 
 
 def conformer_trunk(nsamp):
@@ -3,8 +3,6 @@
 import os
 import string
 import numbers
-import elstruct
-import automol
 from autofile._safemode import safemode_is_on
 from autofile.schema._util import (is_valid_inchi_multiplicity as
                                    _is_valid_inchi_multiplicity)
@@ -13,6 +11,15 @@ from autofile.schema._util import (random_string_identifier as
                                    _random_string_identifier)
 from autofile.schema._util import (is_random_string_identifier as
                                    _is_random_string_identifier)
+from autofile.schema._util import memoize_locator_map as _memoize
+from autofile._lazy import LazyModule
+
+elstruct = LazyModule('elstruct')
+automol = LazyModule('automol')
+
+
+# The mappings that go through InChI or elstruct are memoized, since they
+# are called for every path() on these layers and the layers below them
 
 
 # Specifier mappings for species-specific layers
@@ -22,6 +29,7 @@ def species_trunk():
     return 'SPC'
 
 
+@_memoize()
 def species_leaf(ich, chg, mul):
     """ species leaf directory name
     """
@@ -57,6 +65,7 @@ def reaction_trunk():
     return 'RXN'
 
 
+@_memoize()
 def reaction_leaf(rxn_ichs, rxn_chgs, rxn_muls, ts_mul):
     """ reaction leaf directory name
     """
@@ -126,6 +135,7 @@ def _sortable_representation(ichs, chgs, muls):
     return (len(ichs), ichs, chgs, muls)
 
 
+@_memoize()
 def _reactant_leaf(ichs, chgs, muls):
     """ reactant leaf directory name
     """
@@ -172,6 +182,7 @@ def transition_state_leaf(num):
 
 
 # Specifier mappings for layers used by both species and reaction file systems
+@_memoize()
 def theory_leaf(method, basis, orb_type):
     """ theory leaf directory name
 
@@ -0,0 +1,173 @@
+""" load and dump json entries to sqlite databases
+
+An alternative to the single json file, for databases that see many
+writers or grow large. Each entry is a row keyed by its nested key path
+and its object name, so writes are per-entry upserts rather than a
+rewrite of the whole database, and lookups go through the primary key
+index. Values are stored json-encoded, so they read back exactly as they
+would from the json file.
+"""
+import os
+import json
+import sqlite3
+import contextlib
+import autofile.json_
+
+
+TIMEOUT = autofile.json_.LOCK_TIMEOUT
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (key, name)
+) WITHOUT ROWID
+"""
+
+
+def create(file_path):
+    """ create an empty database, if there isn't one
+
+    (the database is put in write-ahead-log mode, so that readers don't
+    block the writer or each other)
+
+    :param file_path: path of the database file
+    :type file_path: str
+    """
+    with _connection(file_path) as conn:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(_SCHEMA)
+
+
+def read_entries(file_path, keys, name):
+    """ read entries for several keys
+
+    :param file_path: path of the database file
+    :type file_path: str
+    :param keys: nested key paths of the entries
+    :type keys: list[list[str]]
+    :param name: the object name
+    :type name: str
+    :return: whether each entry was found, and its value
+    :rtype: list[tuple(bool, object)]
+    """
+    assert os.path.isfile(file_path)
+    with _connection(file_path) as conn:
+        ret = []
+        for key in keys:
+            row = conn.execute(
+                'SELECT value FROM entries WHERE key = ? AND name = ?',
+                (_key_string(key), name)).fetchone()
+            ret.append((False, None) if row is None
+                       else (True, json.loads(row[0])))
+    return ret
+
+
+def write_entries(file_path, entries):
+    """ write entries, replacing any that are there
+
+    (the entries are written in one transaction)
+
+    :param file_path: path of the database file
+    :type file_path: str
+    :param entries: nested key path, object name, and value of each entry
+    :type entries: list[tuple(list[str], str, object)]
+    """
+    rows = [(_key_string(key), name, json.dumps(val, ensure_ascii=False))
+            for key, name, val in entries]
+    with _connection(file_path) as conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO entries (key, name, value) '
+            'VALUES (?, ?, ?)', rows)
+
+
+def existing_keys(file_path, key=()):
+    """ the keys nested directly under a key
+
+    :param file_path: path of the database file
+    :type file_path: str
+    :param key: nested key path
+    :type key: list[str]
+    :rtype: list[str]
+    """
+    key = list(key)
+    # Key paths under this one share the start of its string encoding
+    prefix = _key_string(key)[:-1] + (', ' if key else '')
+    with _connection(file_path) as conn:
+        rows = conn.execute(
+            'SELECT DISTINCT key FROM entries WHERE substr(key, 1, ?) = ?',
+            (len(prefix), prefix)).fetchall()
+    # The key itself shares the prefix too, if it has entries of its own
+    key_lsts = (json.loads(key_str) for key_str, in rows)
+    sub_keys = [key_lst[len(key)] for key_lst in key_lsts
+                if len(key_lst) > len(key)]
+    return list(dict.fromkeys(sub_keys))
+
+
+def from_json(json_path, file_path, names=()):
+    """ import the entries in a json database into an sqlite one
+
+    Every value in the json file that isn't a dictionary is taken to be an
+    entry, as are dictionaries under one of the given object names.
+
+    :param json_path: path of the json file
+    :type json_path: str
+    :param file_path: path of the database file
+    :type file_path: str
+    :param names: object names whose values are dictionaries
+    :type names: tuple[str]
+    """
+    entries = []
+
+    def _flatten(dct, key):
+        for sub_key, val in dct.items():
+            if isinstance(val, dict) and sub_key not in names:
+                _flatten(val, key + [sub_key])
+            else:
+                entries.append((key, sub_key, val))
+
+    _flatten(autofile.json_.read_json(json_path), [])
+    create(file_path)
+    write_entries(file_path, entries)
+
+
+def to_json(file_path, json_path):
+    """ export the entries in an sqlite database to a json one
+
+    :param file_path: path of the database file
+    :type file_path: str
+    :param json_path: path of the json file
+    :type json_path: str
+    """
+    json_dct = {}
+    with _connection(file_path) as conn:
+        rows = conn.execute(
+            'SELECT key, name, value FROM entries ORDER BY key, name')
+        for key_str, name, val_str in rows:
+            dct = json_dct
+            for nested_key in json.loads(key_str):
+                dct = dct.setdefault(nested_key, {})
+            dct[name] = json.loads(val_str)
+    autofile.json_.write_json(json_dct, json_path)
+
+
+@contextlib.contextmanager
+def _connection(file_path):
+    """ a connection to the database, which commits on exit
+
+    (the changes are rolled back instead if anything goes wrong)
+    """
+    conn = sqlite3.connect(file_path, timeout=TIMEOUT)
+    try:
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _key_string(key):
+    """ encode a nested key path as a string
+    """
+    return json.dumps(list(key), ensure_ascii=False)
@@ -0,0 +1,156 @@
+""" instrumentation of file operations
+
+`IO_STATS` records the operations made through `autofile.model`, when it is
+turned on, to show which layers and file types the time goes to:
+
+    with autofile.stats.IO_STATS.collect() as stats:
+        ...
+    stats.dump('stats.json')
+"""
+import json
+import time
+import threading
+import contextlib
+import autofile.io_
+
+
+class IOStats():
+    """ counts, bytes, wall time, stat calls, and parse time of file operations
+
+    Operations are recorded by kind, such as 'file.read' or 'series.existing',
+    and by the name of the data file, json object, or data series (its
+    locator mapping) that made them. Recording is off until `enable()` is
+    called, and then every operation is also passed to the callback, if one
+    is set, as `callback(kind, name, counts)`.
+
+    The time of an operation includes that of any operations it makes,
+    such as the locator file reads inside `existing()`, but its other counts
+    don't. Parse time is the time spent converting values to and from
+    strings, and directory listings count as stat calls.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.callback = None
+        self._totals = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, callback=None):
+        """ start recording operations
+
+        :param callback: called with the kind, name, and counts of each
+            operation as it finishes
+        :type callback: callable[(str, str, dict)->None]
+        """
+        self.enabled = True
+        self.callback = callback
+
+    def disable(self):
+        """ stop recording operations (the totals are kept)
+        """
+        self.enabled = False
+        self.callback = None
+
+    def is_enabled(self):
+        """ is recording on?
+        """
+        return self.enabled
+
+    @contextlib.contextmanager
+    def collect(self, callback=None):
+        """ record operations inside a block
+
+        (recording is put back the way it was on exit)
+        """
+        enabled, prev_callback = self.enabled, self.callback
+        self.enable(callback=callback)
+        try:
+            yield self
+        finally:
+            self.enabled, self.callback = enabled, prev_callback
+
+    @contextlib.contextmanager
+    def operation(self, kind, name):
+        """ record the operation made inside a block
+        """
+        stack = self._stack()
+        counts = {'count': 1, 'bytes': 0, 'seconds': 0., 'stat_calls': 0,
+                  'parse_seconds': 0.}
+        stack.append(counts)
+        start = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            counts['seconds'] = time.perf_counter() - start
+            stack.pop()
+            self._record(kind, name, counts)
+
+    def count(self, nbytes=0, nstats=0, parse_seconds=0.):
+        """ add to the counts of the operation in progress on this thread
+        """
+        if self.enabled:
+            stack = self._stack()
+            if stack:
+                stack[-1]['bytes'] += nbytes
+                stack[-1]['stat_calls'] += nstats
+                stack[-1]['parse_seconds'] += parse_seconds
+
+    def parse(self, convert_, val):
+        """ convert a value, counting the time taken as parse time
+        """
+        if not self.enabled:
+            return convert_(val)
+
+        start = time.perf_counter()
+        ret = convert_(val)
+        self.count(parse_seconds=time.perf_counter() - start)
+        return ret
+
+    def as_dict(self):
+        """ the totals, by kind of operation and then by name
+
+        :rtype: dict[str: dict[str: dict]]
+        """
+        with self._lock:
+            return {kind: {name: dict(counts)
+                           for name, counts in name_dct.items()}
+                    for kind, name_dct in self._totals.items()}
+
+    def dump(self, file_path):
+        """ write the totals to a json file
+
+        :param file_path: path of the json file
+        :type file_path: str
+        """
+        autofile.io_.write_file(
+            file_path, json.dumps(self.as_dict(), indent=2, sort_keys=True))
+
+    def clear(self):
+        """ drop the totals
+        """
+        with self._lock:
+            self._totals.clear()
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _record(self, kind, name, counts):
+        with self._lock:
+            totals = self._totals.setdefault(kind, {}).setdefault(
+                name, dict.fromkeys(counts, 0))
+            for key, val in counts.items():
+                totals[key] += val
+        callback = self.callback
+        if callback is not None:
+            callback(kind, name, counts)
+
+    def __repr__(self):
+        nops = sum(counts['count'] for name_dct in self.as_dict().values()
+                   for counts in name_dct.values())
+        return f"IOStats(enabled={self.enabled}, operations={nops})"
+
+
+IO_STATS = IOStats()
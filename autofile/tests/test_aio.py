@@ -0,0 +1,92 @@
+""" test autofile.aio
+"""
+
+import os
+import asyncio
+import tempfile
+import autofile.aio
+import autofile.model
+import autofile.schema
+
+
+PREFIX = tempfile.mkdtemp()
+print(PREFIX)
+
+LOC_DFILE = autofile.schema.data_files.locator(
+    file_prefix='dir',
+    map_dct_={
+        'loc1': lambda locs: locs[0],
+        'loc2': lambda locs: locs[1],
+    },
+    loc_keys=['loc1', 'loc2'],
+)
+
+
+def test__coroutines():
+    """ test the coroutines of autofile.model objects
+    """
+    prefix = os.path.join(PREFIX, 'coroutines')
+    os.mkdir(prefix)
+
+    dseries = autofile.model.DataSeries(
+        prefix, map_=lambda locs: os.path.join(*map(str, locs)), nlocs=2,
+        depth=2, loc_dfile=LOC_DFILE)
+    dseries.add_data_files({
+        'energy': autofile.model.DataFile('ene', writer_=str, reader_=float)})
+    dseries.add_json_entries({
+        'energy': autofile.model.JSONObject(name='test.ene')})
+
+    locs_lst = [[num, 'a'] for num in range(50)]
+    for locs in locs_lst:
+        dseries.create(locs)
+
+    async def _main():
+        await asyncio.gather(*(
+            dseries.file.energy.awrite(float(locs[0]), locs)
+            for locs in locs_lst))
+        enes = await asyncio.gather(*(
+            dseries.file.energy.aread(locs) for locs in locs_lst))
+        assert enes == [float(locs[0]) for locs in locs_lst]
+        assert await dseries.file.energy.aexists([0, 'a'])
+        assert not await dseries.file.energy.aexists([0, 'b'])
+        assert await dseries.file.energy.file.aexists(dseries.path([0, 'a']))
+
+        await dseries.json.energy.awrite(-40.1, ['x'])
+        assert await dseries.json.energy.aread(['x']) == -40.1
+        assert await dseries.json.energy.aexists(['x'])
+
+        return [locs async for locs in dseries.aexisting()]
+
+    # the concurrency limit is per event loop, so the executor can be shared
+    # across several
+    autofile.aio.ASYNC_EXECUTOR.configure(max_workers=4, limit=2)
+    assert sorted(asyncio.run(_main())) == locs_lst
+    assert sorted(asyncio.run(_main())) == locs_lst
+    autofile.aio.ASYNC_EXECUTOR.configure(max_workers=32, limit=None)
+
+
+def test__configure():
+    """ test autofile.aio.AsyncExecutor.configure
+    """
+    executor = autofile.aio.AsyncExecutor(max_workers=2)
+    executor.configure(limit=1)
+    executor.configure(max_workers=4)
+    assert (executor.max_workers, executor.limit) == (4, 1)
+    executor.configure(limit=None)
+    assert (executor.max_workers, executor.limit) == (4, None)
+    executor.shutdown()
+
+
+def test__iterate():
+    """ test autofile.aio.AsyncExecutor.iterate
+    """
+    executor = autofile.aio.AsyncExecutor(max_workers=2)
+
+    async def _collect(count, chunk_size):
+        return [num async for num in executor.iterate(
+            iter(range(count)), chunk_size=chunk_size)]
+
+    assert asyncio.run(_collect(0, 3)) == []
+    assert asyncio.run(_collect(6, 3)) == list(range(6))
+    assert asyncio.run(_collect(7, 3)) == list(range(7))
+    executor.shutdown()
@@ -2,7 +2,10 @@
 """
 
 import os
+import json
+import tarfile
 import tempfile
+import autofile
 from autofile import directory_to_dictionary
 
 
@@ -99,6 +102,52 @@ def test__():
     assert REF_DCT == dct
 
 
+def test__iterate_directory():
+    """ test iterate_directory and the tar and json lines sinks
+    """
+    prefix = tempfile.mkdtemp()
+    _build_fs(prefix)
+    with open(os.path.join(prefix, 'A', 'x.npy'), 'wb') as fobj:
+        fobj.write(b'\x93NUMPY\xff')
+    with open(os.path.join(prefix, 'B', 'big.dat'), 'w',
+              encoding='utf-8') as fobj:
+        fobj.write('<big str>')
+    with open(os.path.join(prefix, 'B', 'crlf.dat'), 'wb') as fobj:
+        fobj.write(b'a\r\nb\r\n')
+
+    records = list(autofile.iterate_directory(prefix, max_size=8))
+    assert records[:3] == [('A', 'directory', None),
+                           ('A/i', 'directory', None),
+                           ('A/i/Ai.dat', 'file', '<str>')]
+    assert ('A/x.npy', 'binary', b'\x93NUMPY\xff') in records
+    assert ('B/big.dat', 'file', None) in records
+    assert ('B/crlf.dat', 'file', 'a\nb\n') in records
+    assert list(autofile.iterate_directory(
+        prefix, max_size=8, workers=3)) == records
+
+    # exclude prunes whole directories, include only applies to files
+    rel_paths = [rel_path for rel_path, _, _ in autofile.iterate_directory(
+        prefix, include=('*p.dat',), exclude=('B', 'A/j/q'))]
+    assert rel_paths == ['A', 'A/i', 'A/i/p', 'A/i/p/Aip.dat', 'A/i/q',
+                         'A/j', 'A/j/p', 'A/j/p/Ajp.dat']
+
+    tar_path = os.path.join(prefix, 'snapshot.tar')
+    autofile.directory_to_tar(prefix, tar_path, exclude=('*.tar',))
+    with tarfile.open(tar_path) as tar_obj:
+        assert tar_obj.getnames() == [rel_path for rel_path, _, _ in records]
+        assert tar_obj.extractfile('A/x.npy').read() == b'\x93NUMPY\xff'
+
+    jsonl_path = os.path.join(prefix, 'snapshot.jsonl')
+    autofile.directory_to_jsonl(
+        prefix, jsonl_path, exclude=('*.tar', '*.jsonl'), max_size=8)
+    with open(jsonl_path, encoding='utf-8') as fobj:
+        lines = [json.loads(line) for line in fobj]
+    assert [line['path'] for line in lines] == [
+        rel_path for rel_path, _, _ in records]
+    assert {'path': 'A/x.npy', 'type': 'binary',
+            'content': 'k05VTVBZ/w=='} in lines
+
+
 def _build_fs(dir_path):
     """ make a fake filesystem
     """
@@ -1,6 +1,7 @@
 """ test autofile.schema.data_files
 """
 
+import os
 import numbers
 import tempfile
 import numpy
@@ -238,6 +239,38 @@ def test__data_files__trajectory():
     # are for human use only -- we aren't going to use this for data storage
 
 
+def test__data_files__trajectory_frames():
+    """ test autofile.schema.data_files.trajectory frame access
+    """
+    ref_geo = (('C', (0.0, 0.0, 0.0)),
+               ('O', (0.0, 0.0, 2.699694868173)),
+               ('H', (1.684063451772, -0.943916309940, -0.779079279468)))
+    ref_traj = [(ref_geo, f'step {idx}') for idx in range(5)]
+
+    traj_dfile = autofile.schema.data_files.trajectory('frames')
+    traj_dfile.write(ref_traj[:3], PREFIX)
+
+    traj = traj_dfile.frames(PREFIX)
+    assert len(traj) == 3
+    assert os.path.exists(traj.index_path())
+
+    geo, comment = traj[-1]
+    assert automol.geom.almost_equal(geo, ref_geo)
+    assert comment == 'step 2'
+
+    # Appending extends the file and its index in place
+    offsets = traj.offsets()
+    traj.extend(ref_traj[3:])
+    assert traj.offsets()[:3] == offsets
+    assert [comment for _, comment in traj] == [
+        comment for _, comment in ref_traj]
+
+    # A fresh reader picks up the saved index, and a rewrite replaces it
+    assert len(traj_dfile.frames(PREFIX)) == 5
+    traj_dfile.write(ref_traj[:1], PREFIX)
+    assert len(traj_dfile.frames(PREFIX)) == 1
+
+
 def test__data_files__lennard_jones_epsilon():
     """ test autofile.schema.data_files.lennard_jones_epsilon
     """
@@ -329,3 +362,98 @@ def test__data_files__polarizability():
 
     tensor = tensor_dfile.read(PREFIX)
     assert numpy.allclose(tensor, ref_tensor)
+
+
+def test__data_files__read_cache():
+    """ test the read cache for autofile.model.DataFile.read
+    """
+    prefix = tempfile.mkdtemp(dir=PREFIX)
+    cache = autofile.model.READ_CACHE
+    cache.enable(max_entries=2)
+    try:
+        ene_dfile = autofile.schema.data_files.energy('test')
+        ene_dfile.write(-187.38518341, prefix)
+
+        # the second read is a hit
+        assert ene_dfile.read(prefix) == -187.38518341
+        assert ene_dfile.read(prefix) == -187.38518341
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # writing drops the entry
+        ene_dfile.write(-187.0, prefix)
+        assert ene_dfile.read(prefix) == -187.0
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # so does changing the file some other way
+        with open(ene_dfile.path(prefix), mode='w', encoding='utf-8') as fobj:
+            fobj.write('-186.5')
+        assert ene_dfile.read(prefix) == -186.5
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        # the least recently used entries are evicted past the bound
+        for name in ('test1', 'test2'):
+            dfile = autofile.schema.data_files.energy(name)
+            dfile.write(-1.0, prefix)
+            dfile.read(prefix)
+        assert ene_dfile.read(prefix) == -186.5
+        assert (cache.hits, cache.misses) == (1, 6)
+
+        # data files that read the same file differently don't share values
+        cache.clear()
+        ref_hess = ((1., 2.), (2., 1.))
+        autofile.schema.data_files.hessian('test').write(ref_hess, prefix)
+        hess_dfile = autofile.schema.data_files.hessian('test')
+        assert hess_dfile.read(prefix) == ref_hess
+        assert hess_dfile.read(prefix) is hess_dfile.read(prefix)
+        hess = autofile.schema.data_files.hessian('test', array=True).read(
+            prefix)
+        assert isinstance(hess, numpy.ndarray)
+
+        # values that can be modified are copied
+        hess_dfile = autofile.schema.data_files.hessian('test', array=True)
+        hess_dfile.read(prefix)[0, 0] = 0.
+        assert hess_dfile.read(prefix)[0, 0] == 1.
+    finally:
+        cache.disable()
+
+
+def test__data_files__hessian_binary():
+    """ test autofile.schema.data_files.hessian, with a binary copy
+    """
+    prefix = tempfile.mkdtemp(dir=PREFIX)
+    ref_hess = numpy.arange(81.).reshape(9, 9)
+    ref_hess = (ref_hess + ref_hess.T) / 100.
+
+    hess_dfile = autofile.schema.data_files.hessian(
+        'test', binary=True, array=True)
+    hess_dfile.write(ref_hess, prefix)
+    assert os.path.isfile(hess_dfile.array_path(prefix))
+
+    # the binary copy is read in place of the text file
+    hess = hess_dfile.read(prefix)
+    assert isinstance(hess, numpy.ndarray)
+    assert numpy.array_equal(hess, ref_hess)
+
+    # ... also by a data file that doesn't write one
+    hess = autofile.schema.data_files.hessian('test').read(prefix)
+    assert isinstance(hess, tuple)
+    assert numpy.array_equal(hess, ref_hess)
+
+    # the binary copy is skipped if the text file is newer
+    hess_pth = hess_dfile.path(prefix)
+    with open(hess_pth, mode='w', encoding='utf-8') as fobj:
+        fobj.write(autofile.data_types.swrite.hessian(2. * ref_hess))
+    arr_stat = os.stat(hess_dfile.array_path(prefix))
+    os.utime(hess_pth, ns=(arr_stat.st_atime_ns, arr_stat.st_mtime_ns + 1))
+    assert numpy.allclose(hess_dfile.read(prefix), 2. * ref_hess)
+
+    # writing without a binary copy removes the old one
+    hess_dfile.write(ref_hess, prefix)
+    autofile.schema.data_files.hessian('test').write(3. * ref_hess, prefix)
+    assert not os.path.isfile(hess_dfile.array_path(prefix))
+    assert numpy.allclose(hess_dfile.read(prefix), 3. * ref_hess)
+
+    # removing the file removes its binary copy
+    hess_dfile.removable = True
+    hess_dfile.remove(prefix)
+    assert os.listdir(prefix) == []
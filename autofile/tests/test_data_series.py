@@ -2,7 +2,10 @@
 """
 
 import os
+import json
 import tempfile
+import concurrent.futures
+import numpy
 import pytest
 import autofile.info
 import autofile.schema
@@ -822,3 +825,351 @@ def test__data_series__build_trunk():
     for root_alocs in root_alocs_lst:
         assert (sorted(ds_.existing(root_alocs, relative=True)) ==
                 sorted(rlocs_lst))
+
+
+def test__data_series__locator_index():
+    """ test the locator index for DataSeries.existing()
+    """
+    prefix = os.path.join(PREFIX, 'locator_index')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    root_ds.indexed = True
+    root_ds.removable = True
+
+    root_locs_lst = [
+        [1, 'a'],
+        [1, 'b'],
+        [2, 'a'],
+    ]
+    for root_locs in root_locs_lst:
+        root_ds.create(root_locs)
+
+    # the first call builds the index, the second one reads it
+    assert sorted(root_ds.existing()) == sorted(root_locs_lst)
+    assert os.path.isfile(
+        os.path.join(prefix, autofile.model.LOCATOR_INDEX_FILE))
+    assert sorted(root_ds.existing()) == sorted(root_locs_lst)
+
+    # creating and removing directories keeps the index up to date
+    root_ds.create([2, 'b'])
+    root_ds.remove([1, 'a'])
+    assert (sorted(root_ds.existing()) ==
+            sorted([[1, 'b'], [2, 'a'], [2, 'b']]))
+
+    # directories created without the index make it stale
+    unindexed_root_ds = root_data_series(prefix)
+    unindexed_root_ds.create([3, 'c'])
+    assert (sorted(root_ds.existing()) ==
+            sorted([[1, 'b'], [2, 'a'], [2, 'b'], [3, 'c']]))
+
+    # replacing a json file at the prefix leaves the index fresh
+    root_ds.add_json_entries({
+        'energy': autofile.model.JSONObject(name='test.ene')})
+    root_ds.json.energy.write(-1.0, ['x'])
+    stats = autofile.model.IO_STATS
+    stats.clear()
+    with stats.collect():
+        assert len(root_ds.existing()) == 4
+    assert ROOT_SPEC_DFILE.name not in stats.as_dict().get('file.read', {})
+    stats.clear()
+
+    # concurrent creates through the index don't lose each other's entries
+    locs_lst = [[num, 'x'] for num in range(4, 20)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(root_ds.create, locs_lst))
+    assert len(root_ds.existing()) == 4 + len(locs_lst)
+    with open(os.path.join(prefix, autofile.model.LOCATOR_INDEX_FILE),
+              encoding='utf-8') as idx_obj:
+        assert len(json.load(idx_obj)['locators']) == 4 + len(locs_lst)
+
+
+
+def test__data_series__locator_index_read_only():
+    """ test that an indexed DataSeries can be listed on a read-only tree
+    """
+    prefix = os.path.join(PREFIX, 'locator_index_read_only')
+    os.mkdir(prefix)
+
+    root_locs_lst = [[1, 'a'], [2, 'b']]
+    for root_locs in root_locs_lst:
+        root_data_series(prefix).create(root_locs)
+
+    # the index can't be written, so the scan is used instead
+    root_ds = root_data_series(prefix)
+    root_ds.indexed = True
+    os.chmod(prefix, 0o555)
+    try:
+        assert sorted(root_ds.existing()) == sorted(root_locs_lst)
+    finally:
+        os.chmod(prefix, 0o755)
+
+def test__data_series__existing_paths():
+    """ test DataSeries.existing_paths()
+    """
+    prefix = os.path.join(PREFIX, 'existing_paths')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    ds_ = autofile.schema.data_series.transition_state_leaf(
+        prefix, root_ds=root_ds)
+
+    locs_lst = [
+        [1, 'a', 0],
+        [1, 'b', 1],
+        [2, 'a', 0],
+    ]
+    for locs in locs_lst:
+        ds_.create(locs)
+
+    # a stray file and a directory without a locator file are skipped
+    autofile.io_.write_file(os.path.join(prefix, '1', 'a', 'x.dat'), '')
+    os.mkdir(os.path.join(prefix, '2', 'a', '99'))
+
+    assert (list(ds_.existing_paths()) ==
+            [ds_.path(locs) for locs in sorted(locs_lst)])
+    assert (list(ds_.existing_paths([1, 'b'])) ==
+            [ds_.path([1, 'b', 1])])
+
+
+def test__loc_maps__memoized():
+    """ test the memoized locator mappings
+    """
+    loc_maps = autofile.schema.loc_maps
+    loc_maps.species_leaf.cache_clear()
+
+    ich = 'InChI=1S/C2H2F2/c3-1-2-4/h1-2H/b2-1+'
+    pth = loc_maps.species_leaf(ich, 0, 1)
+    assert loc_maps.species_leaf(ich, 0, 1) == pth
+    assert loc_maps.species_leaf.cache_info().hits == 1
+
+    # invalid locators are checked every time
+    for _ in range(2):
+        with pytest.raises(AssertionError):
+            loc_maps.species_leaf(ich, 0.0, 1)
+
+    # the number of locators is still read from the signature
+    ds_ = autofile.schema.data_series.species_leaf(PREFIX)
+    assert ds_.nlocs == 3
+
+
+def test__data_series__paths():
+    """ test DataSeries.paths()
+    """
+    prefix = os.path.join(PREFIX, 'paths')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    ds_ = autofile.schema.data_series.conformer_leaf(prefix, root_ds=root_ds)
+
+    locs_lst = [
+        [1, 'a', autofile.schema.generate_new_conformer_id()],
+        [2, 'b', autofile.schema.generate_new_conformer_id()],
+        [1, 'a', autofile.schema.generate_new_conformer_id()],
+    ]
+    assert ds_.paths(locs_lst) == [ds_.path(locs) for locs in locs_lst]
+    assert not ds_.paths([])
+
+
+def test__data_series__create_all():
+    """ test DataSeries.create() and DataSeries.create_all()
+    """
+    prefix = os.path.join(PREFIX, 'create_all')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    ds_ = autofile.schema.data_series.conformer_leaf(prefix, root_ds=root_ds)
+
+    locs_lst = [
+        [1, 'a', autofile.schema.generate_new_conformer_id()],
+        [2, 'b', autofile.schema.generate_new_conformer_id()],
+        [1, 'a', autofile.schema.generate_new_conformer_id()],
+    ]
+    ds_.create_all(locs_lst)
+    assert all(map(ds_.exists, locs_lst))
+    assert sorted(ds_.existing([1, 'a'])) == sorted(
+        locs for locs in locs_lst if locs[:2] == [1, 'a'])
+
+    # creating them again doesn't rewrite the locator files
+    loc_pths = [ds_.loc_dfile.path(pth) for pth in ds_.paths(locs_lst)]
+    mtimes = [os.stat(pth).st_mtime_ns for pth in loc_pths]
+    ds_.create(locs_lst[0])
+    ds_.create_all(locs_lst)
+    assert [os.stat(pth).st_mtime_ns for pth in loc_pths] == mtimes
+
+    # unless the locator stored in one of them is wrong
+    with open(loc_pths[1], mode='w', encoding='utf-8') as loc_obj:
+        loc_obj.write('conformer_id: cxxxxxxxxxxxx\n')
+    ds_.create(locs_lst[1])
+    assert ds_.loc_dfile.read(ds_.path(locs_lst[1])) == locs_lst[1][2:]
+
+
+def test__data_series__io_stats():
+    """ test the instrumentation of autofile.model operations
+    """
+    prefix = os.path.join(PREFIX, 'io_stats')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    stats = autofile.model.IO_STATS
+    stats.clear()
+    ops = []
+    with stats.collect(callback=lambda kind, name, _: ops.append(kind)):
+        root_ds.create([1, 'a'])
+        root_ds.create([1, 'b'])
+        assert sorted(root_ds.existing()) == [[1, 'a'], [1, 'b']]
+    assert not stats.is_enabled()
+
+    # nothing is recorded once it is turned off
+    root_ds.existing()
+
+    stats_dct = stats.as_dict()
+    assert stats_dct['series.create']['<lambda>']['count'] == 2
+    assert stats_dct['series.existing']['<lambda>']['count'] == 1
+    write_dct = stats_dct['file.write'][ROOT_SPEC_DFILE.name]
+    read_dct = stats_dct['file.read'][ROOT_SPEC_DFILE.name]
+    assert write_dct['count'] == 2 and write_dct['bytes'] > 0
+    assert read_dct['count'] == 2 and read_dct['bytes'] > 0
+    assert read_dct['stat_calls'] > 0
+    assert 0 < read_dct['parse_seconds'] <= read_dct['seconds']
+    assert ops.count('file.read') == 2
+
+    stats_pth = os.path.join(prefix, 'stats.json')
+    stats.dump(stats_pth)
+    assert autofile.json_.read_json(stats_pth) == stats_dct
+    stats.clear()
+    assert not stats.as_dict()
+
+
+def test__data_series__harvest():
+    """ test autofile.model.DataSeries.harvest
+    """
+    prefix = os.path.join(PREFIX, 'harvest')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    root_ds.add_data_files({
+        'energy': autofile.model.DataFile(
+            'ene', writer_=str, reader_=float),
+        'geometry': autofile.model.DataFile(
+            'geo', writer_=repr, reader_=eval),
+        'label': autofile.model.DataFile('label')})
+
+    ref_geo = (('C', (0., 0., 0.)), ('O', (0., 0., 2.)))
+    locs_lst = [[1, 'a'], [1, 'b'], [2, 'c']]
+    for idx, locs in enumerate(locs_lst):
+        root_ds.create(locs)
+        root_ds.file.energy.write(-1. - idx, locs)
+        root_ds.file.label.write(f'conf {idx}', locs)
+        if idx != 1:
+            root_ds.file.geometry.write(ref_geo, locs)
+
+    cache_pth = os.path.join(prefix, 'harvest.npz')
+    hvst = root_ds.harvest(['energy', 'geometry'], workers=2,
+                           readers={'nlocs': len})
+    order = sorted(range(len(hvst)), key=lambda i: hvst.locs_lst[i])
+    assert [hvst.locs_lst[i] for i in order] == locs_lst
+    assert hvst['energy'].dtype == numpy.float64
+    assert list(hvst['energy'][order]) == [-1., -2., -3.]
+    assert list(hvst['nlocs']) == [2., 2., 2.]
+    assert hvst['geometry'].shape == (3, 2, 3)
+    assert numpy.isnan(hvst['geometry'][order[1]]).all()
+    assert numpy.allclose(hvst['geometry'][order[0]], [[0, 0, 0], [0, 0, 2]])
+    assert list(hvst['geometry_symbols'][order[0]]) == ['C', 'O']
+    assert hvst.locator_array().shape == (3, 2)
+
+    # the second harvest comes from the cache, until the files or the
+    # locators change
+    root_ds.harvest(['energy', 'geometry'], cache_path=cache_pth)
+    stats = autofile.model.IO_STATS
+    stats.clear()
+    with stats.collect():
+        hvst = root_ds.harvest(['energy'], cache_path=cache_pth)
+    ene_name = root_ds.file.energy.file.name
+    assert ene_name not in stats.as_dict().get('file.read', {})
+    stats.clear()
+    assert list(hvst['energy'][order]) == [-1., -2., -3.]
+    root_ds.file.energy.write(0., [1, 'a'])
+    hvst = root_ds.harvest(['energy'], cache_path=cache_pth)
+    assert list(hvst['energy'][order]) == [0., -2., -3.]
+    root_ds.create([2, 'd'])
+    hvst = root_ds.harvest(['energy'], cache_path=cache_pth)
+    assert len(hvst) == 4 and numpy.isnan(hvst['energy']).sum() == 1
+
+    # plain reader functions keep the cache from being used, while file
+    # readers are checked against it
+    os.remove(cache_pth)
+    hvst = root_ds.harvest(['energy'], readers={'nlocs': len},
+                           cache_path=cache_pth)
+    assert not os.path.exists(cache_pth)
+    sp_dfile = autofile.model.DataFile('sp.ene', writer_=str, reader_=float)
+    for idx, locs in enumerate(locs_lst):
+        sp_dfile.write(-10. - idx, root_ds.path(locs))
+    sp_rdr = autofile.harvest.FileReader(sp_dfile, root_ds.path)
+    hvst = root_ds.harvest([], readers={'sp_energy': sp_rdr},
+                           cache_path=cache_pth)
+    order = sorted(range(len(hvst)), key=lambda i: hvst.locs_lst[i])
+    assert list(hvst['sp_energy'][order][:3]) == [-10., -11., -12.]
+    sp_dfile.write(99., root_ds.path([1, 'b']))
+    hvst = root_ds.harvest([], readers={'sp_energy': sp_rdr},
+                           cache_path=cache_pth)
+    assert list(hvst['sp_energy'][order][:3]) == [-10., 99., -12.]
+
+    # values that can't be stacked can't be cached
+    hvst = root_ds.harvest(['label'])
+    assert hvst['label'].dtype == object
+    with pytest.raises(ValueError):
+        hvst.save(cache_pth)
+
+
+def test__data_series__packed_files():
+    """ test packed storage of the data files in a DataSeries
+    """
+    prefix = os.path.join(PREFIX, 'packed')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    root_ds.add_data_files({
+        'energy': autofile.model.DataFile(
+            'ene', writer_=str, reader_=float),
+        'gradient': autofile.model.DataFile(
+            'grad', writer_=repr, reader_=eval, array_reader_=tuple,
+            binary=True)})
+    root_ds.file.energy.removable = True
+
+    root_ds.create([1, 'a'])
+    root_ds.create([1, 'b'])
+    root_ds.file.energy.write(-1.5, [1, 'a'])
+    root_ds.file.gradient.write((1., 2.), [1, 'a'])
+    root_ds.file.energy.write(-2.5, [1, 'b'])
+    assert root_ds.pack() == 2
+
+    # only the locator and the pack are left in each directory
+    pth = root_ds.path([1, 'a'])
+    assert sorted(os.listdir(pth)) == [
+        ROOT_SPEC_DFILE.name, autofile.pack.PACK_FILE]
+    assert autofile.pack.member_names(pth) == ['ene', 'grad', 'grad.npy']
+    assert root_ds.file.energy.exists([1, 'a'])
+    assert root_ds.file.energy.read([1, 'a']) == -1.5
+    assert root_ds.file.gradient.read([1, 'a']) == (1., 2.)
+    assert not root_ds.file.gradient.exists([1, 'b'])
+
+    # writes go into the pack, and removing the last file removes it
+    root_ds.file.energy.write(-3.5, [1, 'b'])
+    assert root_ds.file.energy.read([1, 'b']) == -3.5
+    root_ds.file.energy.remove([1, 'b'])
+    assert not root_ds.file.energy.exists([1, 'b'])
+    assert not autofile.pack.is_packed(root_ds.path([1, 'b']))
+
+    # new directories are packed in packed mode
+    root_ds.use_packed_files()
+    root_ds.create([2, 'c'])
+    root_ds.file.energy.write(-4.5, [2, 'c'])
+    assert autofile.pack.member_names(root_ds.path([2, 'c'])) == ['ene']
+
+    assert root_ds.unpack() == 2
+    assert sorted(os.listdir(pth)) == sorted(
+        [ROOT_SPEC_DFILE.name, 'ene', 'grad', 'grad.npy'])
+    assert root_ds.file.energy.read([1, 'a']) == -1.5
+    assert root_ds.file.gradient.read([1, 'a']) == (1., 2.)
+    assert root_ds.file.energy.read([2, 'c']) == -4.5
@@ -0,0 +1,38 @@
+""" test the import time of autofile
+"""
+
+import sys
+import subprocess
+
+HEAVY_MODULES = ('automol', 'elstruct', 'autoparse', 'phydat', 'yaml',
+                 'numpy')
+MAX_IMPORT_TIME = 0.5   # seconds
+
+
+def _import_times(statement):
+    """ the cumulative time, in seconds, of each module a statement imports
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumul, name = line[len('import time:'):].split('|')
+            if cumul.strip().isdigit():
+                times[name.strip()] = int(cumul) / 1e6
+    return times
+
+
+def test__import_autofile():
+    """ test that importing autofile doesn't import the heavy dependencies
+    """
+    for statement in ('import autofile', 'import autofile.fs'):
+        times = _import_times(statement)
+        heavy = sorted(name for name in times
+                       if name.split('.')[0] in HEAVY_MODULES)
+        assert not heavy, f'{statement} imports {heavy}'
+
+    times = _import_times('import autofile')
+    assert times['autofile'] < MAX_IMPORT_TIME, (
+        f"import autofile took {times['autofile']:.3f} s")
@@ -1,5 +1,9 @@
 """ test the autofile.info module
 """
+import copy
+import pickle
+import yaml
+import pytest
 import autofile.info
 
 
@@ -14,3 +18,68 @@ def test_():
         {'a': ['b', 'c', 'd', 'e'], 'x': {'y': 1, 'z': 2}}))
     print(dict(autofile.info.object_(
         {'a': ['b', 'c', 'd', 'e'], 'x': {'y': 1, 'z': 2}})))
+
+
+def test__string():
+    """ test autofile.info.string and autofile.info.from_string
+    """
+    inf_obj = autofile.info.object_({
+        'inchi': 'InChI=1S/C2H6O/c1-2-3/h3H,2H2,1H3', 'charge': 0,
+        'mult': 1, 'vals': [1.5, -2.5e-12, None, True],
+        'x': {'y': [[1, 2], [3, 4]], 'z': 'multi\nline'}})
+
+    # the output is the same as that of the pure-python dumper, including
+    # for long and multi-line strings, which libyaml folds differently
+    long_inf_obj = autofile.info.object_({
+        'words': 'word ' * 40,
+        'lines': 'line with some words\n' * 6 + '\ttab "q" ' + 'x' * 90,
+        'x': {'y': ['multi\nline ' * 20, 'z' * 200]}})
+    for inf_obj_ in (inf_obj, long_inf_obj):
+        inf_str = autofile.info.string(inf_obj_)
+        assert inf_str == yaml.dump(
+            dict(inf_obj_), default_flow_style=None, sort_keys=False)
+        assert autofile.info.from_string(inf_str) == inf_obj_
+
+    # python-specific tags are still read
+    inf_obj = autofile.info.from_string('a: !!python/tuple [1, 2]\n')
+    assert inf_obj == autofile.info.Info(a=[1, 2])
+
+
+def test__info():
+    """ test the frozen keys, dictionary cache, and copying of Info
+    """
+    inf_obj = autofile.info.Info(job='energy', status='running', nsamp=4)
+    assert dict(inf_obj) == {'job': 'energy', 'status': 'running',
+                             'nsamp': 4}
+
+    # values can change, but keys can't be added
+    inf_obj.status = 'succeeded'
+    assert inf_obj.status == 'succeeded'
+    assert dict(inf_obj)['status'] == 'succeeded'
+    assert autofile.info.dict_(inf_obj)['status'] == 'succeeded'
+    with pytest.raises(TypeError):
+        inf_obj.other = 1
+    assert not hasattr(inf_obj, 'other')
+
+    # the dictionaries handed out are copies
+    autofile.info.dict_(inf_obj)['job'] = 'other'
+    assert inf_obj.job == 'energy'
+    nested_inf_obj = autofile.info.Info(run=inf_obj)
+    autofile.info.dict_(nested_inf_obj)['run']['job'] = 'other'
+    assert inf_obj.job == 'energy'
+
+    for inf_obj_ in (copy.copy(inf_obj), copy.deepcopy(inf_obj),
+                     pickle.loads(pickle.dumps(inf_obj))):
+        assert inf_obj_ == inf_obj
+        inf_obj_.nsamp = 5
+        assert inf_obj.nsamp == 4
+
+
+def test__dict_from_string():
+    """ test autofile.info.dict_from_string
+    """
+    for inf_str in ('inchi: InChI=1S/CH4/h1H4\ncharge: 0\nmult: 1\n',
+                    'a: [1, 2.5, true, [3, 4]]\nx: {y: 1, z: [5, 6]}\n',
+                    'a: !!python/tuple [1, 2]\n'):
+        assert (autofile.info.dict_from_string(inf_str) ==
+                dict(autofile.info.from_string(inf_str)))
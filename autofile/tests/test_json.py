@@ -0,0 +1,116 @@
+""" test autofile.json_
+"""
+
+import os
+import tempfile
+import multiprocessing
+import pytest
+import autofile.io_
+import autofile.json_
+
+
+PREFIX = tempfile.mkdtemp()
+print(PREFIX)
+
+
+def test__read_write():
+    """ test autofile.json_.read_json and autofile.json_.write_json
+    """
+    prefix = os.path.join(PREFIX, 'read_write')
+    os.mkdir(prefix)
+    json_path = os.path.join(prefix, 'db.json')
+
+    ref_dct = {'a': {'b': 1.0, 'c': ['x', 'y']}}
+    autofile.json_.write_json(ref_dct, json_path)
+    assert autofile.json_.read_json(json_path) == ref_dct
+
+    # a failed write leaves the file as it was, without a backup copy
+    with pytest.raises(IOError):
+        autofile.json_.write_json({'a': object()}, json_path)
+    assert autofile.json_.read_json(json_path) == ref_dct
+    assert sorted(os.listdir(prefix)) == ['db.json', 'db.lock']
+
+    # writes can be flushed to disk
+    autofile.json_.write_json(ref_dct, json_path, fsync=True)
+    assert autofile.json_.read_json(json_path) == ref_dct
+
+    # a corrupt file is an error, and isn't replaced by an old backup
+    autofile.io_.write_file(json_path + '_backup', '{"old": 1}')
+    autofile.io_.write_file(json_path, '{"a": ')
+    with pytest.raises(IOError):
+        autofile.json_.read_json(json_path)
+    assert autofile.io_.read_file(json_path) == '{"a": '
+    os.remove(json_path + '_backup')
+
+    # compatibility mode, with the .avail sentinel
+    autofile.json_.write_json(ref_dct, json_path, avail=True)
+    assert autofile.json_.read_json(json_path, avail=True) == ref_dct
+    with open(os.path.join(prefix, 'db.avail'), encoding='utf-8') as afile:
+        assert afile.read() == 'available'
+
+
+def test__lock():
+    """ test autofile.json_.lock
+    """
+    prefix = os.path.join(PREFIX, 'lock')
+    os.mkdir(prefix)
+    json_path = os.path.join(prefix, 'db.json')
+    autofile.json_.write_json({}, json_path)
+
+    # readers can share the lock
+    with autofile.json_.lock(json_path, shared=True):
+        assert autofile.json_.read_json(json_path, timeout=0.1) == {}
+
+    # writers can't, even from another process
+    with autofile.json_.lock(json_path):
+        proc = multiprocessing.Process(
+            target=autofile.json_.write_json, args=({'a': 1}, json_path),
+            kwargs={'timeout': 0.1})
+        proc.start()
+        proc.join()
+        assert proc.exitcode != 0
+    assert autofile.json_.read_json(json_path) == {}
+
+    # a sentinel left 'in use' is only waited on until it goes stale
+    avail_path = os.path.join(prefix, 'db.avail')
+    with open(avail_path, mode='w', encoding='utf-8') as afile:
+        afile.write('in use')
+    with pytest.raises(TimeoutError):
+        autofile.json_.read_json(json_path, timeout=0.1, avail=True)
+    os.utime(avail_path, (0, 0))
+    assert autofile.json_.read_json(json_path, timeout=0.1, avail=True) == {}
+
+
+def test__read_only():
+    """ test that json files can be read without being able to write the lock
+    """
+    prefix = os.path.join(PREFIX, 'read_only')
+    os.mkdir(prefix)
+    json_path = os.path.join(prefix, 'db.json')
+    autofile.io_.write_file(json_path, '{"a": 1}')
+
+    # readers don't create the lock file
+    assert autofile.json_.read_json(json_path) == {'a': 1}
+    assert os.listdir(prefix) == ['db.json']
+
+    # nor need to open it
+    autofile.json_.write_json({'a': 2}, json_path)
+    os.chmod(os.path.join(prefix, 'db.lock'), 0)
+    os.chmod(prefix, 0o555)
+    try:
+        assert autofile.json_.read_json(json_path) == {'a': 2}
+    finally:
+        os.chmod(prefix, 0o755)
+
+
+def test__update():
+    """ test autofile.json_.update_json
+    """
+    prefix = os.path.join(PREFIX, 'update')
+    os.mkdir(prefix)
+    json_path = os.path.join(prefix, 'db.json')
+
+    # a missing file starts out empty
+    autofile.json_.update_json(lambda dct: dct.update(a=1), json_path)
+    autofile.json_.update_json(lambda dct: dct.update(b=2), json_path)
+    assert autofile.json_.read_json(json_path) == {'a': 1, 'b': 2}
@@ -104,6 +104,56 @@ def test__iterate_locators():
                 assert automol.geom.almost_equal_dist_matrix(ref_geo, geo)
 
 
+def test__iterate_with_workers():
+    """ test autofile.fs.iterate_locators and iterate_paths on a thread pool
+    """
+
+    # Build fs
+    prefix = os.path.join(PREFIX, 'data4')
+    _build_fs(prefix)
+
+    keys = ['SPECIES', 'THEORY', 'CONFORMER']
+    locs_lst = tuple(autofile.fs.iterate_locators(prefix, keys))
+    pths = tuple(autofile.fs.iterate_paths(prefix, keys))
+    assert len(locs_lst) == len(pths) == len(FAKE_LOCS_SETS_DCT)
+
+    for workers in (1, 4):
+        assert tuple(autofile.fs.iterate_locators(
+            prefix, keys, workers=workers)) == locs_lst
+        assert tuple(autofile.fs.iterate_paths(
+            prefix, keys, workers=workers)) == pths
+
+
+def test__manager_read_only():
+    """ test autofile.fs.manager with create=False
+    """
+
+    def _snapshot(prefix):
+        return sorted(
+            (pth, sorted(names), os.stat(pth).st_mtime_ns)
+            for pth, _, names in os.walk(prefix))
+
+    # Build fs
+    prefix = os.path.join(PREFIX, 'data5')
+    _build_fs(prefix)
+    snapshot = _snapshot(prefix)
+
+    spc_locs, thy_locs, cnf_locs = FAKE_LOCS_SETS_DCT['set3']
+    cnf_fs = autofile.fs.manager(
+        prefix, [['SPECIES', spc_locs], ['THEORY', thy_locs]], 'CONFORMER',
+        create=False)
+    assert cnf_fs[-1].file.geometry_input.read(cnf_locs) == 'inp3'
+
+    # a path that doesn't exist gives None, instead of being created
+    assert autofile.fs.manager(
+        prefix, [['SPECIES', spc_locs], ['THEORY', ['hf', 'sto-3g', 'R']]],
+        'CONFORMER', create=False) is None
+    assert autofile.fs.path(
+        prefix, [['SPECIES', ['InChI=1S/H2/h1H', 0, 1]]], create=False) is None
+
+    assert _snapshot(prefix) == snapshot
+
+
 def _build_fs(prefix):
     """ Construct a filesystem to do stuff
     """
@@ -0,0 +1,150 @@
+""" test autofile.sqlite_
+"""
+
+import os
+import tempfile
+import autofile.json_
+import autofile.model
+import autofile.sqlite_
+
+
+PREFIX = tempfile.mkdtemp()
+print(PREFIX)
+
+
+def test__read_write():
+    """ test autofile.sqlite_.read_entries and autofile.sqlite_.write_entries
+    """
+    db_path = os.path.join(PREFIX, 'read_write.sqlite')
+    autofile.sqlite_.create(db_path)
+
+    keys = [['a', 'b'], ['a', 'c'], ['d']]
+    autofile.sqlite_.write_entries(db_path, [
+        (key, 'test.ene', val)
+        for key, val in zip(keys, [1.0, {'x': [1, 2]}, 'y'])])
+    autofile.sqlite_.write_entries(db_path, [(keys[0], 'test.ene', 2.0)])
+
+    assert autofile.sqlite_.read_entries(
+        db_path, keys + [['a']], 'test.ene') == [
+            (True, 2.0), (True, {'x': [1, 2]}), (True, 'y'), (False, None)]
+    assert autofile.sqlite_.existing_keys(db_path) == ['a', 'd']
+    assert autofile.sqlite_.existing_keys(db_path, ['a']) == ['b', 'c']
+    assert not autofile.sqlite_.existing_keys(db_path, ['a', 'b'])
+
+
+def test__stores():
+    """ test that the json file and sqlite stores behave the same
+    """
+    ene_jobj = autofile.model.JSONObject(name='test.ene')
+    keys = [['CH4/0/1', 'hf'], ['CH4/0/1', 'mp2'], ['C2H6/0/1']]
+    vals = [-40.1, -40.3, -79.2]
+
+    for store in (autofile.model.JSONFileStore(),
+                  autofile.model.SQLiteStore()):
+        path = os.path.join(PREFIX, f'stores.{store.file_name}')
+        store.create(path)
+
+        assert not ene_jobj.exists(keys[0], path, store=store)
+        ene_jobj.write_all(vals, keys, path, store=store)
+        assert ene_jobj.exists(keys[0], path, store=store)
+        assert ene_jobj.read(keys[1], path, store=store) == -40.3
+        assert ene_jobj.read(['H2/0/1'], path, store=store) is None
+        assert ene_jobj.read_all(keys, path, store=store) == vals
+        assert ene_jobj.exists_all(
+            [keys[0], ['H2/0/1']], path, store=store) == [True, False]
+        assert ene_jobj.read_existing(
+            [['H2/0/1'], keys[2]], path, store=store) == vals[2:]
+        assert store.existing(['CH4/0/1'], path) == ['hf', 'mp2']
+
+
+def test__import_export():
+    """ test autofile.sqlite_.from_json and autofile.sqlite_.to_json
+    """
+    json_path = os.path.join(PREFIX, 'import.json')
+    db_path = os.path.join(PREFIX, 'import.sqlite')
+    out_path = os.path.join(PREFIX, 'export.json')
+
+    ref_dct = {
+        'CH4/0/1': {'hf': {'geom.ene': -40.1, 'geom.yaml': 'a: 1\n'},
+                    'geom.xyz': [[0., 0., 0.]],
+                    'run.dct': {'x': 1}},
+        'C2H6/0/1': {'geom.ene': -79.2},
+        'top.ene': -1.0}
+    autofile.json_.write_json(ref_dct, json_path)
+
+    autofile.sqlite_.from_json(json_path, db_path, names=('run.dct',))
+    assert autofile.sqlite_.existing_keys(db_path) == ['C2H6/0/1', 'CH4/0/1']
+    assert autofile.sqlite_.read_entries(
+        db_path, [[]], 'top.ene') == [(True, -1.0)]
+    assert autofile.sqlite_.read_entries(
+        db_path, [['CH4/0/1', 'hf'], ['CH4/0/1']], 'geom.ene') == [
+            (True, -40.1), (False, None)]
+    assert autofile.sqlite_.read_entries(
+        db_path, [['CH4/0/1']], 'run.dct') == [(True, {'x': 1})]
+
+    autofile.sqlite_.to_json(db_path, out_path)
+    assert autofile.json_.read_json(out_path) == ref_dct
+
+
+def test__data_series():
+    """ test json entries of a data series kept in an sqlite database
+    """
+    prefix = os.path.join(PREFIX, 'data_series')
+    os.mkdir(prefix)
+
+    dseries = autofile.model.DataSeries(
+        prefix, map_=lambda locs: locs[0], nlocs=1, depth=1)
+    dseries.use_json_store(autofile.model.SQLiteStore())
+    dseries.add_json_entries({
+        'energy': autofile.model.JSONObject(name='test.ene')})
+    assert dseries.json_path() == os.path.join(prefix, 'db.sqlite')
+
+    dseries.json.energy.write(-40.1, ['a'])
+    dseries.json.energy.write_all([-40.2, -40.3], [['b'], ['c']])
+    assert dseries.json.energy.exists(['a'])
+    assert not dseries.json.energy.exists(['d'])
+    assert dseries.json.energy.read(['b']) == -40.2
+    assert dseries.json.energy.read_all([['a'], ['c']]) == [-40.1, -40.3]
+    assert dseries.json_existing() == (['a'], ['b'], ['c'])
+    assert not os.path.exists(os.path.join(prefix, 'db.json'))
+    assert dseries.json.energy.exists_all([['a'], ['d'], ['c']]) == [
+        True, False, True]
+    assert dseries.json.energy.read_all([['a'], ['d']]) == [-40.1]
+
+
+def test__json_transaction():
+    """ test autofile.model.DataSeries.json_transaction
+    """
+    for store in (autofile.model.JSONFileStore(),
+                  autofile.model.SQLiteStore()):
+        prefix = os.path.join(PREFIX, f'transaction.{store.file_name}')
+        os.mkdir(prefix)
+
+        dseries = autofile.model.DataSeries(
+            prefix, map_=lambda locs: locs[0], nlocs=1, depth=1)
+        dseries.use_json_store(store)
+        dseries.add_json_entries({
+            'energy': autofile.model.JSONObject(name='test.ene'),
+            'input': autofile.model.JSONObject(name='test.inp')})
+
+        # the writes are made on exit, and can be read back before then
+        with dseries.json_transaction():
+            dseries.json.energy.write(-40.1, ['a'])
+            dseries.json.input.write('<input>', ['a'])
+            assert not dseries.json_exists()
+            assert dseries.json.energy.read(['a']) == -40.1
+            assert dseries.json_existing() == (['a'],)
+        assert dseries.json.energy.read(['a']) == -40.1
+        assert dseries.json.input.read(['a']) == '<input>'
+
+        # they are dropped if the block raises
+        try:
+            with dseries.json_transaction():
+                dseries.json.energy.write(-40.2, ['a'])
+                dseries.json.energy.write(-40.3, ['b'])
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        assert dseries.json.energy.read(['a']) == -40.1
+        assert not dseries.json.energy.exists(['b'])
+        assert dseries.json_store is store
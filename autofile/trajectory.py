@@ -0,0 +1,208 @@
+""" frame-indexed access to xyz trajectory files
+
+A `TrajectoryFile` finds where each frame of a trajectory starts the first
+time it is used, and keeps these byte offsets in an index file next to the
+trajectory, so that frames can be counted, read one at a time, and appended
+without reading or rewriting the whole file:
+
+    traj = cnf_fs[0].file.trajectory.frames()
+    nframes = len(traj)
+    geo, comment = traj[-1]
+    traj.append((geo, comment))
+"""
+import os
+import json
+import autofile.io_
+import autofile.data_types.name
+
+
+class TrajectoryFile():
+    """ an xyz trajectory file, as a sequence of frames
+
+    Each frame is a line with the number of atoms, a comment line, and a line
+    for each atom. The index is rebuilt whenever the size or modification time
+    of the file no longer match the ones it was built for, so files written
+    in full by `DataFile.write()` or by other programs are picked up.
+
+    :param file_path: path to the trajectory file
+    :type file_path: str
+    :param reader_: reads a frame from its string
+    :type reader_: callable[str->object]
+    :param writer_: writes a frame to a string
+    :type writer_: callable[object->str]
+    """
+
+    def __init__(self, file_path, reader_=(lambda _: _),
+                 writer_=(lambda _: _)):
+        self.file_path = file_path
+        self.reader_ = reader_
+        self.writer_ = writer_
+        self._index = None
+
+    def index_path(self):
+        """ path of the frame index file
+        """
+        return autofile.data_types.name.frame_index(self.file_path)
+
+    def offsets(self):
+        """ the byte offset at which each frame starts
+
+        :rtype: tuple[int]
+        """
+        return tuple(self._offsets())
+
+    def frame_string(self, idx):
+        """ read the string of one frame
+
+        :param idx: the frame index (negative values count from the end)
+        :type idx: int
+        :rtype: str
+        """
+        offsets = self._offsets()
+        nframes = len(offsets)
+        if not -nframes <= idx < nframes:
+            raise IndexError(f"Frame {idx} out of range for {nframes} frames "
+                             f"in {self.file_path}")
+        idx %= nframes
+
+        with open(self.file_path, mode='rb') as fobj:
+            fobj.seek(offsets[idx])
+            if idx + 1 < nframes:
+                frm_bytes = fobj.read(offsets[idx + 1] - offsets[idx])
+            else:
+                frm_bytes = fobj.read(self._index['size'] - offsets[idx])
+        return frm_bytes.decode('utf-8')
+
+    def append(self, frm):
+        """ append a frame to the end of the file
+
+        :param frm: the frame to be written
+        :type frm: object
+        """
+        self.extend([frm])
+
+    def extend(self, frms):
+        """ append frames to the end of the file
+
+        (the file is created if it doesn't exist yet)
+
+        :param frms: the frames to be written
+        :type frms: list
+        """
+        frm_strs = [self.writer_(frm) for frm in frms]
+        offsets = self._offsets() if os.path.exists(self.file_path) else []
+
+        with open(self.file_path, mode='ab') as fobj:
+            pos = fobj.tell()
+            if pos and not _ends_with_newline(self.file_path, pos):
+                fobj.write(b'\n')
+                pos += 1
+            for frm_str in frm_strs:
+                frm_bytes = frm_str.encode('utf-8')
+                if not frm_bytes.endswith(b'\n'):
+                    frm_bytes += b'\n'
+                offsets.append(pos)
+                fobj.write(frm_bytes)
+                pos += len(frm_bytes)
+
+        self._save_index(offsets)
+
+    def __len__(self):
+        return len(self._offsets())
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return self.reader_(self.frame_string(idx))
+
+    def __iter__(self):
+        # Iterate over the offsets at the start, so that frames appended
+        # along the way are left out
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __repr__(self):
+        return f"TrajectoryFile('{self.file_path}')"
+
+    def _offsets(self):
+        """ the frame offsets, from the index if it is up to date
+        """
+        stat = os.stat(self.file_path)
+        if not _index_matches(self._index, stat):
+            self._index = _read_index(self.index_path())
+        if not _index_matches(self._index, stat):
+            self._save_index(frame_offsets(self.file_path))
+        return self._index['offsets']
+
+    def _save_index(self, offsets):
+        """ save the frame offsets for the current state of the file
+        """
+        stat = os.stat(self.file_path)
+        self._index = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                       'offsets': list(offsets)}
+        # The index is only a shortcut, so the trajectory can still be read
+        # from a directory that can't be written to
+        try:
+            autofile.io_.write_file(self.index_path(),
+                                    json.dumps(self._index))
+        except OSError:
+            pass
+
+
+def frame_offsets(file_path):
+    """ find the byte offset at which each frame of an xyz trajectory starts
+
+    (blank lines between frames are skipped)
+
+    :param file_path: path to the trajectory file
+    :type file_path: str
+    :rtype: list[int]
+    """
+    offsets = []
+    pos = 0
+    with open(file_path, mode='rb') as fobj:
+        for line in fobj:
+            if not line.strip():
+                pos += len(line)
+                continue
+
+            try:
+                natms = int(line)
+            except ValueError as err:
+                raise ValueError(
+                    f"Expected a number of atoms at byte {pos} of "
+                    f"{file_path}, got {line!r}") from err
+
+            offsets.append(pos)
+            pos += len(line)
+            for _ in range(natms + 1):
+                pos += len(next(fobj, b''))
+    return offsets
+
+
+def _read_index(index_path):
+    """ read a frame index, or None if it is missing or can't be read
+    """
+    try:
+        with open(index_path, encoding='utf-8') as fobj:
+            index = json.load(fobj)
+    except (OSError, ValueError):
+        return None
+    return index if isinstance(index, dict) else None
+
+
+def _index_matches(index, stat):
+    """ was this index built for the file as it is now?
+    """
+    return (index is not None
+            and index.get('size') == stat.st_size
+            and index.get('mtime_ns') == stat.st_mtime_ns
+            and isinstance(index.get('offsets'), list))
+
+
+def _ends_with_newline(file_path, size):
+    """ does the file end with a newline?
+    """
+    with open(file_path, mode='rb') as fobj:
+        fobj.seek(size - 1)
+        return fobj.read(1) == b'\n'
@@ -0,0 +1,136 @@
+""" benchmark reading and writing files and json entries
+"""
+import os
+import pytest
+import autofile
+from synthetic import build_tree
+from synthetic import sample_values
+from synthetic import single_point_sample_values
+from synthetic import data_file_sample_values
+
+CNF_NAMES = sorted(sample_values())
+SP_NAMES = sorted(single_point_sample_values())
+OTHER_NAMES = sorted(data_file_sample_values())
+STORES = {
+    'json': autofile.model.JSONFileStore,
+    'sqlite': autofile.model.SQLiteStore,
+}
+
+
+@pytest.fixture(scope='module')
+def leaf(tmp_path_factory):
+    """ the conformer and single-point managers of a one-conformer tree
+    """
+    prefix = tmp_path_factory.mktemp('leaf')
+    tree = build_tree(str(prefix), nspcs=1, nthys=1, ncnfs=1, nsps=1)
+    cnf_fs, = tree.conformer_managers()
+    cnf_locs, = tree.cnf_locs_lst
+    sp_fs = autofile.fs.single_point(cnf_fs[-1].path(cnf_locs))
+    sp_locs, = tree.sp_locs_lst
+    return (cnf_fs, cnf_locs, sp_fs, sp_locs)
+
+
+@pytest.mark.parametrize('name', CNF_NAMES)
+@pytest.mark.benchmark(group='conformer_file_read')
+def bench__conformer_file_read(leaf, benchmark, name):
+    """ read each file of the conformer leaf layer
+    """
+    cnf_fs, cnf_locs, _, _ = leaf
+    benchmark(getattr(cnf_fs[-1].file, name).read, cnf_locs)
+
+
+@pytest.mark.parametrize('name', CNF_NAMES)
+@pytest.mark.benchmark(group='conformer_file_write')
+def bench__conformer_file_write(leaf, benchmark, name):
+    """ write each file of the conformer leaf layer
+    """
+    cnf_fs, cnf_locs, _, _ = leaf
+    val = sample_values()[name]
+    benchmark(getattr(cnf_fs[-1].file, name).write, val, cnf_locs)
+
+
+@pytest.mark.parametrize('name', SP_NAMES)
+@pytest.mark.benchmark(group='single_point_file_read')
+def bench__single_point_file_read(leaf, benchmark, name):
+    """ read each file of the single-point leaf layer
+    """
+    _, _, sp_fs, sp_locs = leaf
+    benchmark(getattr(sp_fs[-1].file, name).read, sp_locs)
+
+
+@pytest.mark.parametrize('name', SP_NAMES)
+@pytest.mark.benchmark(group='single_point_file_write')
+def bench__single_point_file_write(leaf, benchmark, name):
+    """ write each file of the single-point leaf layer
+    """
+    _, _, sp_fs, sp_locs = leaf
+    val = single_point_sample_values()[name]
+    benchmark(getattr(sp_fs[-1].file, name).write, val, sp_locs)
+
+
+@pytest.fixture(scope='module')
+def other_files(tmp_path_factory):
+    """ a directory with each of the other data files written to it
+    """
+    prefix = str(tmp_path_factory.mktemp('other'))
+    for name, val in data_file_sample_values().items():
+        _data_file(name).write(val, prefix)
+    return prefix
+
+
+@pytest.mark.parametrize('name', OTHER_NAMES)
+@pytest.mark.benchmark(group='other_file_read')
+def bench__other_file_read(other_files, benchmark, name):
+    """ read each of the data files outside of the leaf layers
+    """
+    benchmark(_data_file(name).read, other_files)
+
+
+@pytest.mark.parametrize('name', OTHER_NAMES)
+@pytest.mark.benchmark(group='other_file_write')
+def bench__other_file_write(other_files, benchmark, name):
+    """ write each of the data files outside of the leaf layers
+    """
+    val = data_file_sample_values()[name]
+    benchmark(_data_file(name).write, val, other_files)
+
+
+def _data_file(name):
+    """ the data file made by this `autofile.schema.data_files` factory
+    """
+    return getattr(autofile.schema.data_files, name)('bench')
+
+
+@pytest.fixture(params=sorted(STORES))
+def json_series(request, tree, tmp_path):
+    """ a data series with an energy entry for each conformer of the tree
+    """
+    prefix = str(tmp_path)
+    dseries = autofile.model.DataSeries(
+        prefix, map_=lambda locs: locs[0], nlocs=1, depth=1)
+    dseries.use_json_store(STORES[request.param]())
+    dseries.add_json_entries({
+        'energy': autofile.model.JSONObject(name='sp.ene')})
+    keys = [[cid] for _, cid in tree.cnf_locs_lst]
+    vals = [-40.5 - idx * 1e-4 for idx, _ in enumerate(keys)]
+    dseries.json.energy.write_all(vals, keys)
+    assert os.path.exists(dseries.json_path())
+    return (request.param, dseries, keys, vals)
+
+
+@pytest.mark.benchmark(group='json_read_all')
+def bench__json_read_all(json_series, record_size):
+    """ read the energies of every conformer at once
+    """
+    store_name, dseries, keys, _ = json_series
+    record_size.extra_info['store'] = store_name
+    record_size(dseries.json.energy.read_all, keys)
+
+
+@pytest.mark.benchmark(group='json_write_all')
+def bench__json_write_all(json_series, record_size):
+    """ write the energies of every conformer at once
+    """
+    store_name, dseries, keys, vals = json_series
+    record_size.extra_info['store'] = store_name
+    record_size(dseries.json.energy.write_all, vals, keys)
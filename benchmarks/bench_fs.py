@@ -0,0 +1,66 @@
+""" benchmark walking a tree
+
+Each benchmark records the tree size, so `report.py` can fit how its time
+scales.
+"""
+import pytest
+import autofile
+from autofile import fs
+
+KEYS = ['SPECIES', 'THEORY', 'CONFORMER', 'SINGLE POINT']
+
+
+@pytest.mark.benchmark(group='existing')
+def bench__existing(tree, record_size):
+    """ read back the conformer locators under each theory
+    """
+    cnf_fs_lst = tree.conformer_managers()
+
+    def _existing():
+        for cnf_fs in cnf_fs_lst:
+            cnf_fs[-1].existing()
+
+    record_size(_existing)
+
+
+@pytest.mark.benchmark(group='existing_paths')
+def bench__existing_paths(tree, record_size):
+    """ list the conformer directories under each theory
+    """
+    cnf_fs_lst = tree.conformer_managers()
+
+    def _existing_paths():
+        for cnf_fs in cnf_fs_lst:
+            list(cnf_fs[-1].existing_paths())
+
+    record_size(_existing_paths)
+
+
+@pytest.mark.parametrize('workers', [None, 4])
+@pytest.mark.benchmark(group='iterate_locators')
+def bench__iterate_locators(tree, record_size, workers):
+    """ read back every single-point locator in the tree
+    """
+    record_size.extra_info['workers'] = workers
+    record_size(lambda: list(
+        fs.iterate_locators(tree.prefix, KEYS, workers=workers)))
+
+
+@pytest.mark.parametrize('workers', [None, 4])
+@pytest.mark.benchmark(group='iterate_paths')
+def bench__iterate_paths(tree, record_size, workers):
+    """ list every single-point directory in the tree
+    """
+    record_size.extra_info['workers'] = workers
+    record_size(lambda: list(
+        fs.iterate_paths(tree.prefix, KEYS, workers=workers)))
+
+
+@pytest.mark.parametrize('workers', [None, 4])
+@pytest.mark.benchmark(group='directory_to_dictionary')
+def bench__directory_to_dictionary(tree, record_size, workers):
+    """ read the whole tree into a dictionary
+    """
+    record_size.extra_info['workers'] = workers
+    record_size(autofile.directory_to_dictionary, tree.prefix,
+                workers=workers)
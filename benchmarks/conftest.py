@@ -0,0 +1,34 @@
+""" fixtures for the benchmarks
+
+The trees are built once per session, for each of the conformer counts in
+AUTOFILE_BENCH_NCNFS (comma-separated). The other dimensions are set by
+AUTOFILE_BENCH_NSPCS, AUTOFILE_BENCH_NTHYS, and AUTOFILE_BENCH_NSPS.
+"""
+import os
+import pytest
+from synthetic import build_tree
+
+NCNFS_LST = [int(n) for n in
+             os.environ.get('AUTOFILE_BENCH_NCNFS', '10,100,1000').split(',')]
+NSPCS = int(os.environ.get('AUTOFILE_BENCH_NSPCS', '2'))
+NTHYS = int(os.environ.get('AUTOFILE_BENCH_NTHYS', '2'))
+NSPS = int(os.environ.get('AUTOFILE_BENCH_NSPS', '2'))
+
+
+@pytest.fixture(scope='session', params=NCNFS_LST,
+                ids=[f'ncnfs={n}' for n in NCNFS_LST])
+def tree(request, tmp_path_factory):
+    """ a synthetic tree with this many conformers under each theory
+    """
+    prefix = tmp_path_factory.mktemp(f'tree{request.param}')
+    return build_tree(str(prefix), nspcs=NSPCS, nthys=NTHYS,
+                      ncnfs=request.param, nsps=NSPS)
+
+
+@pytest.fixture
+def record_size(benchmark, tree):
+    """ record the size of the tree with the timing, for the scaling report
+    """
+    benchmark.extra_info['ncnfs'] = len(tree.cnf_locs_lst)
+    benchmark.extra_info['size'] = tree.size()
+    return benchmark
@@ -0,0 +1,84 @@
+""" print scaling curves from a pytest-benchmark json file
+
+    cd benchmarks
+    pytest --benchmark-json=results.json
+    python report.py results.json
+
+For each benchmark that recorded a tree size, prints its time against the
+number of conformers, and the exponent of a power-law fit (1 means the
+time grows linearly with the tree).
+"""
+import sys
+import json
+import argparse
+import collections
+import numpy
+
+
+def scaling_curves(bench_dcts):
+    """ collect the timings into curves
+
+    Benchmarks in the same group, with the same parameters other than the
+    tree size, make up a curve.
+
+    :param bench_dcts: the benchmarks of a pytest-benchmark json file
+    :type bench_dcts: list[dict]
+    :returns: the (ncnfs, mean time) points of each curve, by label
+    :rtype: dict[str: list[tuple(int, float)]]
+    """
+    curves = collections.defaultdict(list)
+    for bench_dct in bench_dcts:
+        extra = dict(bench_dct['extra_info'])
+        if 'ncnfs' not in extra:
+            continue
+
+        ncnfs = extra.pop('ncnfs')
+        extra.pop('size', None)
+        params = ', '.join(f'{key}={val}'
+                           for key, val in sorted(extra.items()))
+        label = f"{bench_dct['group']} ({params})" if params else (
+            bench_dct['group'])
+        curves[label].append((ncnfs, bench_dct['stats']['mean']))
+
+    return {label: sorted(points) for label, points in curves.items()}
+
+
+def exponent(points):
+    """ the exponent of a power-law fit to a curve
+
+    :param points: (size, time) points
+    :type points: list[tuple(int, float)]
+    :rtype: float or None
+    """
+    if len(points) < 2:
+        return None
+
+    sizes, times = numpy.transpose(points)
+    slope, _ = numpy.polyfit(numpy.log(sizes), numpy.log(times), 1)
+    return slope
+
+
+def main():
+    """ print the report
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('json_path')
+    args = parser.parse_args()
+
+    with open(args.json_path, encoding='utf-8') as fobj:
+        bench_dcts = json.load(fobj)['benchmarks']
+
+    curves = scaling_curves(bench_dcts)
+    if not curves:
+        sys.exit('No benchmarks with a recorded tree size')
+
+    for label, points in sorted(curves.items()):
+        slope = exponent(points)
+        fit = 'n/a' if slope is None else f'{slope:.2f}'
+        print(f'{label}: exponent {fit}')
+        for ncnfs, mean in points:
+            print(f'    {ncnfs:>8d} conformers: {mean*1e3:12.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+""" synthetic species -> theory -> conformer -> single-point trees
+
+The trees are filled with made-up but well-formed data, so that the
+benchmarks exercise the same readers, writers, and directory layouts as a
+real save filesystem.
+"""
+import base64
+import random
+import itertools
+import numpy
+import autofile
+from autofile import fs
+
+THEORIES = tuple(
+    [method, basis, orb_type]
+    for method, basis, orb_type in itertools.product(
+        ('hf', 'b3lyp', 'mp2', 'wb97xd', 'm062x'),
+        ('sto-3g', '6-31g*', 'cc-pvdz', 'cc-pvtz'),
+        ('R', 'U')))
+
+# The geometry of methane (bohr), which the other samples are sized to
+SYMBOLS = ('C', 'H', 'H', 'H', 'H')
+COORDS = ((0.0, 0.0, 0.0),
+          (1.1888, 1.1888, 1.1888),
+          (-1.1888, -1.1888, 1.1888),
+          (-1.1888, 1.1888, -1.1888),
+          (1.1888, -1.1888, -1.1888))
+
+
+class Tree():
+    """ the locators of a synthetic tree
+
+    :param prefix: the directory the tree was built in
+    :type prefix: str
+    :param spc_locs_lst: species locators
+    :param thy_locs_lst: theory locators
+    :param cnf_locs_lst: conformer locators
+    :param sp_locs_lst: single-point locators
+    """
+
+    def __init__(self, prefix, spc_locs_lst, thy_locs_lst, cnf_locs_lst,
+                 sp_locs_lst):
+        self.prefix = prefix
+        self.spc_locs_lst = spc_locs_lst
+        self.thy_locs_lst = thy_locs_lst
+        self.cnf_locs_lst = cnf_locs_lst
+        self.sp_locs_lst = sp_locs_lst
+
+    def conformer_managers(self):
+        """ conformer managers for each species and theory
+
+        :rtype: list[tuple(DataSeries)]
+        """
+        return [fs.manager(self.prefix, [['SPECIES', spc_locs],
+                                         ['THEORY', thy_locs]],
+                           'CONFORMER')
+                for spc_locs in self.spc_locs_lst
+                for thy_locs in self.thy_locs_lst]
+
+    def size(self):
+        """ the number of leaf directories in the tree
+
+        :rtype: int
+        """
+        return (len(self.spc_locs_lst) * len(self.thy_locs_lst)
+                * len(self.cnf_locs_lst) * (1 + len(self.sp_locs_lst)))
+
+    def __repr__(self):
+        return (f"Tree({self.prefix}, nspcs={len(self.spc_locs_lst)}, "
+                f"nthys={len(self.thy_locs_lst)}, "
+                f"ncnfs={len(self.cnf_locs_lst)}, "
+                f"nsps={len(self.sp_locs_lst)})")
+
+
+def build_tree(prefix, nspcs=2, nthys=2, ncnfs=10, nsps=2, seed=0):
+    """ build a synthetic tree
+
+    Each species gets the same theories, each of those the same
+    conformers, and each conformer the same single points. Every conformer
+    has a full set of leaf files and every single point an energy, input,
+    and info file.
+
+    :param prefix: the (existing) directory to build the tree in
+    :type prefix: str
+    :param nspcs: the number of species (linear alkanes)
+    :type nspcs: int
+    :param nthys: the number of theories, at most `len(THEORIES)`
+    :type nthys: int
+    :param ncnfs: the number of conformers under each theory
+    :type ncnfs: int
+    :param nsps: the number of single points under each conformer, at most
+        `len(THEORIES)`
+    :type nsps: int
+    :param seed: seed for the conformer ids and sample values
+    :type seed: int
+    :rtype: Tree
+    """
+    assert nthys <= len(THEORIES) and nsps <= len(THEORIES)
+    rng = random.Random(seed)
+
+    spc_locs_lst = [[alkane_inchi(nc), 0, 1] for nc in range(1, nspcs+1)]
+    thy_locs_lst = [list(locs) for locs in THEORIES[:nthys]]
+    sp_locs_lst = [list(locs) for locs in THEORIES[:nsps]]
+    rid = _identifier('r', rng)
+    cnf_locs_lst = [[rid, _identifier('c', rng)] for _ in range(ncnfs)]
+
+    tree = Tree(prefix, spc_locs_lst, thy_locs_lst, cnf_locs_lst,
+                sp_locs_lst)
+    samples = sample_values(seed=seed)
+    sp_samples = single_point_sample_values()
+
+    spc_fs = fs.species(prefix)
+    spc_fs[-1].create_all(spc_locs_lst)
+    for spc_locs in spc_locs_lst:
+        thy_fs = fs.theory(spc_fs[-1].path(spc_locs))
+        thy_fs[-1].create_all(thy_locs_lst)
+        for thy_locs in thy_locs_lst:
+            cnf_fs = fs.conformer(thy_fs[-1].path(thy_locs))
+            cnf_fs[-1].create_all(cnf_locs_lst)
+            for cnf_locs in cnf_locs_lst:
+                for name, val in samples.items():
+                    getattr(cnf_fs[-1].file, name).write(val, cnf_locs)
+
+                sp_fs = fs.single_point(cnf_fs[-1].path(cnf_locs))
+                sp_fs[-1].create_all(sp_locs_lst)
+                for sp_locs in sp_locs_lst:
+                    for name, val in sp_samples.items():
+                        getattr(sp_fs[-1].file, name).write(val, sp_locs)
+
+    return tree
+
+
+def alkane_inchi(nc):
+    """ the standard InChI of a linear alkane
+
+    :param nc: the number of carbons
+    :type nc: int
+    :rtype: str
+    """
+    if nc == 1:
+        return 'InChI=1S/CH4/h1H4'
+    if nc == 2:
+        return 'InChI=1S/C2H6/c1-2/h1-2H3'
+
+    # The terminal carbons are numbered 1 and 2, so the chain runs up the odd
+    # numbers from one end and down the even numbers to the other
+    chain = (list(range(1, nc+1, 2)) + list(range(2, nc+1, 2))[::-1])
+    conn = '-'.join(map(str, chain))
+    hyd = '3H2' if nc == 3 else f'3-{nc}H2'
+    return f'InChI=1S/C{nc}H{2*nc+2}/c{conn}/h{hyd},1-2H3'
+
+
+def sample_values(seed=0):
+    """ sample values for each file in the conformer leaf layer
+
+    :param seed: seed for the values
+    :type seed: int
+    :returns: values by file attribute name
+    :rtype: dict[str: object]
+    """
+    rng = numpy.random.default_rng(seed)
+    natms = len(SYMBOLS)
+    nfreqs = 3 * natms - 6
+    geo = tuple(zip(SYMBOLS, COORDS))
+    inf_obj = autofile.schema.info_objects.run(
+        job='optimization', prog='gaussian', version='g16',
+        method='hf', basis='sto-3g', status='succeeded')
+
+    hess = rng.normal(size=(3*natms, 3*natms))
+    xmat = rng.normal(size=(nfreqs, nfreqs))
+    return {
+        'geometry_info': inf_obj,
+        'gradient_info': inf_obj,
+        'hessian_info': inf_obj,
+        'vpt2_info': autofile.schema.info_objects.vpt2(
+            fermi_treatment='default'),
+        'geometry_input': '<geometry input file>\n' * 40,
+        'gradient_input': '<gradient input file>\n' * 40,
+        'hessian_input': '<hessian input file>\n' * 40,
+        'vpt2_input': '<vpt2 input file>\n' * 40,
+        'geometry': geo,
+        'gradient': tuple(map(tuple, rng.normal(size=(natms, 3)))),
+        'hessian': tuple(map(tuple, (hess + hess.T) / 2.)),
+        'harmonic_frequencies': tuple(
+            sorted(rng.uniform(500., 3000., nfreqs))),
+        'anharmonic_frequencies': tuple(
+            sorted(rng.uniform(500., 3000., nfreqs))),
+        'anharmonic_zpve': 0.0441,
+        'anharmonicity_matrix': tuple(map(tuple, (xmat + xmat.T) / 2.)),
+        'vibro_rot_alpha_matrix': tuple(
+            map(tuple, rng.normal(size=(nfreqs, 3)))),
+        'quartic_centrifugal_dist_consts': (
+            ('aaaa', 1.0e-5), ('bbaa', 2.0e-5), ('baba', 3.0e-5),
+            ('bbbb', 4.0e-5)),
+        'cubic_force_constants': rng.normal(size=(nfreqs,) * 3),
+        'quartic_force_constants': rng.normal(size=(nfreqs,) * 4),
+        'dipole_moment': (0.1, 0.2, 0.3),
+        'polarizability': ((1.0, 0.1, 0.2),
+                           (0.1, 2.0, 0.3),
+                           (0.2, 0.3, 3.0)),
+    }
+
+
+def single_point_sample_values():
+    """ sample values for each file in the single-point leaf layer
+
+    :returns: values by file attribute name
+    :rtype: dict[str: object]
+    """
+    return {
+        'info': autofile.schema.info_objects.run(
+            job='energy', prog='molpro', version='2021',
+            method='ccsd(t)', basis='cc-pvtz', status='succeeded'),
+        'input': '<single-point input file>\n' * 40,
+        'energy': -40.51,
+    }
+
+
+def data_file_sample_values():
+    """ sample values for the data files that aren't in the conformer or
+    single-point leaf layers
+
+    (reaction, instability, and torsions files hold automol reaction and
+    torsion objects, which can't be made up without a real reaction, so they
+    are left out)
+
+    :returns: values by `autofile.schema.data_files` factory name
+    :rtype: dict[str: object]
+    """
+    geo = tuple(zip(SYMBOLS, COORDS))
+    vma = (('C', (None, None, None), (None, None, None)),
+           ('H', (0, None, None), ('R1', None, None)),
+           ('H', (0, 1, None), ('R2', 'A2', None)),
+           ('H', (0, 1, 2), ('R3', 'A3', 'D3')),
+           ('H', (0, 1, 2), ('R4', 'A4', 'D4')))
+    zma_vals = ((None, None, None),
+                (2.0590, None, None),
+                (2.0590, 1.9106, None),
+                (2.0590, 1.9106, 2.0944),
+                (2.0590, 1.9106, -2.0944))
+    zma = tuple((symb, key_row, name_row, val_row)
+                for (symb, key_row, name_row), val_row in zip(vma, zma_vals))
+    text = '<program file>\n' * 40
+    return {
+        'output_file': '<output file>\n' * 400,
+        'zmatrix': zma,
+        'vmatrix': vma,
+        'trajectory': [(geo, f'energy: {-40.51 - idx * 1e-4}')
+                       for idx in range(20)],
+        'ring_torsions': {'1-2-3-4-5': {'D5': (-0.5, 0.5),
+                                        'D8': (-1.0, 1.0)}},
+        'lennard_jones_epsilon': 247.9,
+        'lennard_jones_sigma': 3.96,
+        'external_symmetry_number': 12.,
+        'internal_symmetry_number': 3.,
+        'lennard_jones_input': text,
+        'lennard_jones_elstruct': text,
+        'vrctst_tst': text,
+        'vrctst_divsur': text,
+        'vrctst_molpro': text,
+        'vrctst_tml': text,
+        'vrctst_struct': text,
+        'vrctst_pot': text,
+        'vrctst_flux': text,
+    }
+
+
+def _identifier(initial, rng):
+    """ a reproducible ring or conformer id, shaped like a generated one
+    """
+    return initial + base64.urlsafe_b64encode(
+        rng.randbytes(9)).decode('utf-8')
@@ -0,0 +1,53 @@
+""" times a locator-heavy `existing()` scan with and without libyaml
+
+Builds a conformer filesystem with many conformers in a temporary
+directory and reads back all of their locators, first with the libyaml
+loader used by `autofile.info` and then with the pure-python one.
+
+    python scripts/info_yaml_benchmark.py --nconfs 2000 --repeat 3
+"""
+import argparse
+import tempfile
+import timeit
+import yaml
+import autofile
+from autofile import fs
+from autofile.info import _info  # pylint: disable=protected-access
+
+
+def main():
+    """ run the benchmark
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nconfs', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if not yaml.__with_libyaml__:
+        print('PyYAML was built without libyaml; both runs are pure-python')
+
+    loaders = {
+        'libyaml': _info._safe_loader,
+        'pure-python': lambda: yaml.SafeLoader,
+    }
+
+    with tempfile.TemporaryDirectory() as prefix:
+        cnf_fs = fs.conformer(prefix)
+        rid = autofile.schema.generate_new_ring_id()
+        cnf_fs[1].create([rid])
+        for _ in range(args.nconfs):
+            cid = autofile.schema.generate_new_conformer_id()
+            cnf_fs[-1].create([rid, cid])
+
+        for label, loader in loaders.items():
+            _info._safe_loader = loader
+            times = timeit.repeat(lambda: cnf_fs[-1].existing([rid]),
+                                  number=1, repeat=args.repeat)
+            print(f'{label:>12}: {min(times):8.3f} s '
+                  f'for {args.nconfs} locators')
+
+        _info._safe_loader = loaders['libyaml']
+
+
+if __name__ == '__main__':
+    main()